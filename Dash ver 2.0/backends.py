@@ -0,0 +1,516 @@
+import ast
+import importlib.util
+import os
+import shutil
+import tempfile
+import threading
+import logging
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from dataset_cache import cache_key
+from eda_stats import TOP_K, assemble_insights, column_groups
+from filter_compiler import (
+    BACKTICK_PATTERN, PLACEHOLDER, AndNode, BoolColumnNode, CategoryNode, CompiledFilter, FilterError,
+    NotNode, NumexprNode, OrNode, PandasEvalNode, Predicate, RangeNode, compile_filter
+)
+from filter_engine import FilterEngine
+from preagg import MAX_GROUPS, Rollups, measure_columns, plan_rollups, rollup_candidates, rollup_name
+
+# duckdb is optional (without it only the in-memory pandas path is available) and
+# imported on first use, so the GUI does not pay for it at startup
+duckdb = None
+
+logger = logging.getLogger(__name__)
+
+TABLE = "data"
+# Row number column of ROWS_VIEW, the table plus each row's position in the file
+ROW_ID = "__dg_row__"
+ROWS_VIEW = "data_rows"
+PAGE_ROWS = 1_000
+SAMPLE_ROWS = 1_000_000
+MAX_MATRIX_COLUMNS = 30
+PARQUET_EXTENSIONS = (".parquet", ".pq")
+SQL_BINOPS = {ast.Add: "+", ast.Sub: "-", ast.Mult: "*", ast.Div: "/", ast.Mod: "%", ast.FloorDiv: "//"}
+SQL_CMPOPS = {ast.Gt: ">", ast.GtE: ">=", ast.Lt: "<", ast.LtE: "<=", ast.Eq: "=", ast.NotEq: "<>"}
+
+
+def available() -> bool:
+    return importlib.util.find_spec("duckdb") is not None
+
+
+def _import_duckdb():
+    global duckdb
+    if duckdb is None:
+        try:
+            import duckdb as module
+        except ImportError as e:
+            raise RuntimeError("The DuckDB backend needs the duckdb package (pip install duckdb)") from e
+        duckdb = module
+    return duckdb
+
+
+def quote(name: Any) -> str:
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def sql_literal(value: Any) -> str:
+    if value is None:
+        return "NULL"
+    if isinstance(value, (bool, np.bool_)):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, (int, float, np.integer, np.floating)):
+        if np.isnan(value):
+            return "'NaN'::DOUBLE"
+        return repr(value.item() if isinstance(value, np.generic) else value)
+    if isinstance(value, (np.datetime64, pd.Timestamp)):
+        return f"TIMESTAMP '{pd.Timestamp(value).isoformat(sep=' ')}'"
+    if isinstance(value, str):
+        return "'" + value.replace("'", "''") + "'"
+    raise FilterError(f"Unsupported literal in filter: {value!r}")
+
+
+# ────────────── Filter translation ──────────────
+
+class _ExpressionTranslator:
+    """
+    Python expression AST (as written in the filter box) → SQL. Column names
+    arrive as placeholders or bare names; anything that is not a column,
+    literal, comparison, boolean or arithmetic operator is rejected.
+    """
+
+    def __init__(self, columns: Dict[str, Any]):
+        self.columns = columns
+
+    def __call__(self, node: ast.AST) -> str:
+        if isinstance(node, ast.Expression):
+            return self(node.body)
+        if isinstance(node, ast.Name):
+            if node.id not in self.columns:
+                raise FilterError(f"Unknown column in filter: '{node.id}'")
+            return quote(self.columns[node.id])
+        if isinstance(node, ast.Constant):
+            return sql_literal(node.value)
+        if isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+            return "(" + ", ".join(self(elt) for elt in node.elts) + ")"
+        if isinstance(node, ast.BoolOp):
+            joiner = " AND " if isinstance(node.op, ast.And) else " OR "
+            return "(" + joiner.join(self(value) for value in node.values) + ")"
+        if isinstance(node, ast.UnaryOp):
+            if isinstance(node.op, (ast.Not, ast.Invert)):
+                return f"(NOT {self(node.operand)})"
+            if isinstance(node.op, ast.USub):
+                return f"(-{self(node.operand)})"
+            if isinstance(node.op, ast.UAdd):
+                return self(node.operand)
+        if isinstance(node, ast.BinOp):
+            if isinstance(node.op, (ast.BitAnd, ast.BitOr)):
+                return f"({self(node.left)} {'AND' if isinstance(node.op, ast.BitAnd) else 'OR'} {self(node.right)})"
+            if isinstance(node.op, ast.Pow):
+                return f"power({self(node.left)}, {self(node.right)})"
+            if type(node.op) in SQL_BINOPS:
+                return f"({self(node.left)} {SQL_BINOPS[type(node.op)]} {self(node.right)})"
+        if isinstance(node, ast.Compare):
+            split = _split_bitwise(node)
+            if split is not None:
+                return self(split)
+            parts = []
+            operands = [node.left] + node.comparators
+            for op, left, right in zip(node.ops, operands, operands[1:]):
+                if isinstance(op, (ast.In, ast.NotIn)):
+                    keyword = "IN" if isinstance(op, ast.In) else "NOT IN"
+                    target = right if isinstance(right, (ast.List, ast.Tuple, ast.Set)) else ast.Tuple(elts=[right])
+                    parts.append(f"{self(left)} {keyword} {self(target)}")
+                elif isinstance(op, ast.NotEq):
+                    # A missing value differs from everything in pandas, itself included (`col != col`)
+                    parts.append(f"COALESCE({self(left)} <> {self(right)}, TRUE)")
+                elif type(op) in SQL_CMPOPS:
+                    parts.append(f"{self(left)} {SQL_CMPOPS[type(op)]} {self(right)}")
+                else:
+                    break
+            else:
+                return "(" + " AND ".join(parts) + ")"
+        if isinstance(node, ast.Call):
+            return self.call(node)
+        raise FilterError(f"Not supported by the DuckDB backend: {ast.unparse(node)}")
+
+    def call(self, node: ast.Call) -> str:
+        # col.isna(), col.between(a, b), col.str.contains(...) and friends
+        func = node.func
+        if not isinstance(func, ast.Attribute):
+            raise FilterError(f"Not supported by the DuckDB backend: {ast.unparse(node)}")
+        target, method = func.value, func.attr
+        accessor = isinstance(target, ast.Attribute) and target.attr == "str"
+        column = self(target.value if accessor else target)
+        args = [self(arg) for arg in node.args]
+        options = {kw.arg: kw.value.value for kw in node.keywords if isinstance(kw.value, ast.Constant)}
+        if not accessor and method in ("isna", "isnull") and not args:
+            return f"({column} IS NULL)"
+        if not accessor and method in ("notna", "notnull") and not args:
+            return f"({column} IS NOT NULL)"
+        if not accessor and method == "isin" and len(node.args) == 1 and isinstance(node.args[0], (ast.List, ast.Tuple, ast.Set)):
+            return f"({column} IN {args[0]})" if node.args[0].elts else "FALSE"
+        if not accessor and method == "between" and len(args) == 2:
+            return f"({column} BETWEEN {args[0]} AND {args[1]})"
+        if accessor and method == "contains" and len(args) == 1:
+            if options.get("regex", True):
+                flags = ", 'i'" if options.get("case", True) is False else ""
+                return f"regexp_matches({column}, {args[0]}{flags})"
+            if options.get("case", True) is False:
+                return f"contains(lower({column}), lower({args[0]}))"
+            return f"contains({column}, {args[0]})"
+        if accessor and method in ("startswith", "endswith") and len(args) == 1:
+            return f"{'starts' if method == 'startswith' else 'ends'}_with({column}, {args[0]})"
+        raise FilterError(f"Not supported by the DuckDB backend: {ast.unparse(node)}")
+
+
+def _split_bitwise(node: ast.Compare) -> Optional[ast.AST]:
+    """
+    pandas gives & and | lower precedence than comparisons, Python higher:
+    `a > 1 | b < 2` parses as `a > (1 | b) < 2`. Regroup such a chain into
+    `(a > 1) | (b < 2)`, or return None when there is nothing to regroup.
+    """
+    operands = [node.left] + node.comparators
+    for i, operand in enumerate(operands):
+        if isinstance(operand, ast.BinOp) and isinstance(operand.op, (ast.BitAnd, ast.BitOr)):
+            break
+    else:
+        return None
+
+    def chain(items: List[ast.AST], ops: List[ast.cmpop]) -> ast.AST:
+        return ast.Compare(left=items[0], ops=ops, comparators=items[1:]) if ops else items[0]
+
+    left = chain(operands[:i] + [operand.left], node.ops[:i])
+    right = chain([operand.right] + operands[i + 1:], node.ops[i:])
+    return ast.BinOp(left=left, op=operand.op, right=right)
+
+
+def _parse_filter_text(text: str) -> Tuple[ast.AST, Dict[str, Any]]:
+    # Same backtick handling as compile_filter
+    placeholders: Dict[str, Any] = {}
+
+    def substitute(match):
+        name = PLACEHOLDER.format(len(placeholders))
+        placeholders[name] = match.group(1)
+        return name
+
+    return ast.parse(BACKTICK_PATTERN.sub(substitute, text), mode="eval"), placeholders
+
+
+def predicate_sql(node: Predicate, columns: Sequence[Any]) -> str:
+    """
+    SQL for a compiled filter tree. Every leaf is wrapped in COALESCE(…, FALSE)
+    so missing values never match, and negations behave like the pandas masks.
+    """
+    if isinstance(node, OrNode):
+        return "(" + " OR ".join(predicate_sql(child, columns) for child in node.children) + ")"
+    if isinstance(node, AndNode):
+        return "(" + " AND ".join(predicate_sql(child, columns) for child in node.children) + ")"
+    if isinstance(node, NotNode):
+        return f"(NOT {predicate_sql(node.child, columns)})"
+    if isinstance(node, RangeNode):
+        column = quote(node.column)
+        bounds = []
+        if node.lo is not None:
+            bounds.append(f"{column} {'>=' if node.lo_inclusive else '>'} {sql_literal(node.lo)}")
+        if node.hi is not None:
+            bounds.append(f"{column} {'<=' if node.hi_inclusive else '<'} {sql_literal(node.hi)}")
+        condition = " AND ".join(bounds) or f"{column} IS NOT NULL"
+    elif isinstance(node, CategoryNode):  # also IsinNode
+        if not node.values:
+            return "FALSE"
+        condition = f"{quote(node.column)} IN ({', '.join(sql_literal(v) for v in node.values)})"
+    elif isinstance(node, BoolColumnNode):
+        condition = quote(node.column)
+    elif isinstance(node, NumexprNode):
+        condition = _ExpressionTranslator(node.columns)(ast.parse(node.source, mode="eval"))
+    elif isinstance(node, PandasEvalNode):
+        tree, placeholders = _parse_filter_text(node.source)
+        names = {str(col): col for col in columns}
+        names.update(placeholders)
+        condition = _ExpressionTranslator(names)(tree)
+    else:
+        raise FilterError(f"Not supported by the DuckDB backend: {node}")
+    return f"COALESCE({condition}, FALSE)"
+
+
+# ────────────── Backend ──────────────
+
+class DuckDBBackend:
+    """
+    A CSV or Parquet file queried in place by DuckDB instead of loaded into pandas.
+
+    Parquet files are scanned directly, so filters and projections are pushed
+    into the file reader. CSVs are imported once into a temporary DuckDB
+    database on disk (columnar and compressed, spilled rather than held in
+    RAM). Filters run as SQL WHERE clauses, statistics as aggregate queries on
+    all cores, and only the rows a caller asks for become a DataFrame.
+    """
+
+    def __init__(self, path: str, threads: int = 0, memory_limit_mb: float = 0, temp_dir: Optional[str] = None):
+        _import_duckdb()
+        self.path = path
+        self.source_key = cache_key(path)
+        self._work_dir = tempfile.mkdtemp(prefix="dashgraph-duckdb-", dir=temp_dir)
+        self._conn = duckdb.connect(os.path.join(self._work_dir, "data.duckdb"))
+        self._conn.execute("SET TimeZone = 'UTC'")
+        self._conn.execute(f"SET temp_directory = {sql_literal(self._work_dir)}")
+        if threads:
+            self._conn.execute(f"SET threads = {int(threads)}")
+        if memory_limit_mb:
+            self._conn.execute(f"SET memory_limit = '{int(memory_limit_mb)}MB'")
+        self._local = threading.local()
+        self._count_cache: Dict[str, int] = {}
+        self._rollup_cache: Dict[Tuple[str, int], Rollups] = {}
+
+        if path.lower().endswith(PARQUET_EXTENSIONS):
+            self._conn.execute(f"CREATE VIEW {TABLE} AS SELECT * FROM read_parquet({sql_literal(path)})")
+            self._conn.execute(
+                f"CREATE VIEW {ROWS_VIEW} AS SELECT * EXCLUDE (file_row_number), file_row_number AS {ROW_ID}"
+                f" FROM read_parquet({sql_literal(path)}, file_row_number = true)"
+            )
+        else:
+            # Insertion order is preserved, so rowid is the row's position in the CSV
+            self._conn.execute(f"CREATE TABLE {TABLE} AS SELECT * FROM read_csv({sql_literal(path)}, sample_size = 100000)")
+            self._conn.execute(f"CREATE VIEW {ROWS_VIEW} AS SELECT *, rowid AS {ROW_ID} FROM {TABLE}")
+        self.schema: pd.DataFrame = self._cursor().execute(f"SELECT * FROM {TABLE} LIMIT 0").df()
+
+    def _cursor(self):
+        # DuckDB connections are not shared across threads; each thread gets its own cursor
+        cursor = getattr(self._local, "cursor", None)
+        if cursor is None:
+            cursor = self._local.cursor = self._conn.cursor()
+        return cursor
+
+    def query(self, sql: str) -> pd.DataFrame:
+        return self._cursor().execute(sql).df()
+
+    @property
+    def dtypes(self) -> pd.Series:
+        return self.schema.dtypes
+
+    @property
+    def columns(self) -> List[Any]:
+        return list(self.schema.columns)
+
+    @staticmethod
+    def _where(where: Optional[str]) -> str:
+        return f" WHERE {where}" if where else ""
+
+    def count(self, where: Optional[str] = None) -> int:
+        key = where or ""
+        if key not in self._count_cache:
+            self._count_cache[key] = self._cursor().execute(f"SELECT count(*) FROM {TABLE}{self._where(where)}").fetchone()[0]
+        return self._count_cache[key]
+
+    def page(self, offset: int, limit: int = PAGE_ROWS, where: Optional[str] = None,
+             order_by: Optional[Tuple[Any, bool]] = None) -> pd.DataFrame:
+        """
+        `limit` rows starting at `offset` of the filtered (and optionally sorted) table.
+        """
+        order = ""
+        if order_by is not None:
+            column, ascending = order_by
+            order = f" ORDER BY {quote(column)} {'ASC' if ascending else 'DESC'} NULLS LAST"
+        return self.query(f"SELECT * FROM {TABLE}{self._where(where)}{order} LIMIT {int(limit)} OFFSET {int(offset)}")
+
+    def sample(self, limit: int = SAMPLE_ROWS, where: Optional[str] = None) -> pd.DataFrame:
+        """
+        The filtered rows as a DataFrame: all of them when at most `limit`, else a reservoir sample.
+        """
+        if self.count(where) <= limit:
+            return self.query(f"SELECT * FROM {TABLE}{self._where(where)}")
+        return self.query(
+            f"SELECT * FROM (SELECT * FROM {TABLE}{self._where(where)}) USING SAMPLE reservoir({int(limit)} ROWS) REPEATABLE (0)"
+        )
+
+    # ────────────── Graph rollups ──────────────
+
+    def rollups(self, where: Optional[str] = None, max_groups: int = MAX_GROUPS) -> Rollups:
+        """
+        The rollups of preagg.compute_rollups over every filtered row (not the
+        graph's sample), as GROUP BY queries. Cached per filter.
+        """
+        key = (where or "", max_groups)
+        if key in self._rollup_cache:
+            return self._rollup_cache[key]
+        candidates, datetimes = rollup_candidates(self.dtypes)
+        selects = [f"count(DISTINCT {quote(col)})" for col in candidates]
+        # As epoch seconds: fetching TIMESTAMPTZ values directly needs pytz
+        selects += [f"epoch({fn}({quote(col)}))" for col in datetimes for fn in ("min", "max")]
+        row = self._cursor().execute(f"SELECT {', '.join(selects)} FROM {TABLE}{self._where(where)}").fetchone() if selects else ()
+        distinct = dict(zip(candidates, row))
+        bounds = pd.to_datetime(pd.Series(row[len(candidates):], dtype="float64"), unit="s")
+        ranges = {col: (bounds[2 * i], bounds[2 * i + 1]) for i, col in enumerate(datetimes)}
+        plan = plan_rollups(self.dtypes, distinct, ranges, max_groups)
+
+        measures = ["count(*)"]
+        measures += [f"{fn}({quote(col)}{'::DOUBLE' if fn == 'avg' else ''})" for col in plan.measures for fn in ("avg", "sum")]
+        columns = ["count"] + measure_columns(plan.measures)
+        keys = [(rollup_name(col), col, quote(col)) for col in plan.groups]
+        keys += [(rollup_name(col, bucket), col, f"date_trunc('{unit}', {quote(col)})") for col, bucket, _, unit in plan.times]
+
+        rollups: Rollups = {}
+        for name, col, expr in keys:
+            predicate = " AND ".join(filter(None, [where, f"{quote(col)} IS NOT NULL"]))
+            frame = self.query(
+                f"SELECT {expr} AS key, {', '.join(measures)} FROM {TABLE}{self._where(predicate)} GROUP BY 1 ORDER BY 1"
+            )
+            frame.columns = ["key"] + columns
+            rollups[name] = frame.set_index("key").rename_axis(col)
+        self._rollup_cache[key] = rollups
+        return rollups
+
+    # ────────────── EDA aggregates ──────────────
+
+    def column_stats(self, where: Optional[str] = None) -> Dict[Any, Dict[str, Any]]:
+        """
+        Per-column statistics in the format of eda_stats.compute_column_stats,
+        computed by one aggregate query plus a top-k query per text column.
+        Top-k ties are ordered by first appearance, like value_counts on text;
+        where the pandas loader made a column categorical, pandas orders its ties
+        by category instead.
+        """
+        groups = column_groups(self.dtypes)
+        numeric = groups["numerical"]
+        categorical = groups["categorical"]
+        selects = ["count(*) AS rows"]
+        for i, col in enumerate(self.columns):
+            selects += [f"count({quote(col)}) AS n{i}", f"count(DISTINCT {quote(col)}) AS d{i}"]
+            if col in numeric:
+                value = f"{quote(col)}::DOUBLE"
+                selects += [
+                    f"avg({value}) AS mean{i}", f"stddev_samp({value}) AS std{i}", f"min({value}) AS min{i}",
+                    f"max({value}) AS max{i}", f"quantile_cont({value}, [0.25, 0.5, 0.75]) AS q{i}",
+                    f"skewness({value}) AS skew{i}",
+                ]
+        row = self._cursor().execute(f"SELECT {', '.join(selects)} FROM {TABLE}{self._where(where)}").fetchone()
+        values = dict(zip([d[0] for d in self._cursor().description], row))
+        rows = values["rows"]
+
+        stats: Dict[Any, Dict[str, Any]] = {}
+        for i, col in enumerate(self.columns):
+            count = values[f"n{i}"]
+            entry = {"count": float(count), "nulls": float(rows - count), "distinct": int(values[f"d{i}"])}
+            if col in numeric:
+                quartiles = values[f"q{i}"] or [np.nan] * 3
+                entry.update(
+                    kind="numeric",
+                    mean=_float(values[f"mean{i}"]), std=_float(values[f"std{i}"]),
+                    min=_float(values[f"min{i}"]), max=_float(values[f"max{i}"]),
+                    skew=_float(values[f"skew{i}"]) if count >= 3 else np.nan,
+                    **{"25%": _float(quartiles[0]), "50%": _float(quartiles[1]), "75%": _float(quartiles[2])},
+                )
+                if count >= 3 and entry["std"] == 0:
+                    entry["skew"] = 0.0
+            elif col in categorical:
+                # Ties go to the value seen first, as with value_counts on a text column
+                top = self.query(
+                    f"SELECT {quote(col)} AS value, count(*) AS count FROM {ROWS_VIEW}"
+                    f"{self._where(' AND '.join(filter(None, [where, f'{quote(col)} IS NOT NULL'])))}"
+                    f" GROUP BY 1 ORDER BY 2 DESC, min({ROW_ID}) LIMIT {TOP_K}"
+                )
+                entry.update(kind="categorical", top=pd.Series(
+                    top["count"].to_numpy(), index=pd.Index(top["value"], name=col), name="count"
+                ))
+            else:
+                entry["kind"] = "other"
+            stats[col] = entry
+        return stats
+
+    def _pairwise_correlation(self, expressions: Dict[Any, str], where: Optional[str]) -> pd.DataFrame:
+        labels = list(expressions)
+        matrix = np.eye(len(labels))
+        pairs = [(a, b) for a in range(len(labels)) for b in range(a + 1, len(labels))]
+        if pairs:
+            selects = [f"corr({expressions[labels[a]]}, {expressions[labels[b]]})" for a, b in pairs]
+            row = self._cursor().execute(f"SELECT {', '.join(selects)} FROM {TABLE}{self._where(where)}").fetchone()
+            for (a, b), value in zip(pairs, row):
+                matrix[a, b] = matrix[b, a] = _float(value)
+        return pd.DataFrame(matrix, index=labels, columns=labels)
+
+    def insights(self, where: Optional[str] = None, max_columns: int = MAX_MATRIX_COLUMNS) -> Dict[str, Any]:
+        """
+        The insights dict of compute_eda_insights, plus "correlation" and
+        "nullity_correlation" frames over at most `max_columns` columns (highest
+        variance, and nullity closest to half, as save_eda_plots picks them).
+        """
+        from eda_plots import top_columns
+
+        stats = self.column_stats(where)
+        rows = self.count(where)
+        insights = assemble_insights((rows, len(self.columns)), self.dtypes, stats)
+
+        numeric = insights["types"]["numerical"]
+        variance = insights["describe"]["std"] ** 2 if numeric else pd.Series(dtype=float)
+        keep = top_columns(variance, max_columns)
+        insights["correlation"] = self._pairwise_correlation({col: f"{quote(col)}::DOUBLE" for col in keep}, where)
+
+        missing = pd.Series({col: stats[col]["nulls"] / rows for col in self.columns if rows and 0 < stats[col]["nulls"] < rows}, dtype=float)
+        keep = top_columns(missing * (1 - missing), max_columns)
+        insights["nullity_correlation"] = self._pairwise_correlation(
+            {col: f"({quote(col)} IS NULL)::DOUBLE" for col in keep}, where
+        )
+        return insights
+
+    def close(self) -> None:
+        try:
+            self._conn.close()
+        finally:
+            shutil.rmtree(self._work_dir, ignore_errors=True)
+
+
+def _float(value: Any) -> float:
+    return np.nan if value is None else float(value)
+
+
+# ────────────── Filters ──────────────
+
+class SQLFilterEngine(FilterEngine):
+    """
+    FilterEngine over a DuckDBBackend: filters become WHERE predicates instead
+    of masks, with the same history (undo, redo, reorder) as the pandas engine.
+    """
+
+    def __init__(self, backend: DuckDBBackend, sample_rows: int = SAMPLE_ROWS):
+        super().__init__(backend.schema)
+        self.backend = backend
+        self.sample_rows = sample_rows
+
+    def mask_for(self, expr: Union[str, CompiledFilter]) -> str:
+        """
+        WHERE predicate of one filter (cached by its canonical text like the masks).
+        """
+        compiled = expr if isinstance(expr, CompiledFilter) else self.compile(expr)
+        predicate = self._cached_mask(compiled.text)
+        if predicate is None:
+            predicate = predicate_sql(compiled.root, self.backend.columns)
+            self._store_mask(compiled.text, predicate)
+        return predicate
+
+    def where(self) -> Optional[str]:
+        """
+        Combined predicate of all active filters, or None when unfiltered.
+        """
+        if not self._filters:
+            return None
+        return " AND ".join(self.mask_for(expr) for expr in self._filters)
+
+    def mask(self) -> np.ndarray:
+        raise TypeError("DuckDB filters have no in-memory mask; use where() or row_count()")
+
+    def positions(self) -> None:
+        return None
+
+    def row_count(self) -> int:
+        return self.backend.count(self.where())
+
+    def frame(self) -> pd.DataFrame:
+        """
+        The filtered rows, or a sample of `sample_rows` of them, as a DataFrame.
+        """
+        if self._frame is None:
+            self._frame = self.backend.sample(self.sample_rows, self.where())
+        return self._frame
@@ -0,0 +1,122 @@
+"""
+Dataset generators for the benchmarks: synthetic frames with a chosen size,
+dtype mix, null rate and cardinality, and row-scaled copies of the bundled CSVs.
+"""
+
+import os
+from dataclasses import asdict, dataclass, field
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+BUNDLED = {
+    "imdb": os.path.join(REPO_DIR, "IMDB-Movie-Data.csv"),
+    "boston": os.path.join(REPO_DIR, "boston_housing.csv"),
+}
+# Column kinds as they come out of load_csv_file
+KINDS = ("numeric", "integer", "text", "category", "bool", "datetime")
+DEFAULT_MIX = {"numeric": 4, "integer": 2, "text": 1, "category": 2, "bool": 1, "datetime": 1}
+
+
+@dataclass
+class DatasetSpec:
+    source: str = "synthetic"  # "synthetic" or a key of BUNDLED
+    rows: int = 100_000
+    columns: int = 20
+    null_rate: float = 0.05
+    cardinality: int = 1_000
+    mix: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_MIX))
+    seed: int = 0
+
+    @property
+    def key(self) -> str:
+        """Identifies comparable runs in a baseline file."""
+        if self.source != "synthetic":
+            return f"{self.source}-r{self.rows}"
+        mix = ",".join(f"{kind}={self.mix[kind]:g}" for kind in KINDS if self.mix.get(kind))
+        return f"synthetic-r{self.rows}-c{self.columns}-n{self.null_rate:g}-k{self.cardinality}-{mix}-s{self.seed}"
+
+    def as_dict(self) -> Dict:
+        return asdict(self)
+
+
+def parse_mix(text: str) -> Dict[str, float]:
+    """
+    "numeric=4,text=1" -> {"numeric": 4.0, "text": 1.0}
+    """
+    mix = {}
+    for part in filter(None, (p.strip() for p in text.split(","))):
+        kind, _, weight = part.partition("=")
+        if kind not in KINDS:
+            raise ValueError(f"Unknown column kind {kind!r}; expected one of {', '.join(KINDS)}")
+        mix[kind] = float(weight or 1)
+    return mix
+
+
+def _column_kinds(spec: DatasetSpec) -> list:
+    # Deterministic split of the column count by weight, largest remainders first
+    weights = np.array([spec.mix.get(kind, 0) for kind in KINDS], dtype="float64")
+    if weights.sum() <= 0:
+        raise ValueError("The dtype mix needs at least one positive weight")
+    share = weights / weights.sum() * spec.columns
+    counts = np.floor(share).astype(int)
+    for i in np.argsort(-(share - counts))[:spec.columns - counts.sum()]:
+        counts[i] += 1
+    return [kind for kind, count in zip(KINDS, counts) for _ in range(count)]
+
+
+def _column(kind: str, rows: int, cardinality: int, rng: np.random.Generator) -> pd.Series:
+    if kind == "numeric":
+        return pd.Series(rng.lognormal(3, 1, rows) * rng.choice([-1, 1], rows, p=[0.1, 0.9]))
+    if kind == "integer":
+        return pd.Series(rng.integers(0, max(2, cardinality * 10), rows))
+    if kind == "text":
+        vocabulary = np.array([f"item_{i:07d}_{rng.integers(1e9):x}" for i in range(max(1, cardinality))])
+        return pd.Series(vocabulary[rng.zipf(1.3, rows) % len(vocabulary)])
+    if kind == "category":
+        levels = np.array([f"level_{i}" for i in range(max(1, min(cardinality, 50)))])
+        return pd.Series(levels[rng.integers(0, len(levels), rows)])
+    if kind == "bool":
+        return pd.Series(np.where(rng.random(rows) < 0.3, "TRUE", "FALSE"))
+    start = np.datetime64("2015-01-01")
+    return pd.Series((start + rng.integers(0, 3650, rows).astype("timedelta64[D]")).astype(str))
+
+
+def synthetic_frame(spec: DatasetSpec) -> pd.DataFrame:
+    """
+    Raw (string/number) frame as it would sit in a CSV, before type inference.
+    """
+    rng = np.random.default_rng(spec.seed)
+    data = {}
+    for i, kind in enumerate(_column_kinds(spec)):
+        column = _column(kind, spec.rows, spec.cardinality, rng).astype(object)
+        if spec.null_rate > 0:
+            column[rng.random(spec.rows) < spec.null_rate] = None
+        data[f"{kind}_{i}"] = column
+    return pd.DataFrame(data)
+
+
+def scaled_frame(spec: DatasetSpec) -> pd.DataFrame:
+    """
+    A bundled CSV resampled to `spec.rows` rows. Numeric values get a small
+    multiplicative jitter so scaled copies keep a realistic number of distinct values.
+    """
+    source = pd.read_csv(BUNDLED[spec.source])
+    rng = np.random.default_rng(spec.seed)
+    df = source.iloc[rng.integers(0, len(source), spec.rows)].reset_index(drop=True)
+    for col in df.columns:
+        if pd.api.types.is_float_dtype(df[col].dtype):
+            df[col] = (df[col] * rng.normal(1, 0.01, len(df))).round(4)
+    return df
+
+
+def write_dataset(spec: DatasetSpec, directory: str) -> str:
+    """
+    Generate the dataset for `spec` as a CSV in `directory` and return its path.
+    """
+    df = synthetic_frame(spec) if spec.source == "synthetic" else scaled_frame(spec)
+    path = os.path.join(directory, f"{spec.source}_{spec.rows}.csv")
+    df.to_csv(path, index=False)
+    return path
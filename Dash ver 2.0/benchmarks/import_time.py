@@ -0,0 +1,96 @@
+"""
+Startup import-time benchmark.
+
+Imports what main.py needs before the splash screen, and then `ui`, each in a
+fresh interpreter under `python -X importtime`, and fails when an import
+exceeds its budget or when `ui` pulls in a module that should only load on
+first use (matplotlib.pyplot, seaborn, the EDA modules, the OpenAI client,
+DuckDB).
+
+    python benchmarks/import_time.py [--repeat 5] [--top 15]
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (label, statement, budget in ms)
+PHASES = [
+    ("splash", "import PyQt5.QtWidgets, PyQt5.QtGui", 300),
+    ("ui", "import ui", 1000),
+]
+
+# Modules `import ui` must not load; each costs hundreds of ms and is only needed on first use
+DEFERRED = [
+    "matplotlib.pyplot", "seaborn", "scipy", "openai", "httpx", "duckdb",
+    "eda", "eda_blocks", "eda_plots", "eda_report", "eda_sketches", "gpt_handler",
+]
+
+LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|(\s+)(\S+)$")
+
+
+def measure(statement: str) -> Tuple[float, Dict[str, int]]:
+    """
+    Total import time in ms and the cumulative microseconds of every imported module.
+    """
+    env = dict(os.environ)
+    # Startup must not depend on credentials being present
+    for key in ("AZURE_API_KEY", "AZURE_ENDPOINT", "AZURE_DEPLOYMENT"):
+        env.pop(key, None)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=APP_DIR, env=env, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"`{statement}` failed:\n{result.stderr[-2000:]}")
+
+    modules: Dict[str, int] = {}
+    total = 0
+    for line in result.stderr.splitlines():
+        match = LINE.match(line)
+        if not match:
+            continue
+        cumulative, indent, name = int(match.group(2)), match.group(3), match.group(4)
+        modules[name] = cumulative
+        if len(indent) == 1:  # top-level import of the statement
+            total += cumulative
+    return total / 1000, modules
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="runs per phase; the fastest counts")
+    parser.add_argument("--top", type=int, default=15, help="slowest modules to list per phase")
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply every budget (slow machines, CI)")
+    args = parser.parse_args(argv)
+
+    failures = []
+    for label, statement, budget in PHASES:
+        runs = [measure(statement) for _ in range(max(1, args.repeat))]
+        total, modules = min(runs, key=lambda run: run[0])
+        budget *= args.scale
+        status = "ok" if total <= budget else "OVER BUDGET"
+        print(f"{label:<8} {total:8.1f} ms  (budget {budget:.0f} ms)  {status}")
+        for name, micros in sorted(modules.items(), key=lambda item: -item[1])[:args.top]:
+            print(f"    {micros / 1000:8.1f} ms  {name}")
+        if total > budget:
+            failures.append(f"{label} took {total:.0f} ms (budget {budget:.0f} ms)")
+        if label == "ui":
+            eager = [name for name in DEFERRED if name in modules]
+            if eager:
+                failures.append(f"`import ui` loads deferred modules: {', '.join(eager)}")
+
+    for failure in failures:
+        print(f"❌ {failure}")
+    if not failures:
+        print("✅ Startup imports within budget")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
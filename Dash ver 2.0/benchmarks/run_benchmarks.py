@@ -0,0 +1,281 @@
+"""
+Stage benchmarks: load, display, filter, EDA statistics, EDA plots and the HTML report.
+
+Each stage is timed over several runs (median counts) and run once more under
+tracemalloc for its peak Python/numpy allocation. The LLM is the local stub, so
+no network is needed. Results are written as JSON and compared with a stored
+baseline; a stage slower or larger than the baseline by more than the tolerance
+fails the run.
+
+    python benchmarks/run_benchmarks.py --save-baseline          # record a baseline
+    python benchmarks/run_benchmarks.py                          # compare against it
+    python benchmarks/run_benchmarks.py --dataset imdb --rows 200000
+    python benchmarks/run_benchmarks.py --rows 1000000 --columns 40 --null-rate 0.2 --cardinality 50000
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, APP_DIR)
+
+# Stub LLM without caching, so every report run goes through the client
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ["DASH_LLM_BACKEND"] = "stub"
+os.environ["DASH_LLM_CACHE_MAX_ENTRIES"] = "0"
+
+import numpy as np
+import pandas as pd
+
+from datasets import BUNDLED, DatasetSpec, parse_mix, write_dataset
+
+STAGES = ("load", "display", "filter", "eda", "plots", "report")
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, "baseline.json")
+DEFAULT_OUTPUT = os.path.join(BENCH_DIR, "results", "latest.json")
+
+
+# ────────────── Stages ──────────────
+
+def filter_expressions(df: pd.DataFrame) -> List[str]:
+    """
+    A few representative filters for whatever columns the frame has.
+    """
+    expressions = []
+    numeric = df.select_dtypes(include="number").columns
+    if len(numeric):
+        col = numeric[0]
+        expressions.append(f"`{col}` > {float(df[col].median())!r}")
+        if len(numeric) > 1:
+            other = numeric[1]
+            expressions.append(f"`{col}` > {float(df[col].quantile(0.25))!r} and `{other}` < {float(df[other].quantile(0.75))!r}")
+    for col in df.columns:
+        if isinstance(df[col].dtype, pd.CategoricalDtype) and len(df[col].cat.categories):
+            expressions.append(f"`{col}` == {str(df[col].cat.categories[0])!r}")
+            break
+    return expressions
+
+
+class StageRunner:
+    """
+    Holds the state passed from stage to stage (the loaded frame, insights, plot paths).
+    """
+
+    def __init__(self, csv_path: str, output_dir: str, workers: int):
+        self.csv_path = csv_path
+        self.output_dir = output_dir
+        self.workers = workers
+        self.df: Optional[pd.DataFrame] = None
+        self.insights: Optional[Dict[str, Any]] = None
+        self.images: Dict[str, str] = {}
+        self._app = None
+
+    def load(self) -> None:
+        from helpers import load_csv_file
+
+        self.df = load_csv_file(self.csv_path)
+
+    def display(self) -> None:
+        from PyQt5.QtWidgets import QApplication, QTableView
+        from helpers import display_dataframe
+
+        self._app = QApplication.instance() or QApplication([])
+        view = QTableView()
+        view.resize(1200, 800)
+        view.show()
+        display_dataframe(self.df, view)
+        self._app.processEvents()  # paints the visible cells
+        view.close()
+
+    def filter(self) -> None:
+        from helpers import apply_df_filter
+
+        for expression in filter_expressions(self.df):
+            apply_df_filter(self.df, expression)
+
+    def eda(self) -> None:
+        from eda_logic import compute_eda_insights
+
+        self.insights = compute_eda_insights(self.df, workers=self.workers)
+
+    def plots(self) -> None:
+        from eda_plots import save_eda_plots
+
+        self.images, _ = save_eda_plots(self.df, self.output_dir, workers=self.workers)
+
+    def report(self) -> None:
+        from eda_report import generate_html_report
+
+        generate_html_report(self.insights, self.images, self.output_dir)
+
+    def stage(self, name: str) -> Callable[[], None]:
+        return getattr(self, name)
+
+
+def _rss_mb() -> Optional[float]:
+    # Resident memory, which also sees Arrow and other native allocations tracemalloc misses (Linux only)
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024 ** 2
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def measure(runner: StageRunner, stages: List[str], repeat: int) -> Dict[str, Dict[str, Any]]:
+    results = {}
+    for name in STAGES:
+        if name not in stages:
+            # Later stages still need the earlier ones' state
+            if name in ("load", "eda", "plots"):
+                runner.stage(name)()
+            continue
+        run = runner.stage(name)
+        seconds = []
+        for _ in range(max(1, repeat)):
+            start = time.perf_counter()
+            run()
+            seconds.append(time.perf_counter() - start)
+        # Separate pass: tracemalloc slows everything it watches
+        rss_before = _rss_mb()
+        tracemalloc.start()
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        rss_after = _rss_mb()
+        results[name] = {
+            "seconds": statistics.median(seconds),
+            "min_seconds": min(seconds),
+            "runs": seconds,
+            "peak_mb": peak / 1024 ** 2,
+            "rss_delta_mb": None if rss_before is None else rss_after - rss_before,
+        }
+        print(f"{name:<8} {results[name]['seconds']:9.3f} s  (min {min(seconds):.3f})  peak {results[name]['peak_mb']:8.1f} MB")
+    return results
+
+
+# ────────────── Baselines ──────────────
+
+def compare(current: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]], tolerance: float,
+            min_seconds: float, min_mb: float) -> List[str]:
+    """
+    Regressions of `current` against `baseline`. Small absolute differences are
+    ignored so timer noise on fast stages does not fail a run.
+    """
+    regressions = []
+    print(f"\n{'stage':<8} {'baseline':>10} {'current':>10} {'change':>8}   {'peak MB':>17}")
+    for name, result in current.items():
+        base = baseline.get(name)
+        if base is None:
+            print(f"{name:<8} {'-':>10} {result['seconds']:10.3f}")
+            continue
+        change = result["seconds"] / base["seconds"] - 1 if base["seconds"] else 0.0
+        print(f"{name:<8} {base['seconds']:10.3f} {result['seconds']:10.3f} {change:+8.0%}   "
+              f"{base['peak_mb']:8.1f} → {result['peak_mb']:6.1f}")
+        if change > tolerance and result["seconds"] - base["seconds"] > min_seconds:
+            regressions.append(f"{name}: {base['seconds']:.3f}s → {result['seconds']:.3f}s ({change:+.0%})")
+        grown = result["peak_mb"] - base["peak_mb"]
+        if base["peak_mb"] and grown / base["peak_mb"] > tolerance and grown > min_mb:
+            regressions.append(f"{name}: peak {base['peak_mb']:.1f} MB → {result['peak_mb']:.1f} MB")
+    return regressions
+
+
+def _read_json(path: str) -> Dict[str, Any]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_json(path: str, data: Dict[str, Any]) -> None:
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dataset", default="synthetic", choices=["synthetic", *BUNDLED])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--columns", type=int, default=20, help="synthetic only")
+    parser.add_argument("--null-rate", type=float, default=0.05, help="synthetic only")
+    parser.add_argument("--cardinality", type=int, default=1_000, help="distinct values per text column (synthetic only)")
+    parser.add_argument("--mix", default="numeric=4,integer=2,text=1,category=2,bool=1,datetime=1",
+                        help="relative column counts per kind (synthetic only)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--stages", default=",".join(STAGES), help="comma-separated subset of " + ", ".join(STAGES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=1, help="EDA and plot worker processes")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="store this run as the baseline for its dataset")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative slowdown or growth")
+    parser.add_argument("--min-seconds", type=float, default=0.05, help="ignore slowdowns smaller than this")
+    parser.add_argument("--min-mb", type=float, default=5.0, help="ignore memory growth smaller than this")
+    args = parser.parse_args(argv)
+
+    stages = [s.strip() for s in args.stages.split(",") if s.strip()]
+    unknown = set(stages) - set(STAGES)
+    if unknown:
+        parser.error(f"unknown stages: {', '.join(sorted(unknown))}")
+    spec = DatasetSpec(args.dataset, args.rows, args.columns, args.null_rate, args.cardinality,
+                       parse_mix(args.mix), args.seed)
+
+    work_dir = tempfile.mkdtemp(prefix="dashgraph-bench-")
+    try:
+        print(f"Dataset {spec.key}")
+        csv_path = write_dataset(spec, work_dir)
+        print(f"  {os.path.getsize(csv_path) / 1024 ** 2:.1f} MB CSV\n")
+        runner = StageRunner(csv_path, os.path.join(work_dir, "reports"), args.workers)
+        results = measure(runner, stages, args.repeat)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    record = {
+        "dataset": spec.key,
+        "spec": spec.as_dict(),
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+        },
+        "workers": args.workers,
+        "repeat": args.repeat,
+        "stages": results,
+    }
+    _write_json(args.output, record)
+    print(f"\nResults written to {args.output}")
+
+    baselines = _read_json(args.baseline)
+    if args.save_baseline:
+        baselines[spec.key] = record
+        _write_json(args.baseline, baselines)
+        print(f"Baseline for {spec.key} stored in {args.baseline}")
+        return 0
+    if spec.key not in baselines:
+        print(f"No baseline for {spec.key} in {args.baseline}; run with --save-baseline first")
+        return 0
+
+    regressions = compare(results, baselines[spec.key]["stages"], args.tolerance, args.min_seconds, args.min_mb)
+    for regression in regressions:
+        print(f"❌ {regression}")
+    if not regressions:
+        print("✅ No regressions against the baseline")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
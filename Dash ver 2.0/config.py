@@ -8,13 +8,69 @@ AZURE_ENDPOINT = os.getenv("AZURE_ENDPOINT")
 AZURE_DEPLOYMENT = os.getenv("AZURE_DEPLOYMENT")
 API_VERSION = "2024-12-01-preview"
 
-# Fail fast if configs are missing
-required = {
-    "AZURE_API_KEY": AZURE_API_KEY,
-    "AZURE_ENDPOINT": AZURE_ENDPOINT,
-    "AZURE_DEPLOYMENT": AZURE_DEPLOYMENT,
-}
-
-missing = [key for key, value in required.items() if not value]
-if missing:
-    raise EnvironmentError(f"❌ Missing required environment variables: {', '.join(missing)}")
+# Streaming CSV loader (optional)
+MEMORY_BUDGET_MB = float(os.getenv("DASH_MEMORY_BUDGET_MB", "0")) or None
+LOAD_CHUNK_ROWS = int(os.getenv("DASH_LOAD_CHUNK_ROWS", "200000"))
+
+# Parsed-dataset cache (optional, needs pyarrow)
+DATASET_CACHE_DIR = os.path.expanduser(os.getenv("DASH_CACHE_DIR", os.path.join("~", ".dashgraph", "cache")))
+DATASET_CACHE_MAX_MB = float(os.getenv("DASH_CACHE_MAX_MB", "2048"))
+
+# EDA worker processes (0 = one per CPU, 1 = serial)
+EDA_WORKERS = int(os.getenv("DASH_EDA_WORKERS", "0"))
+
+# Rows per block of the partial aggregates reused by EDA of filtered data (0 = always rescan the filtered rows)
+EDA_BLOCK_ROWS = int(os.getenv("DASH_EDA_BLOCK_ROWS", "65536"))
+
+# EDA report cache in eda_reports/ (files unused for longer, or past the size cap, are removed)
+EDA_CACHE_MAX_MB = float(os.getenv("DASH_EDA_CACHE_MAX_MB", "512"))
+EDA_CACHE_MAX_AGE_DAYS = float(os.getenv("DASH_EDA_CACHE_MAX_AGE_DAYS", "30"))
+
+# LLM response cache (SQLite); offline mode answers from the cache only
+LLM_CACHE_PATH = os.path.expanduser(os.getenv("DASH_LLM_CACHE", os.path.join("~", ".dashgraph", "llm_cache.sqlite")))
+LLM_CACHE_TTL_HOURS = float(os.getenv("DASH_LLM_CACHE_TTL_HOURS", "168"))
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("DASH_LLM_CACHE_MAX_ENTRIES", "5000"))
+LLM_OFFLINE = os.getenv("DASH_LLM_OFFLINE", "").lower() in ("1", "true", "yes")
+
+# LLM client: "azure" or the local deterministic "stub"; per-attempt timeout, overall deadline, retries
+LLM_BACKEND = os.getenv("DASH_LLM_BACKEND", "azure").lower()
+LLM_TIMEOUT_SECONDS = float(os.getenv("DASH_LLM_TIMEOUT", "60"))
+LLM_DEADLINE_SECONDS = float(os.getenv("DASH_LLM_DEADLINE", "120"))
+LLM_MAX_RETRIES = int(os.getenv("DASH_LLM_MAX_RETRIES", "3"))
+
+# Sandboxed plot workers for generated code: processes, wall-clock and CPU limits per graph, memory cap (0 = none)
+PLOT_WORKERS = int(os.getenv("DASH_PLOT_WORKERS", "2"))
+PLOT_TIMEOUT_SECONDS = float(os.getenv("DASH_PLOT_TIMEOUT", "30"))
+PLOT_CPU_SECONDS = float(os.getenv("DASH_PLOT_CPU_SECONDS", "20"))
+PLOT_MEMORY_MB = int(os.getenv("DASH_PLOT_MEMORY_MB", "0"))
+
+# Stage timing: spans logged to a rolling JSONL file; a profile directory also dumps a cProfile .prof per operation
+PERF_ENABLED = os.getenv("DASH_PERF", "").lower() in ("1", "true", "yes")
+PERF_LOG = os.path.expanduser(os.getenv("DASH_PERF_LOG", os.path.join("~", ".dashgraph", "perf.jsonl")))
+PERF_LOG_MAX_MB = float(os.getenv("DASH_PERF_LOG_MAX_MB", "5"))
+PERF_PROFILE_DIR = os.path.expanduser(os.getenv("DASH_PERF_PROFILE_DIR", "")) or None
+PERF_HISTORY = int(os.getenv("DASH_PERF_HISTORY", "200"))
+
+# Data backend: "pandas" loads files into memory; "duckdb" queries CSV/Parquet in place (needs duckdb)
+DATA_BACKEND = os.getenv("DASH_DATA_BACKEND", "pandas").lower()
+DUCKDB_THREADS = int(os.getenv("DASH_DUCKDB_THREADS", "0"))
+DUCKDB_MEMORY_MB = float(os.getenv("DASH_DUCKDB_MEMORY_MB", "0"))
+# Rows handed to generated plot code when the data stays in DuckDB (a sample beyond this)
+BACKEND_SAMPLE_ROWS = int(os.getenv("DASH_BACKEND_SAMPLE_ROWS", "1000000"))
+# Graph prompts get per-category rollups of columns with at most this many distinct values (0 = no rollups)
+PREAGG_MAX_GROUPS = int(os.getenv("DASH_PREAGG_MAX_GROUPS", "50"))
+
+
+def require_azure_config() -> None:
+    """
+    Raise if the Azure settings needed to call the API are missing. Checked when
+    the LLM client is first built rather than at import, so the app starts without them.
+    """
+    required = {
+        "AZURE_API_KEY": AZURE_API_KEY,
+        "AZURE_ENDPOINT": AZURE_ENDPOINT,
+        "AZURE_DEPLOYMENT": AZURE_DEPLOYMENT,
+    }
+    missing = [key for key, value in required.items() if not value]
+    if missing:
+        raise EnvironmentError(f"❌ Missing required environment variables: {', '.join(missing)}")
@@ -0,0 +1,130 @@
+import os
+import logging
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from type_inference import NA_VALUES, TypePlan, apply_plan, confirm_column, infer_csv_types, type_report
+
+CHUNK_ROWS = 200_000
+# Kinds that can only be confirmed once every chunk has been seen
+DEFERRED_KINDS = ("bool_text", "bool_numeric", "category")
+
+ProgressCallback = Callable[[float, int], None]
+
+
+@dataclass
+class StreamResult:
+    """
+    Outcome of a streaming load.
+
+    `df` holds the rows that fit in the memory budget. When the budget was hit,
+    `truncated` is set and the rest of the file was not read.
+    """
+    df: pd.DataFrame
+    rows_read: int
+    truncated: bool = False
+    report: List[Dict] = field(default_factory=list)
+
+
+def downcast_chunk(chunk: pd.DataFrame) -> pd.DataFrame:
+    """
+    Shrink numeric columns in place: float64 -> float32 and int64 -> the smallest int that fits.
+    """
+    for col in chunk.columns:
+        dtype = chunk[col].dtype
+        if dtype == np.float64:
+            chunk[col] = chunk[col].astype(np.float32)
+        elif dtype == np.int64:
+            chunk[col] = pd.to_numeric(chunk[col], downcast="integer")
+    return chunk
+
+
+def _unify_categories(chunks: List[pd.DataFrame]) -> None:
+    """
+    Give every chunk the same categories so concat keeps the columns categorical.
+    """
+    for col in chunks[0].columns:
+        if not isinstance(chunks[0][col].dtype, pd.CategoricalDtype):
+            continue
+        categories = chunks[0][col].cat.categories
+        for chunk in chunks[1:]:
+            categories = categories.append(chunk[col].cat.categories.difference(categories))
+        for chunk in chunks:
+            if not chunk[col].cat.categories.equals(categories):
+                chunk[col] = chunk[col].cat.set_categories(categories)
+
+
+def _prepare_chunk(chunk: pd.DataFrame, plan: TypePlan, downcast: bool) -> pd.DataFrame:
+    for col, kind in plan.kinds.items():
+        if kind == "datetime" and col in chunk.columns:
+            chunk[col] = confirm_column(chunk[col], kind)
+    return downcast_chunk(chunk) if downcast else chunk
+
+
+def load_csv_streaming(
+    path: str,
+    chunksize: int = CHUNK_ROWS,
+    memory_budget_mb: Optional[float] = None,
+    downcast: bool = True,
+    progress: Optional[ProgressCallback] = None,
+) -> StreamResult:
+    """
+    Load a CSV chunk by chunk with dtypes inferred from the first chunk.
+
+    Parameters:
+        path (str): CSV file to read.
+        chunksize (int): Rows per chunk.
+        memory_budget_mb (float): Stop reading once the loaded rows exceed this. None disables the limit.
+        downcast (bool): Downcast numeric columns per chunk.
+        progress (callable): Called with (fraction of the file read, rows read) after every chunk.
+
+    Returns:
+        StreamResult: The in-memory frame plus truncation details.
+    """
+    plan = infer_csv_types(path, sample_rows=chunksize)
+    budget = memory_budget_mb * 1024 ** 2 if memory_budget_mb else None
+    total_bytes = os.path.getsize(path) or 1
+
+    chunks: List[pd.DataFrame] = []
+    held_bytes = 0
+    rows_read = 0
+    over_budget = False
+
+    with open(path, "rb") as handle:
+        reader = pd.read_csv(handle, chunksize=chunksize, na_values=NA_VALUES, **plan.read_csv_kwargs())
+        for chunk in reader:
+            chunk = _prepare_chunk(chunk, plan, downcast)
+            rows_read += len(chunk)
+            chunks.append(chunk)
+            held_bytes += chunk.memory_usage(deep=True).sum()
+
+            if progress:
+                progress(min(handle.tell() / total_bytes, 1.0), rows_read)
+            if budget is not None and held_bytes >= budget:
+                over_budget = True
+                logging.warning(f"Memory budget of {memory_budget_mb} MB reached after {rows_read} rows; stopping.")
+                break
+
+    if not chunks:
+        df = pd.read_csv(path, nrows=0)
+    else:
+        _unify_categories(chunks)
+        df = pd.concat(chunks, ignore_index=True)
+        del chunks
+
+    deferred = TypePlan(
+        kinds={col: kind for col, kind in plan.kinds.items() if kind in DEFERRED_KINDS},
+        timings=plan.timings,
+    )
+    df = apply_plan(df, deferred)
+
+    return StreamResult(
+        df=df,
+        rows_read=rows_read,
+        truncated=over_budget,
+        report=type_report(df, plan),
+    )
+
@@ -0,0 +1,139 @@
+import os
+import hashlib
+import logging
+from typing import List, Optional
+
+import pandas as pd
+
+try:
+    import pyarrow.feather as feather
+except ImportError:  # pyarrow is optional; without it the cache is disabled
+    feather = None
+
+# Bump whenever type inference changes, so stale typed frames are not served
+CACHE_VERSION = "1"
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".dashgraph", "cache")
+DEFAULT_MAX_MB = 2048
+HASH_BLOCK_BYTES = 1024 * 1024
+
+
+def content_hash(path: str, block_bytes: int = HASH_BLOCK_BYTES) -> str:
+    """
+    Hash a file's content. Small files are hashed whole; large files are hashed
+    from their first, middle and last blocks so keying stays cheap on multi-GB inputs.
+    Size and mtime are part of the cache key too, so edits elsewhere are still caught.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    size = os.path.getsize(path)
+    with open(path, "rb") as handle:
+        if size <= 3 * block_bytes:
+            digest.update(handle.read())
+        else:
+            for offset in (0, size // 2 - block_bytes // 2, size - block_bytes):
+                handle.seek(offset)
+                digest.update(handle.read(block_bytes))
+    return digest.hexdigest()
+
+
+def cache_key(path: str) -> str:
+    """
+    Key a CSV by absolute path, size, mtime and content hash.
+    """
+    stat = os.stat(path)
+    parts = [CACHE_VERSION, os.path.abspath(path), str(stat.st_size), str(stat.st_mtime_ns), content_hash(path)]
+    return hashlib.blake2b("|".join(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+
+class DatasetCache:
+    """
+    On-disk LRU cache of typed DataFrames stored as uncompressed Feather files.
+
+    Uncompressed Feather can be memory-mapped on reload, so a warm reopen skips
+    CSV parsing and type inference entirely. Recency is tracked through each
+    entry's mtime, which is refreshed on every hit.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_mb: float = DEFAULT_MAX_MB):
+        self.cache_dir = cache_dir
+        self.max_bytes = int(max_mb * 1024 ** 2)
+
+    @property
+    def enabled(self) -> bool:
+        return feather is not None and self.max_bytes > 0
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.feather")
+
+    def get(self, path: str) -> Optional[pd.DataFrame]:
+        """
+        Return the cached frame for a CSV, or None on a miss.
+        """
+        if not self.enabled:
+            return None
+        entry = self._entry_path(cache_key(path))
+        if not os.path.exists(entry):
+            return None
+        try:
+            table = feather.read_table(entry, memory_map=True)
+            df = table.to_pandas(split_blocks=True)
+            os.utime(entry)
+            return df
+        except Exception as e:
+            logging.warning(f"Dropping unreadable cache entry {entry}: {e}")
+            self._remove(entry)
+            return None
+
+    def put(self, path: str, df: pd.DataFrame) -> Optional[str]:
+        """
+        Store a typed frame for a CSV and evict old entries past the size cap.
+        """
+        if not self.enabled:
+            return None
+        os.makedirs(self.cache_dir, exist_ok=True)
+        entry = self._entry_path(cache_key(path))
+        tmp_path = f"{entry}.tmp"
+        try:
+            df.reset_index(drop=True).to_feather(tmp_path, compression="uncompressed")
+            os.replace(tmp_path, entry)
+        except Exception as e:
+            logging.warning(f"Could not cache {path}: {e}")
+            self._remove(tmp_path)
+            return None
+        self.evict()
+        return entry
+
+    def entries(self) -> List[str]:
+        """
+        Cache files ordered from least to most recently used.
+        """
+        if not os.path.isdir(self.cache_dir):
+            return []
+        paths = [
+            os.path.join(self.cache_dir, name)
+            for name in os.listdir(self.cache_dir)
+            if name.endswith(".feather")
+        ]
+        return sorted(paths, key=os.path.getmtime)
+
+    def evict(self) -> None:
+        """
+        Remove least recently used entries until the cache fits its size cap.
+        """
+        entries = self.entries()
+        total = sum(os.path.getsize(p) for p in entries)
+        for entry in entries:
+            if total <= self.max_bytes:
+                break
+            total -= os.path.getsize(entry)
+            self._remove(entry)
+
+    def clear(self) -> None:
+        for entry in self.entries():
+            self._remove(entry)
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
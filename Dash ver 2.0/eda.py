@@ -1,27 +1,335 @@
 import os
-from typing import Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+import logging
+import numpy as np
 import pandas as pd
 
+from dataset_cache import cache_key
+from eda_blocks import BLOCK_ROWS, aggregates_for, rescan_rows
+from eda_cache import EDACache, artifact_key, frame_fingerprint
 from eda_logic import compute_eda_insights
-from eda_plots import save_eda_plots
-from eda_report import generate_html_report
+from eda_plots import MAX_HEATMAP_COLUMNS, save_eda_plots, save_matrix_plots, top_columns
+from eda_stats import assemble_insights
+from parallel_eda import compute_column_stats_parallel
+from eda_report import fill_gpt_summary, generate_html_report, request_gpt_summary, summarize_insights
+from eda_sketches import CHUNK_ROWS, approximate_insights
+from instrumentation import span
 
-def run_eda(df: pd.DataFrame, output_dir: Optional[str] = "eda_reports") -> str:
+logger = logging.getLogger(__name__)
+
+ProgressCallback = Callable[[float, str], None]
+# Receives the report path as soon as the statistics are written, before the GPT summary is in
+ReportCallback = Callable[[str], None]
+
+def _cached_insights(
+    df: pd.DataFrame, cache: EDACache, fingerprints: Dict[Any, Tuple[str, str]], workers: int
+) -> Dict[str, Any]:
+    # Only columns whose fingerprint is not cached are profiled
+    values = {col: fp[0] for col, fp in fingerprints.items()}
+    stats = cache.column_stats(values)
+    fresh = [col for col in df.columns if col not in stats]
+    if fresh:
+        stats.update(compute_column_stats_parallel(df[fresh], workers))
+        cache.store_column_stats({col: values[col] for col in fresh}, stats)
+    logger.info(f"EDA statistics: {len(fresh)} of {df.shape[1]} columns recomputed")
+    return assemble_insights(df.shape, df.dtypes, stats)
+
+
+def _plot_keys(df: pd.DataFrame, fingerprints: Dict[Any, Tuple[str, str]]) -> Dict[str, str]:
+    # Each plot depends only on the columns it draws
+    numeric = df.select_dtypes(include="number").columns
+    return {
+        "correlation": artifact_key("correlation", MAX_HEATMAP_COLUMNS, [(col, fingerprints[col][0]) for col in numeric]),
+        "missing": artifact_key("missing", MAX_HEATMAP_COLUMNS, [(col, fingerprints[col][1]) for col in df.columns]),
+    }
+
+
+def _summary(cache: Optional[EDACache], full_summary: str) -> str:
+    key = artifact_key("summary", full_summary)
+    cached = cache.summary(key) if cache is not None else None
+    if cached is not None:
+        return cached
+    summary = request_gpt_summary(full_summary)
+    if cache is not None and not summary.startswith("⚠️"):
+        cache.store_summary(key, summary)
+    return summary
+
+
+def _write_report(
+    insights: Dict[str, Any],
+    plots: Dict[str, str],
+    output_dir: str,
+    summary_future: Future,
+    report: ProgressCallback,
+    on_report: Optional[ReportCallback],
+) -> Tuple[str, str]:
+    """
+    Write the report and return (path, GPT summary). When `on_report` is given
+    and the summary is still running, the statistics are written first with a
+    placeholder, handed to `on_report` to open, and the summary is filled in
+    once it arrives.
+    """
+    pending = on_report is not None and not summary_future.done()
+    report(0.85, "Writing report")
+    with span("eda.report", summary_pending=pending):
+        report_path = generate_html_report(
+            insights, plots, output_dir,
+            gpt_summary=None if pending else summary_future.result(), summary_pending=pending,
+        )
+    if not pending:
+        return report_path, summary_future.result()
+    try:
+        on_report(report_path)
+        report(0.9, "Waiting for GPT summary")
+        # Only the wait left after the plots and the report; the request itself overlaps them
+        with span("eda.gpt_summary"):
+            gpt_summary = summary_future.result()
+    except Exception:
+        # Cancelled or failed after the page was opened: stop it waiting for a summary that will not come
+        fill_gpt_summary(report_path, "⚠️ GPT summary was not added to this report.")
+        raise
+    fill_gpt_summary(report_path, gpt_summary)
+    return report_path, gpt_summary
+
+
+def run_eda(
+    df: pd.DataFrame,
+    output_dir: Optional[str] = "eda_reports",
+    progress: Optional[ProgressCallback] = None,
+    workers: int = 1,
+    cache: Optional[EDACache] = None,
+    on_report: Optional[ReportCallback] = None,
+) -> str:
     """
     Orchestrates the EDA workflow:
     - Computes insights from the DataFrame
     - Generates visual plots (correlation, missing values)
     - Creates a styled HTML report using GPT summarization
 
+    The GPT summary is requested on a separate thread while the plots render.
+    With a cache, an unchanged frame returns its existing report at once, and a
+    changed one only recomputes the columns, plots and summary that differ.
+
     Parameters:
         df (pd.DataFrame): The dataset to analyze.
-        output_dir (str): Where to save the plots and report.
+        output_dir (str): Where to save the plots and report (the cache's directory when caching).
+        progress (callable): Optional callback receiving (fraction done, stage message).
+        workers (int): Processes for the per-column statistics (1 = serial, 0 = one per CPU).
+        cache (EDACache): Optional artifact cache (see eda_cache).
+        on_report (callable): Called with the report path as soon as the statistics are
+            written; the GPT summary is then filled into the open report when it arrives.
+
+    Returns:
+        str: Path to the generated HTML report.
+    """
+    if cache is not None:
+        output_dir = cache.output_dir
+    os.makedirs(output_dir, exist_ok=True)
+
+    report = progress or (lambda fraction, message: None)
+
+    plots: Dict[str, str] = {}
+    plot_keys: Dict[str, str] = {}
+    if cache is not None:
+        report(0.0, "Checking EDA cache")
+        key, fingerprints = frame_fingerprint(df)
+        cached = cache.report(key)
+        if cached:
+            cache.save()
+            logger.info(f"EDA report unchanged, reusing {cached}")
+            return cached
+        report(0.05, "Computing insights")
+        with span("eda.insights", rows=len(df), columns=df.shape[1]):
+            insights = _cached_insights(df, cache, fingerprints, workers)
+        plot_keys = _plot_keys(df, fingerprints)
+        plots = {kind: path for kind, k in plot_keys.items() if (path := cache.plot(k))}
+    else:
+        report(0.0, "Computing insights")
+        with span("eda.insights", rows=len(df), columns=df.shape[1]):
+            insights = compute_eda_insights(df, workers=workers)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        summary_future = executor.submit(_summary, cache, summarize_insights(insights)["full"])
+        report(0.3, "Rendering plots")
+        kinds = [kind for kind in ("correlation", "missing") if kind not in plots]
+        if kinds:
+            with span("eda.plots", rows=len(df), plots=len(kinds)):
+                rendered, timings = save_eda_plots(df, output_dir, kinds=kinds)
+            logger.info("EDA plot timings: " + ", ".join(f"{k} {v:.2f}s" for k, v in timings.items()))
+            plots.update(rendered)
+            for kind, path in rendered.items():
+                if cache is not None:
+                    cache.store_plot(plot_keys[kind], path)
+        report_path, gpt_summary = _write_report(insights, plots, output_dir, summary_future, report, on_report)
+
+    if cache is not None:
+        # A report whose GPT summary failed is not reused, so the next run retries it
+        if not gpt_summary.startswith("⚠️"):
+            cache.store_report(key, report_path)
+        for removed in cache.evict():
+            logger.info(f"Evicted EDA artifact {removed}")
+        cache.save()
+    return report_path
+
+
+def run_eda_approximate(
+    path: str,
+    output_dir: Optional[str] = "eda_reports",
+    chunksize: int = CHUNK_ROWS,
+    progress: Optional[ProgressCallback] = None,
+    cache: Optional[EDACache] = None,
+    on_report: Optional[ReportCallback] = None,
+) -> str:
+    """
+    EDA for CSV files too large to load: streams the file through mergeable
+    sketches (see eda_sketches) so memory stays constant regardless of row count.
+    The report has the same structure as run_eda plus a section with the error
+    bound of each approximate statistic. With a cache, the report of an
+    unchanged file (same path, size, mtime and content hash) is reused.
 
     Returns:
         str: Path to the generated HTML report.
     """
+    if cache is not None:
+        output_dir = cache.output_dir
+        key = artifact_key("approximate", cache_key(path), chunksize)
+        cached = cache.report(key)
+        if cached:
+            cache.save()
+            logger.info(f"Approximate EDA report unchanged, reusing {cached}")
+            return cached
     os.makedirs(output_dir, exist_ok=True)
 
-    insights = compute_eda_insights(df)
-    plots = save_eda_plots(df, output_dir)
-    return generate_html_report(insights, plots, output_dir)
+    report = progress or (lambda fraction, message: None)
+
+    with span("eda.insights", approximate=True) as stage:
+        insights = approximate_insights(
+            path, chunksize=chunksize, progress=lambda fraction, message: report(0.8 * fraction, message)
+        )
+        stage.set(rows=insights["shape"][0], columns=insights["shape"][1])
+    return _matrix_report(insights, output_dir, report, cache, key if cache is not None else None, on_report)
+
+
+def run_eda_filtered(
+    base: pd.DataFrame,
+    mask: np.ndarray,
+    output_dir: Optional[str] = "eda_reports",
+    progress: Optional[ProgressCallback] = None,
+    workers: int = 1,
+    cache: Optional[EDACache] = None,
+    block_rows: int = BLOCK_ROWS,
+    on_report: Optional[ReportCallback] = None,
+) -> str:
+    """
+    EDA of base[mask] from per-block partial aggregates of `base` (see
+    eda_blocks): blocks the mask selects completely reuse their stored
+    aggregates and only partly selected blocks are profiled again, so stepping
+    through filters costs time in proportion to the rows at block edges rather
+    than a full scan. The aggregates are built on first use and kept for the
+    next filter over the same frame. When most selected rows sit in partly
+    selected blocks (a filter scattered over the whole file) this falls back
+    to run_eda on the filtered frame, which is cheaper then.
+
+    Returns:
+        str: Path to the generated HTML report.
+    """
+    selected = int(np.count_nonzero(mask))
+    rescan = rescan_rows(mask, block_rows)
+    if block_rows <= 0 or rescan > selected / 2:
+        logger.info(f"EDA filter touches {rescan:,} of {selected:,} rows at block edges; profiling the filtered rows")
+        return run_eda(base[mask], output_dir, progress=progress, workers=workers, cache=cache, on_report=on_report)
+
+    report = progress or (lambda fraction, message: None)
+    report(0.0, "Profiling row blocks")
+    with span("eda.blocks", rows=len(base), block_rows=block_rows):
+        aggregates = aggregates_for(base, block_rows)
+
+    key = aggregates.report_key(mask)
+    if cache is not None:
+        output_dir = cache.output_dir
+        cached = cache.report(key)
+        if cached:
+            cache.save()
+            logger.info(f"EDA report unchanged, reusing {cached}")
+            return cached
+    os.makedirs(output_dir, exist_ok=True)
+
+    report(0.3, "Combining block statistics")
+    with span("eda.insights", rows=selected, columns=base.shape[1], incremental=True) as stage:
+        insights = aggregates.insights(mask)
+        stage.set(**insights["blocks"])
+    logger.info(
+        "EDA statistics: {reused} blocks reused, {rescanned} rescanned, {skipped} skipped".format(**insights["blocks"])
+    )
+    return _matrix_report(insights, output_dir, report, cache, key, on_report)
+
+
+def run_eda_sql(
+    backend,
+    where: Optional[str] = None,
+    output_dir: Optional[str] = "eda_reports",
+    progress: Optional[ProgressCallback] = None,
+    cache: Optional[EDACache] = None,
+    on_report: Optional[ReportCallback] = None,
+) -> str:
+    """
+    EDA over a query backend (see backends.DuckDBBackend): every statistic and
+    both matrices are computed as SQL aggregates over the rows matching `where`,
+    so the data never has to fit in memory. The report of an unchanged file
+    and filter is reused when caching.
+
+    Returns:
+        str: Path to the generated HTML report.
+    """
+    key = artifact_key("sql", backend.source_key, where)
+    if cache is not None:
+        output_dir = cache.output_dir
+        cached = cache.report(key)
+        if cached:
+            cache.save()
+            logger.info(f"EDA report unchanged, reusing {cached}")
+            return cached
+    os.makedirs(output_dir, exist_ok=True)
+
+    report = progress or (lambda fraction, message: None)
+    report(0.0, "Computing insights")
+    with span("eda.insights", backend="duckdb") as stage:
+        insights = backend.insights(where)
+        stage.set(rows=insights["shape"][0], columns=insights["shape"][1])
+    return _matrix_report(insights, output_dir, report, cache, key, on_report)
+
+
+def _matrix_report(
+    insights: Dict[str, Any],
+    output_dir: str,
+    report: ProgressCallback,
+    cache: Optional[EDACache],
+    key: Optional[str],
+    on_report: Optional[ReportCallback] = None,
+) -> str:
+    # Plots from the precomputed "correlation" and "nullity_correlation" matrices, then the report
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        summary_future = executor.submit(_summary, cache, summarize_insights(insights)["full"])
+        report(0.8, "Rendering plots")
+        # Same column cap as save_eda_plots: most variable columns first
+        correlation = insights["correlation"]
+        if insights["types"]["numerical"]:
+            keep = top_columns(insights["describe"]["std"][correlation.columns] ** 2)
+            correlation = correlation.loc[keep, keep]
+        missing = insights["missing"][insights["nullity_correlation"].columns]
+        keep = top_columns(missing * (1 - missing))
+        nullity = insights["nullity_correlation"].loc[keep, keep]
+        with span("eda.plots", plots=2):
+            plots, timings = save_matrix_plots(correlation, nullity, output_dir)
+        logger.info("EDA plot timings: " + ", ".join(f"{k} {v:.2f}s" for k, v in timings.items()))
+        report_path, gpt_summary = _write_report(insights, plots, output_dir, summary_future, report, on_report)
+
+    if cache is not None:
+        # A report whose GPT summary failed is not reused, so the next run retries it
+        if not gpt_summary.startswith("⚠️"):
+            cache.store_report(key, report_path)
+        for removed in cache.evict():
+            logger.info(f"Evicted EDA artifact {removed}")
+        cache.save()
+    return report_path
@@ -0,0 +1,316 @@
+import threading
+import weakref
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from eda_cache import artifact_key, frame_fingerprint
+from eda_sketches import CorrelationAccumulator, MomentSketch
+from eda_stats import QUANTILES, TOP_K, _lerp, assemble_insights, column_groups
+from eda_plots import top_columns
+
+BLOCK_ROWS = 65_536
+# Correlation sums are k x k per block, so only the most variable columns keep them
+CROSS_COLUMNS = 64
+
+# (codes, counts) of the distinct values in a block; counts is None when each code appears once per entry
+ValueTable = Tuple[np.ndarray, Optional[np.ndarray]]
+
+
+def _value_table(codes: np.ndarray, size: int) -> ValueTable:
+    codes = codes[codes >= 0]
+    if size <= 4 * len(codes):
+        dense = np.bincount(codes, minlength=size)
+        present = np.flatnonzero(dense)
+        counts = dense[present]
+    else:
+        present, counts = np.unique(codes, return_counts=True)
+    if len(present) > len(codes) // 2:
+        # Mostly distinct values: the codes themselves are the smaller table
+        return codes.astype(np.int32), None
+    return present.astype(np.int32), counts.astype(np.int32)
+
+
+def _merge_tables(tables: List[ValueTable], size: int) -> np.ndarray:
+    if not tables:
+        return np.zeros(size, dtype=np.int64)
+    codes = np.concatenate([table[0] for table in tables])
+    weights = np.concatenate([
+        np.ones(len(table[0]), dtype=np.int32) if table[1] is None else table[1] for table in tables
+    ])
+    return np.bincount(codes, weights=weights, minlength=size).astype(np.int64)
+
+
+def _table_quantiles(values: np.ndarray, counts: np.ndarray) -> List[float]:
+    # Linear interpolation between order statistics, read off the cumulative counts
+    total = counts.sum()
+    if not total:
+        return [np.nan] * len(QUANTILES)
+    cumulative = np.cumsum(counts)
+    last = total - 1
+    position = np.asarray(QUANTILES) * last
+    lower = np.floor(position).astype(np.int64)
+    upper = np.minimum(lower + 1, last)
+    at = lambda ranks: values[np.searchsorted(cumulative, ranks, side="right")]
+    return [float(v) for v in _lerp(at(lower), at(upper), position - lower)]
+
+
+def block_hits(mask: np.ndarray, block_rows: int = BLOCK_ROWS) -> np.ndarray:
+    """
+    Number of selected rows in each block of `block_rows` rows.
+    """
+    if not len(mask):
+        return np.zeros(0, dtype=np.int64)
+    return np.add.reduceat(mask, np.arange(0, len(mask), block_rows), dtype=np.int64)
+
+
+def rescan_rows(mask: np.ndarray, block_rows: int = BLOCK_ROWS) -> int:
+    """
+    Selected rows that lie in partly selected blocks, i.e. the rows
+    BlockAggregates.insights(mask) has to profile again.
+    """
+    hits = block_hits(mask, block_rows)
+    sizes = np.minimum(block_rows, len(mask) - np.arange(0, len(mask), block_rows))
+    return int(hits[hits < sizes].sum())
+
+
+class BlockProfile:
+    """
+    Mergeable partial aggregates of some rows of a BlockAggregates frame: row
+    count, numeric moments, correlation and nullity cross-product sums, and a
+    value-count table per column over that column's fixed value domain.
+    """
+
+    def __init__(self, numeric: int, cross: int, nullable: int, columns: int):
+        self.rows = 0
+        self.moments = MomentSketch(numeric)
+        self.correlation = CorrelationAccumulator(cross)
+        self.nullity = CorrelationAccumulator(nullable)
+        self.tables: List[List[ValueTable]] = [[] for _ in range(columns)]
+
+    def merge(self, other: "BlockProfile") -> None:
+        self.rows += other.rows
+        self.moments.merge(other.moments)
+        self.correlation.merge(other.correlation)
+        self.nullity.merge(other.nullity)
+        for mine, theirs in zip(self.tables, other.tables):
+            mine.extend(theirs)
+
+
+class BlockAggregates:
+    """
+    Per-block partial aggregates of a fixed base frame, so the EDA insights of
+    any filter mask over it can be assembled without rescanning every row.
+
+    The base is split into blocks of `block_rows` rows and each block's
+    BlockProfile is computed once. For a mask, blocks it selects completely
+    reuse their stored profile, blocks it skips are ignored and only blocks it
+    selects in part are profiled again from the selected rows. Every statistic
+    stays exact: quartiles, distinct counts and top values come from merged
+    value-count tables over each column's value domain, mean/std/skew from
+    merged moments and both heatmap matrices from merged cross-product sums.
+    The matrices cover at most `cross_columns` numeric and nullable columns
+    (the most variable ones in the base frame).
+
+    Rows are rescanned from int32 codes into each column's sorted (numeric) or
+    factorized value domain, kept alongside the frame: 4 bytes per cell, with
+    categorical columns reusing their own codes.
+    """
+
+    def __init__(self, base: pd.DataFrame, block_rows: int = BLOCK_ROWS, cross_columns: int = CROSS_COLUMNS):
+        self.base = base
+        self.block_rows = max(1, block_rows)
+        self.key = frame_fingerprint(base)[0]
+        self.columns = list(base.columns)
+        self._positions = {col: i for i, col in enumerate(self.columns)}
+        groups = column_groups(base.dtypes)
+        self.numeric = groups["numerical"]
+        self._numeric_index = {col: i for i, col in enumerate(self.numeric)}
+        self.categorical = set(groups["categorical"])
+
+        self._domains: Dict[Any, Any] = {}
+        self._codes: Dict[Any, np.ndarray] = {}
+        means, variance = {}, {}
+        for col in self.columns:
+            series = base[col]
+            if col in self._numeric_index:
+                values = series.to_numpy(dtype="float64", na_value=np.nan)
+                valid = ~np.isnan(values)
+                self._domains[col], inverse = np.unique(values[valid], return_inverse=True)
+                codes = np.full(len(values), -1, dtype=np.int32)
+                codes[valid] = inverse
+                self._codes[col] = codes
+                if valid.any():
+                    means[col], variance[col] = values[valid].mean(), values[valid].var()
+                else:
+                    means[col], variance[col] = np.nan, np.nan
+            elif isinstance(series.dtype, pd.CategoricalDtype):
+                self._domains[col] = series.cat.categories
+                self._codes[col] = series.cat.codes.to_numpy()
+            else:
+                codes, uniques = pd.factorize(series, use_na_sentinel=True)
+                self._domains[col] = uniques
+                self._codes[col] = codes.astype(np.int32)
+
+        self.cross = top_columns(pd.Series(variance, index=self.numeric, dtype=float), cross_columns)
+        self._cross_index = [self._numeric_index[col] for col in self.cross]
+        nulls = base.isna().sum()
+        rows = len(base)
+        nullable = nulls[(nulls > 0) & (nulls < rows)]
+        self.nullable = top_columns(nullable * (rows - nullable), cross_columns)
+        # One shift for every block, so merging needs no re-centering
+        self._cross_shift = np.nan_to_num(np.array([means[col] for col in self.cross], dtype=float))
+        self._nullity_shift = (nulls[self.nullable] / max(rows, 1)).to_numpy(dtype=float)
+
+        self.blocks = [self._profile(slice(start, start + self.block_rows)) for start in range(0, rows, self.block_rows)]
+
+    @property
+    def memory_mb(self) -> float:
+        tables = sum(
+            codes.nbytes + (0 if counts is None else counts.nbytes)
+            for block in self.blocks for column in block.tables for codes, counts in column
+        )
+        codes = sum(array.nbytes for array in self._codes.values() if array.base is None)
+        return (tables + codes) / 1024 ** 2
+
+    def _profile(self, rows: Union[slice, np.ndarray], compact: bool = True) -> BlockProfile:
+        """
+        Profile of the base rows at `rows` (a block's slice or an array of positions).
+        Stored block profiles are `compact`: their value tables are reduced to distinct codes and counts.
+        """
+        # Everything is read from the value codes: a value is its code's domain entry, a null is code -1
+        codes = [self._codes[col][rows] for col in self.columns]
+        profile = BlockProfile(len(self.numeric), len(self.cross), len(self.nullable), len(self.columns))
+        profile.rows = len(codes[0]) if codes else 0
+        profile.correlation.shift = self._cross_shift
+        profile.nullity.shift = self._nullity_shift
+
+        values = np.full((profile.rows, len(self.numeric)), np.nan, order="F")
+        for j, col in enumerate(self.numeric):
+            column = codes[self._positions[col]]
+            present = column >= 0
+            values[present, j] = self._domains[col][column[present]]
+        profile.moments.update(values)
+        profile.correlation.update(values[:, self._cross_index])
+        nulls = np.empty((profile.rows, len(self.nullable)))
+        for j, col in enumerate(self.nullable):
+            nulls[:, j] = codes[self._positions[col]] < 0
+        profile.nullity.update(nulls)
+
+        for i, col in enumerate(self.columns):
+            if compact:
+                profile.tables[i].append(_value_table(codes[i], len(self._domains[col])))
+            else:
+                profile.tables[i].append((codes[i][codes[i] >= 0], None))
+        return profile
+
+    def combine(self, mask: Optional[np.ndarray] = None) -> Tuple[BlockProfile, Dict[str, int]]:
+        """
+        Merged profile of the rows where `mask` is True (all rows when None),
+        plus how many blocks were reused, rescanned and skipped.
+        """
+        combined = BlockProfile(len(self.numeric), len(self.cross), len(self.nullable), len(self.columns))
+        starts = np.arange(0, len(self.base), self.block_rows)
+        sizes = np.array([block.rows for block in self.blocks], dtype=np.int64)
+        hits = sizes if mask is None else block_hits(mask, self.block_rows)
+        full, partial = hits == sizes, (hits > 0) & (hits < sizes)
+        for i in np.flatnonzero(full):
+            combined.merge(self.blocks[i])
+        if partial.any():
+            # All partly selected rows are profiled together, in one pass
+            rows = np.concatenate([
+                start + np.flatnonzero(mask[start:start + self.block_rows]) for start in starts[partial]
+            ])
+            combined.merge(self._profile(rows, compact=False))
+        counts = {
+            "reused": int(full.sum()),
+            "rescanned": int(partial.sum()),
+            "skipped": int(len(sizes) - full.sum() - partial.sum()),
+        }
+        return combined, counts
+
+    def report_key(self, mask: Optional[np.ndarray] = None) -> str:
+        """
+        EDA cache key of the report for `mask` over this base frame.
+        """
+        return artifact_key("blocks", self.key, None if mask is None else np.packbits(mask).tobytes())
+
+    def insights(self, mask: Optional[np.ndarray] = None) -> Dict[str, Any]:
+        """
+        The insights dict of compute_eda_insights(base[mask]), plus the
+        "correlation" and "nullity_correlation" frames the plots are drawn from
+        and a "blocks" dict of reused/rescanned/skipped block counts.
+        """
+        profile, counts = self.combine(mask)
+        rows = profile.rows
+        stats: Dict[Any, Dict[str, Any]] = {}
+        moments = profile.moments
+        std, skew = moments.std(), moments.skew()
+        for i, col in enumerate(self.columns):
+            domain = self._domains[col]
+            table = _merge_tables(profile.tables[i], len(domain))
+            count = int(table.sum())
+            present = table > 0
+            if col in self._numeric_index:
+                j = self._numeric_index[col]
+                q25, q50, q75 = _table_quantiles(domain, table)
+                stats[col] = {
+                    "kind": "numeric",
+                    "count": float(count),
+                    "nulls": float(rows - count),
+                    "mean": float(moments.mean[j]) if count else np.nan,
+                    "std": float(std[j]),
+                    "min": float(moments.min[j]) if count else np.nan,
+                    "25%": q25,
+                    "50%": q50,
+                    "75%": q75,
+                    "max": float(moments.max[j]) if count else np.nan,
+                    "skew": float(skew[j]),
+                    "distinct": int(present.sum()),
+                }
+            elif col in self.categorical:
+                order = np.argsort(-table, kind="stable")[:TOP_K]
+                if col in self._codes and not isinstance(self.base[col].dtype, pd.CategoricalDtype):
+                    # Values of the base frame that the mask removed entirely are not in the filtered frame
+                    order = order[table[order] > 0]
+                stats[col] = {
+                    "kind": "categorical",
+                    "count": float(count),
+                    "nulls": float(rows - count),
+                    "distinct": int(present.sum()),
+                    "top": pd.Series(table[order], index=pd.Index(domain[order], name=col), name="count"),
+                }
+            else:
+                stats[col] = {
+                    "kind": "other",
+                    "count": float(count),
+                    "nulls": float(rows - count),
+                    "distinct": int(present.sum()),
+                }
+
+        insights = assemble_insights((rows, len(self.columns)), self.base.dtypes, stats)
+        insights["correlation"] = pd.DataFrame(profile.correlation.correlation(), index=self.cross, columns=self.cross)
+        nullity = pd.DataFrame(profile.nullity.correlation(), index=self.nullable, columns=self.nullable)
+        keep = [col for col in self.nullable if 0 < stats[col]["nulls"] < rows]
+        insights["nullity_correlation"] = nullity.loc[keep, keep]
+        insights["blocks"] = counts
+        return insights
+
+
+_lock = threading.Lock()
+_latest: Optional[Tuple[weakref.ref, int, BlockAggregates]] = None
+
+
+def aggregates_for(base: pd.DataFrame, block_rows: int = BLOCK_ROWS) -> BlockAggregates:
+    """
+    The BlockAggregates of `base`, built on first use and kept while `base` is
+    the most recently profiled frame (a new dataset replaces it).
+    """
+    global _latest
+    with _lock:
+        if _latest is not None and _latest[0]() is base and _latest[1] == block_rows:
+            return _latest[2]
+        aggregates = BlockAggregates(base, block_rows)
+        _latest = (weakref.ref(base), block_rows, aggregates)
+        return aggregates
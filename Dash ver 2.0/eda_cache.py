@@ -0,0 +1,251 @@
+import os
+import re
+import json
+import time
+import pickle
+import hashlib
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Bump whenever insights, plots or the report layout change, so stale artifacts are not served
+REPORT_VERSION = "2"
+MANIFEST_NAME = "eda_manifest.json"
+COLUMN_DIR = ".eda_columns"
+DEFAULT_MAX_MB = 512
+DEFAULT_MAX_AGE_DAYS = 30
+BLOCK_ROWS = 4096
+SAMPLE_ROWS = 4096
+# Report and plot files written by eda.run_eda; untracked ones are evicted by age and size too
+ARTIFACT_PATTERN = re.compile(r"^(eda_report|correlation_heatmap|missing_heatmap)_.+\.(html|png)$")
+
+
+def _digest(*parts: Any) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part if isinstance(part, bytes) else repr(part).encode("utf-8"))
+        digest.update(b"|")
+    return digest.hexdigest()
+
+
+def _sample_positions(rows: int) -> np.ndarray:
+    # First, middle and last blocks plus an evenly spaced sample across the column
+    middle = max(0, rows // 2 - BLOCK_ROWS // 2)
+    parts = [
+        np.arange(min(BLOCK_ROWS, rows)),
+        np.arange(middle, min(middle + BLOCK_ROWS, rows)),
+        np.arange(max(0, rows - BLOCK_ROWS), rows),
+        np.linspace(0, rows - 1, min(SAMPLE_ROWS, rows)).astype(np.int64),
+    ]
+    return np.unique(np.concatenate(parts))
+
+
+def column_fingerprint(series: pd.Series) -> Tuple[str, str]:
+    """
+    (values, nulls) fingerprints of one column.
+
+    The values fingerprint covers name, dtype, length, null count, a hashed
+    sample of first/middle/last blocks plus evenly spaced rows, and for numeric
+    columns the full sum. The nulls fingerprint hashes the complete bit-packed
+    null mask, so it is exact.
+    """
+    rows = len(series)
+    nulls = series.isna().to_numpy()
+    null_count = int(nulls.sum())
+    sample = series.iloc[_sample_positions(rows)]
+    parts = [series.name, str(series.dtype), rows, null_count, pd.util.hash_pandas_object(sample, index=False).to_numpy().tobytes()]
+    if pd.api.types.is_numeric_dtype(series.dtype) and not pd.api.types.is_bool_dtype(series.dtype):
+        parts.append(float(np.nansum(series.to_numpy(dtype="float64", na_value=np.nan))))
+    return _digest(*parts), _digest(rows, np.packbits(nulls).tobytes())
+
+
+def frame_fingerprint(df: pd.DataFrame) -> Tuple[str, Dict[Any, Tuple[str, str]]]:
+    """
+    Fingerprint of a whole frame (shape, dtypes, column fingerprints and the
+    report version) together with the per-column fingerprints.
+    """
+    columns = {col: column_fingerprint(df[col]) for col in df.columns}
+    key = _digest(REPORT_VERSION, df.shape, [(col, fp) for col, fp in columns.items()])
+    return key, columns
+
+
+def artifact_key(kind: str, *parts: Any) -> str:
+    """
+    Key for a derived artifact (a plot, a GPT summary) from whatever it depends on.
+    """
+    return _digest(REPORT_VERSION, kind, *parts)
+
+
+class EDACache:
+    """
+    Content-addressed cache of EDA artifacts in an output directory.
+
+    A manifest maps frame fingerprints to finished reports, plot keys to PNGs,
+    summary keys to GPT summaries, and column fingerprints to pickled per-column
+    statistics, so an unchanged frame returns its report immediately and a
+    partly changed one only recomputes the affected columns and plots.
+    Entries record when they were last used; `evict` drops files past the age
+    limit and then the least recently used ones until the directory fits the size limit.
+    """
+
+    def __init__(self, output_dir: str = "eda_reports", max_mb: float = DEFAULT_MAX_MB,
+                 max_age_days: float = DEFAULT_MAX_AGE_DAYS):
+        self.output_dir = output_dir
+        self.max_bytes = int(max_mb * 1024 ** 2)
+        self.max_age = max_age_days * 86400
+        self._manifest: Optional[Dict[str, Dict[str, Dict[str, Any]]]] = None
+
+    # ────────────── Manifest ──────────────
+
+    @property
+    def manifest_path(self) -> str:
+        return os.path.join(self.output_dir, MANIFEST_NAME)
+
+    @property
+    def manifest(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        if self._manifest is None:
+            manifest = None
+            try:
+                with open(self.manifest_path, "r", encoding="utf-8") as f:
+                    manifest = json.load(f)
+            except (OSError, ValueError):
+                pass
+            if not manifest or manifest.get("version") != REPORT_VERSION:
+                manifest = {"version": REPORT_VERSION}
+            for section in ("reports", "plots", "summaries", "columns"):
+                manifest.setdefault(section, {})
+            self._manifest = manifest
+        return self._manifest
+
+    def save(self) -> None:
+        os.makedirs(self.output_dir, exist_ok=True)
+        tmp_path = f"{self.manifest_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.manifest, f)
+        os.replace(tmp_path, self.manifest_path)
+
+    def _lookup(self, section: str, key: str) -> Optional[Dict[str, Any]]:
+        entry = self.manifest[section].get(key)
+        if entry is None:
+            return None
+        if "path" in entry and not os.path.exists(os.path.join(self.output_dir, entry["path"])):
+            del self.manifest[section][key]
+            return None
+        entry["used"] = time.time()
+        return entry
+
+    # ────────────── Artifacts ──────────────
+
+    def report(self, key: str) -> Optional[str]:
+        """
+        Path of a finished report for a frame fingerprint, if it still exists.
+        """
+        entry = self._lookup("reports", key)
+        return os.path.join(self.output_dir, entry["path"]) if entry else None
+
+    def store_report(self, key: str, path: str) -> None:
+        # Reports embed their plots, so they stand alone and are evicted on their own
+        self.manifest["reports"][key] = {"path": os.path.basename(path), "used": time.time()}
+
+    def plot(self, key: str) -> Optional[str]:
+        entry = self._lookup("plots", key)
+        return os.path.join(self.output_dir, entry["path"]) if entry else None
+
+    def store_plot(self, key: str, path: str) -> None:
+        self.manifest["plots"][key] = {"path": os.path.basename(path), "used": time.time()}
+
+    def summary(self, key: str) -> Optional[str]:
+        entry = self._lookup("summaries", key)
+        return entry["text"] if entry else None
+
+    def store_summary(self, key: str, text: str) -> None:
+        self.manifest["summaries"][key] = {"text": text, "used": time.time()}
+
+    def column_stats(self, fingerprints: Dict[Any, str]) -> Dict[Any, Dict[str, Any]]:
+        """
+        Cached statistics for the columns whose fingerprint is known; others are omitted.
+        """
+        found = {}
+        for col, fp in fingerprints.items():
+            entry = self._lookup("columns", fp)
+            if entry is None:
+                continue
+            try:
+                with open(os.path.join(self.output_dir, entry["path"]), "rb") as f:
+                    found[col] = pickle.load(f)
+            except Exception as e:
+                logging.warning(f"Dropping unreadable EDA column cache {entry['path']}: {e}")
+                del self.manifest["columns"][fp]
+        return found
+
+    def store_column_stats(self, fingerprints: Dict[Any, str], stats: Dict[Any, Dict[str, Any]]) -> None:
+        os.makedirs(os.path.join(self.output_dir, COLUMN_DIR), exist_ok=True)
+        for col, fp in fingerprints.items():
+            relative = os.path.join(COLUMN_DIR, f"{fp}.pkl")
+            try:
+                with open(os.path.join(self.output_dir, relative), "wb") as f:
+                    pickle.dump(stats[col], f, protocol=pickle.HIGHEST_PROTOCOL)
+            except Exception as e:
+                logging.warning(f"Could not cache EDA stats for column {col!r}: {e}")
+                continue
+            self.manifest["columns"][fp] = {"path": relative, "used": time.time()}
+
+    # ────────────── Eviction ──────────────
+
+    def _files(self) -> Dict[str, float]:
+        """
+        Every cache-managed file (relative path) with its last use time.
+        """
+        used: Dict[str, float] = {}
+
+        def mark(paths: Iterable[str], when: float) -> None:
+            for p in paths:
+                used[p] = max(used.get(p, 0.0), when)
+
+        for section in ("reports", "plots", "columns"):
+            for entry in self.manifest[section].values():
+                mark([entry["path"]], entry["used"])
+        if os.path.isdir(self.output_dir):
+            for name in os.listdir(self.output_dir):
+                if ARTIFACT_PATTERN.match(name) and name not in used:
+                    used[name] = os.path.getmtime(os.path.join(self.output_dir, name))
+        return used
+
+    def evict(self, now: Optional[float] = None) -> List[str]:
+        """
+        Delete artifacts unused for longer than the age limit, then the least
+        recently used ones until the directory fits the size limit. Returns the removed paths.
+        """
+        now = time.time() if now is None else now
+        files = self._files()
+        sizes = {}
+        for p in files:
+            try:
+                sizes[p] = os.path.getsize(os.path.join(self.output_dir, p))
+            except OSError:
+                sizes[p] = 0
+        total = sum(sizes.values())
+
+        removed = []
+        for p in sorted(files, key=files.get):
+            if now - files[p] <= self.max_age and total <= self.max_bytes:
+                break
+            total -= sizes[p]
+            removed.append(p)
+            try:
+                os.remove(os.path.join(self.output_dir, p))
+            except OSError:
+                pass
+
+        gone = set(removed)
+        for section in ("reports", "plots", "columns"):
+            for key, entry in list(self.manifest[section].items()):
+                if entry["path"] in gone:
+                    del self.manifest[section][key]
+        # Summaries are tiny and have no files; drop them by age only
+        for key, entry in list(self.manifest["summaries"].items()):
+            if now - entry["used"] > self.max_age:
+                del self.manifest["summaries"][key]
+        return [os.path.join(self.output_dir, p) for p in removed]
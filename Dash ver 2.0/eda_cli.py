@@ -0,0 +1,299 @@
+"""
+Headless batch EDA: one HTML report per CSV, plus an index page with per-file timings.
+
+Files are spread over a process pool; GPT summaries are limited to a few at a
+time across all workers. A file whose report is still current (same path,
+size, mtime and content hash) is skipped. PyQt5 is never imported.
+
+    python eda_cli.py data/*.csv --output-dir reports/nightly
+    python eda_cli.py data/ --jobs 8 --llm-concurrency 2
+    python eda_cli.py big.csv --no-summary --force
+"""
+
+import argparse
+import glob
+import hashlib
+import html
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from config import EDA_CACHE_MAX_AGE_DAYS, EDA_CACHE_MAX_MB
+from dataset_cache import cache_key
+from eda_cache import EDACache, artifact_key
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_OUTPUT_DIR = os.path.join("eda_reports", "batch")
+DEFAULT_LLM_CONCURRENCY = 2
+STAGES = ("load", "insights", "plots", "summary", "report")
+INDEX_JSON = "index.json"
+INDEX_HTML = "index.html"
+SKIPPED_SUMMARY = "<p>GPT summary skipped for this batch run.</p>"
+
+# Set in each worker by _init_worker
+_llm_slots = None
+
+
+def collect_csv_paths(inputs: List[str]) -> List[str]:
+    """
+    Expand files, directories (searched recursively) and glob patterns into CSV paths, without duplicates.
+    """
+    paths = []
+    for item in inputs:
+        if os.path.isdir(item):
+            matches = sorted(glob.glob(os.path.join(item, "**", "*.csv"), recursive=True))
+        else:
+            matches = sorted(glob.glob(item)) or [item]
+        paths.extend(os.path.abspath(p) for p in matches)
+    return list(dict.fromkeys(paths))
+
+
+def report_dir(output_dir: str, path: str) -> str:
+    # Same file name in different folders must not collide
+    digest = hashlib.blake2b(os.path.abspath(path).encode("utf-8"), digest_size=4).hexdigest()
+    return os.path.join(output_dir, f"{os.path.splitext(os.path.basename(path))[0]}-{digest}")
+
+
+def _init_worker(llm_slots) -> None:
+    global _llm_slots
+    _llm_slots = llm_slots
+    logging.basicConfig(level=logging.INFO)
+
+
+def _summary(full_summary: str) -> str:
+    from eda_report import request_gpt_summary
+
+    if _llm_slots is None:
+        return request_gpt_summary(full_summary)
+    with _llm_slots:
+        return request_gpt_summary(full_summary)
+
+
+def process_file(path: str, directory: str, key: str, summarize: bool = True, workers: int = 1) -> Dict[str, Any]:
+    """
+    load_csv_file → compute_eda_insights → save_eda_plots → generate_html_report
+    for one file, with the GPT summary requested while the plots render. Runs
+    in a pool worker; returns the file's index entry.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from helpers import load_csv_file
+    from eda_logic import compute_eda_insights
+    from eda_plots import save_eda_plots
+    from eda_report import generate_html_report, summarize_insights
+
+    timings: Dict[str, float] = {}
+    started = time.perf_counter()
+
+    def timed(stage: str, fn, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            timings[stage] = time.perf_counter() - start
+
+    df = timed("load", load_csv_file, path)
+    os.makedirs(directory, exist_ok=True)
+    insights = timed("insights", compute_eda_insights, df, workers=workers)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        summary_future = None
+        if summarize:
+            # Timed on its own thread: the request, including the wait for an LLM slot, overlaps the plots
+            summary_future = executor.submit(timed, "summary", _summary, summarize_insights(insights)["full"])
+        plots, _ = timed("plots", save_eda_plots, df, directory, workers=workers)
+        gpt_summary = summary_future.result() if summary_future is not None else SKIPPED_SUMMARY
+    report_path = timed("report", generate_html_report, insights, plots, directory, gpt_summary=gpt_summary)
+
+    summary_ok = not gpt_summary.startswith("⚠️")
+    cache = EDACache(directory, EDA_CACHE_MAX_MB, EDA_CACHE_MAX_AGE_DAYS)
+    if summary_ok:
+        # A report whose GPT summary failed is not reused, so the next run retries it
+        cache.store_report(key, report_path)
+    cache.evict()
+    cache.save()
+    return {
+        "path": path,
+        "status": "ok" if summary_ok else "no summary",
+        "report": report_path,
+        "rows": int(df.shape[0]),
+        "columns": int(df.shape[1]),
+        "timings": {**timings, "total": time.perf_counter() - started},
+        "finished": datetime.now().isoformat(timespec="seconds"),
+    }
+
+
+def cached_entry(path: str, directory: str, key: str, previous: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    The index entry of a still-current report, or None when the file needs a new one.
+    """
+    if not os.path.isdir(directory):
+        return None
+    cached = EDACache(directory).report(key)
+    if cached is None:
+        return None
+    entry = dict(previous or {"path": path, "timings": {}})
+    entry.update(status="cached", report=cached)
+    return entry
+
+
+def run_batch(paths: List[str], output_dir: str = DEFAULT_OUTPUT_DIR, jobs: int = 0,
+              llm_concurrency: int = DEFAULT_LLM_CONCURRENCY, summarize: bool = True,
+              force: bool = False, workers: int = 1) -> List[Dict[str, Any]]:
+    """
+    Write a report for every CSV in `paths` and the index pages; returns the index entries.
+
+    Parameters:
+        jobs (int): Files processed at once (0 = one per CPU).
+        llm_concurrency (int): GPT summaries requested at once across all jobs.
+        summarize (bool): Request GPT summaries at all.
+        force (bool): Rebuild reports that are still current.
+        workers (int): Processes per file for the column statistics and plots.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    previous = {entry["path"]: entry for entry in _read_index(output_dir)}
+    entries: Dict[str, Dict[str, Any]] = {}
+    pending = []
+    for path in paths:
+        directory = report_dir(output_dir, path)
+        try:
+            key = artifact_key("batch", cache_key(path), summarize)
+        except OSError as e:
+            entries[path] = {"path": path, "status": "error", "error": str(e), "timings": {}}
+            continue
+        entry = None if force else cached_entry(path, directory, key, previous.get(path))
+        if entry is not None:
+            logger.info(f"♻️ Report still current: {path}")
+            entries[path] = entry
+        else:
+            pending.append((path, directory, key))
+
+    if pending:
+        jobs = min(jobs or os.cpu_count() or 1, len(pending))
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+        llm_slots = context.BoundedSemaphore(max(1, llm_concurrency))
+        logger.info(f"⏳ Building {len(pending)} reports with {jobs} processes")
+        with ProcessPoolExecutor(jobs, mp_context=context, initializer=_init_worker, initargs=(llm_slots,)) as pool:
+            futures = {
+                pool.submit(process_file, path, directory, key, summarize, workers): path
+                for path, directory, key in pending
+            }
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    entries[path] = future.result()
+                    logger.info(f"✅ {path} ({entries[path]['timings']['total']:.2f}s)")
+                except BrokenProcessPool as e:
+                    entries[path] = {"path": path, "status": "error", "error": f"Worker process died: {e}", "timings": {}}
+                    logger.error(f"❌ {path}: worker process died")
+                except Exception as e:
+                    entries[path] = {"path": path, "status": "error", "error": str(e), "timings": {}}
+                    logger.error(f"❌ {path}: {e}")
+
+    ordered = [entries[path] for path in paths]
+    write_index(output_dir, ordered)
+    return ordered
+
+
+def _read_index(output_dir: str) -> List[Dict[str, Any]]:
+    try:
+        with open(os.path.join(output_dir, INDEX_JSON), "r", encoding="utf-8") as f:
+            return json.load(f).get("files", [])
+    except (OSError, ValueError):
+        return []
+
+
+def write_index(output_dir: str, entries: List[Dict[str, Any]]) -> str:
+    """
+    Write index.json and index.html (one row per file, linked to its report); returns the HTML path.
+    """
+    generated = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    with open(os.path.join(output_dir, INDEX_JSON), "w", encoding="utf-8") as f:
+        json.dump({"generated": generated, "files": entries}, f, indent=2)
+
+    rows = []
+    for entry in entries:
+        timings = entry.get("timings", {})
+        cells = "".join(
+            f"<td class='num'>{timings[stage]:.2f}</td>" if stage in timings else "<td></td>"
+            for stage in (*STAGES, "total")
+        )
+        name = html.escape(os.path.basename(entry["path"]))
+        if entry.get("report"):
+            link = os.path.relpath(entry["report"], output_dir).replace(os.sep, "/")
+            name = f"<a href='{html.escape(link)}'>{name}</a>"
+        status = html.escape(entry["status"])
+        if entry.get("error"):
+            status = f"<span title='{html.escape(entry['error'])}'>{status}</span>"
+        rows.append(
+            f"<tr class='{html.escape(entry['status'].replace(' ', '-'))}'><td title='{html.escape(entry['path'])}'>{name}</td>"
+            f"<td>{status}</td><td class='num'>{entry.get('rows', '')}</td><td class='num'>{entry.get('columns', '')}</td>{cells}</tr>"
+        )
+    counts = {status: sum(e["status"] == status for e in entries) for status in ("ok", "cached", "no summary", "error")}
+    totals = " · ".join(f"{count} {status}" for status, count in counts.items() if count)
+    headers = "".join(f"<th>{title}</th>" for title in ("File", "Status", "Rows", "Columns", *(s.title() for s in STAGES), "Total s"))
+    page = f"""<html>
+<head>
+    <meta charset='UTF-8'>
+    <title>Batch EDA - {generated}</title>
+    <style>
+        body {{ font-family: sans-serif; margin: 2em; }}
+        table {{ border-collapse: collapse; }}
+        th, td {{ border: 1px solid #ccc; padding: 4px 8px; }}
+        td.num {{ text-align: right; }}
+        tr.error {{ background: #fde2e2; }}
+        tr.no-summary {{ background: #fff4d6; }}
+        tr.cached {{ color: #666; }}
+    </style>
+</head>
+<body>
+<h1>📊 Batch EDA Reports</h1>
+<p><strong>Generated:</strong> {generated} · {len(entries)} files · {totals}</p>
+<p>Stage times in seconds. The summary overlaps the plots, so stages can add up to more than the total. Cached files show the timings of the run that built them.</p>
+<table>
+<tr>{headers}</tr>
+{chr(10).join(rows)}
+</table>
+</body>
+</html>
+"""
+    index_path = os.path.join(output_dir, INDEX_HTML)
+    with open(index_path, "w", encoding="utf-8") as f:
+        f.write(page)
+    return index_path
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("inputs", nargs="+", help="CSV files, directories or glob patterns")
+    parser.add_argument("--output-dir", default=DEFAULT_OUTPUT_DIR)
+    parser.add_argument("--jobs", type=int, default=0, help="files processed at once (0 = one per CPU)")
+    parser.add_argument("--llm-concurrency", type=int, default=DEFAULT_LLM_CONCURRENCY,
+                        help="GPT summaries requested at once across all jobs")
+    parser.add_argument("--workers", type=int, default=1, help="processes per file for statistics and plots")
+    parser.add_argument("--no-summary", action="store_true", help="do not call GPT")
+    parser.add_argument("--force", action="store_true", help="rebuild reports that are still current")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    paths = collect_csv_paths(args.inputs)
+    if not paths:
+        parser.error("no CSV files found")
+    entries = run_batch(
+        paths, args.output_dir, jobs=args.jobs, llm_concurrency=args.llm_concurrency,
+        summarize=not args.no_summary, force=args.force, workers=args.workers,
+    )
+    print(f"Index written to {os.path.join(args.output_dir, INDEX_HTML)}")
+    return 1 if any(entry["status"] == "error" for entry in entries) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,27 +1,13 @@
 import pandas as pd
 from typing import Dict, Any
 
-def compute_eda_insights(df: pd.DataFrame) -> Dict[str, Any]:
+from eda_stats import assemble_insights
+from parallel_eda import compute_column_stats_parallel
+
+def compute_eda_insights(df: pd.DataFrame, workers: int = 1) -> Dict[str, Any]:
     """
     Analyze the DataFrame and return key statistics and summaries for report generation.
+    All statistics come from one fused scan per column group (see eda_stats); with
+    `workers` other than 1 (0 = one per CPU) column blocks run on a process pool.
     """
-    return {
-        "shape": df.shape,
-        "columns": list(df.columns),
-        "types": {
-            "numerical": list(df.select_dtypes(include="number").columns),
-            "categorical": list(df.select_dtypes(include=["object", "category"]).columns),
-            "boolean": list(df.select_dtypes(include="bool").columns),
-            "datetime": list(df.select_dtypes(include="datetime").columns),
-        },
-        "describe": df.describe().T,
-        "missing": df.isnull().mean().sort_values(ascending=False),
-        "skew": df.select_dtypes(include="number").skew(),
-        "cardinality": {
-            col: df[col].nunique() for col in df.select_dtypes(include=["object", "category"])
-        },
-        "constant_cols": [col for col in df.columns if df[col].nunique() == 1],
-        "top_categories": {
-            col: df[col].value_counts().head() for col in df.select_dtypes(include="object").columns[:3]
-        },
-    }
+    return assemble_insights(df.shape, df.dtypes, compute_column_stats_parallel(df, workers))
@@ -1,47 +1,245 @@
+import logging
+import multiprocessing
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
-from typing import Dict
+from typing import Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import seaborn as sns
-import missingno as msno
 
-def save_eda_plots(df: pd.DataFrame, output_dir: str) -> Dict[str, str]:
+logger = logging.getLogger(__name__)
+
+# Heatmaps keep at most this many columns (the most variable ones); smaller inputs are drawn unchanged
+MAX_HEATMAP_COLUMNS = 30
+# One process per figure
+PLOT_WORKERS = 2
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+def _nullity_label(value: float):
+    # Same label shortening as missingno.heatmap
+    if 0.95 <= value < 1:
+        return '<1'
+    if -1 < value <= -0.95:
+        return '>-1'
+    if value == 1:
+        return '1'
+    if value == -1:
+        return '-1'
+    if -0.05 < value < 0.05:
+        return ''
+    return round(value, 1)
+
+
+def save_correlation_heatmap(corr: pd.DataFrame, path: str) -> None:
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
+    sns.heatmap(corr, annot=True, cmap='coolwarm', fmt=".2f", linewidths=0.5, ax=ax)
+    ax.set_title("Correlation Matrix")
+    fig.tight_layout()
+    fig.savefig(path)
+
+
+def save_nullity_heatmap(nullity_corr: pd.DataFrame, path: str, fontsize: int = 12) -> None:
+    """
+    Draw a precomputed nullity correlation matrix the way missingno.heatmap does,
+    so it can be plotted without the underlying DataFrame.
+    """
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
+    mask = np.zeros_like(nullity_corr)
+    mask[np.triu_indices_from(mask)] = True
+    sns.heatmap(nullity_corr, mask=mask, cmap='RdBu', ax=ax, cbar=True,
+                annot=True, annot_kws={'size': fontsize - 2}, vmin=-1, vmax=1)
+    ax.xaxis.tick_bottom()
+    ax.set_xticklabels(ax.xaxis.get_majorticklabels(), rotation=45, ha='right', fontsize=fontsize)
+    ax.set_yticklabels(ax.yaxis.get_majorticklabels(), rotation=0, fontsize=fontsize)
+    ax.xaxis.set_ticks_position('none')
+    ax.yaxis.set_ticks_position('none')
+    ax.patch.set_visible(False)
+    for text in ax.texts:
+        text.set_text(_nullity_label(float(text.get_text())))
+    ax.set_title("Missing Values Heatmap")
+    fig.tight_layout()
+    fig.savefig(path)
+
+
+def top_columns(scores: pd.Series, limit: int = MAX_HEATMAP_COLUMNS) -> List:
+    """
+    The `limit` highest-scoring labels of `scores`, in their original order.
+    """
+    if len(scores) <= limit:
+        return list(scores.index)
+    chosen = set(scores.nlargest(limit).index)
+    return [col for col in scores.index if col in chosen]
+
+
+def _popcount(words: np.ndarray) -> np.ndarray:
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(words)
+    table = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+    return table[words.view(np.uint8)].reshape(*words.shape, 8).sum(axis=-1)
+
+
+def nullity_correlation(df: pd.DataFrame, limit: int = MAX_HEATMAP_COLUMNS) -> pd.DataFrame:
     """
-    Generate and save EDA plots (correlation heatmap, missing value heatmap),
-    returning a dictionary with their file paths.
+    Pearson correlation of the columns' null indicators, as missingno.heatmap plots it,
+    computed from bit-packed null masks: 1 bit per cell instead of an 8-byte float.
+
+    Complete and empty columns are dropped (as missingno does); beyond `limit`
+    columns only those with the most variable nullity are kept.
+    """
+    rows = len(df)
+    counts = pd.Series([int(df[col].isna().sum()) for col in df.columns], index=df.columns, dtype="int64")
+    counts = counts[(counts > 0) & (counts < rows)]
+    columns = top_columns(counts * (rows - counts), limit)
+
+    words = -(-rows // 64)
+    packed = np.zeros((len(columns), words * 8), dtype=np.uint8)
+    for i, col in enumerate(columns):
+        bits = np.packbits(df[col].isna().to_numpy())
+        packed[i, :len(bits)] = bits
+    packed = packed.view(np.uint64)
+
+    both = np.empty((len(columns), len(columns)))
+    for i in range(len(columns)):
+        both[i, i:] = _popcount(packed[i:] & packed[i]).sum(axis=1)
+        both[i:, i] = both[i, i:]
+    nulls = counts[columns].to_numpy(dtype=float)
+    corr = (rows * both - np.outer(nulls, nulls)) / np.sqrt(np.outer(nulls * (rows - nulls), nulls * (rows - nulls)))
+    return pd.DataFrame(corr, index=columns, columns=columns)
+
+
+def _render(kind: str, matrix: pd.DataFrame, path: str) -> float:
+    start = time.perf_counter()
+    draw = save_correlation_heatmap if kind == "correlation" else save_nullity_heatmap
+    draw(matrix, path)
+    return time.perf_counter() - start
+
+
+def _init_worker() -> None:
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    # Kept between reports; not forked because the caller is usually a GUI process with live threads
+    global _pool
+    if _pool is None:
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+        _pool = ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_init_worker)
+    return _pool
+
+
+def _render_all(
+    jobs: Dict[str, Tuple[pd.DataFrame, str]], workers: int, timings: Dict[str, float]
+) -> Dict[str, str]:
+    """
+    Render {kind: (matrix, path)} jobs, each in its own worker process when
+    workers > 1, and record each figure's render time in `timings`.
+    """
+    global _pool
+    labels = {"correlation": "correlation heatmap", "missing": "missing heatmap"}
+    paths = {}
+    futures = {}
+    if workers > 1 and len(jobs) > 1:
+        try:
+            pool = _get_pool(workers)
+            futures = {kind: pool.submit(_render, kind, matrix, path) for kind, (matrix, path) in jobs.items()}
+        except (BrokenProcessPool, OSError) as e:
+            logger.warning(f"Plot workers unavailable ({e}); rendering in process")
+            _pool = None
+
+    for kind, (matrix, path) in jobs.items():
+        try:
+            try:
+                timings[kind] = futures[kind].result() if kind in futures else _render(kind, matrix, path)
+            except BrokenProcessPool:
+                _pool = None
+                timings[kind] = _render(kind, matrix, path)
+            paths[kind] = path
+        except Exception as e:
+            print(f"❌ Failed to generate {labels[kind]}: {e}")
+    return paths
+
+
+def save_matrix_plots(
+    correlation: Optional[pd.DataFrame],
+    nullity_correlation: Optional[pd.DataFrame],
+    output_dir: str,
+    workers: int = PLOT_WORKERS,
+) -> Tuple[Dict[str, str], Dict[str, float]]:
+    """
+    Save the EDA heatmaps from precomputed matrices (e.g. from streaming sketches).
+    Returns (paths, timings) like save_eda_plots.
     """
     os.makedirs(output_dir, exist_ok=True)
     timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    paths = {}
+    jobs = {}
+    if correlation is not None and correlation.shape[1] >= 2:
+        jobs["correlation"] = (correlation, os.path.join(output_dir, f"correlation_heatmap_{timestamp}.png"))
+    if nullity_correlation is not None and not nullity_correlation.empty:
+        jobs["missing"] = (nullity_correlation, os.path.join(output_dir, f"missing_heatmap_{timestamp}.png"))
+    timings: Dict[str, float] = {}
+    paths = _render_all(jobs, workers, timings)
+    return paths, timings
+
+
+def save_eda_plots(
+    df: pd.DataFrame,
+    output_dir: str,
+    workers: int = PLOT_WORKERS,
+    max_columns: int = MAX_HEATMAP_COLUMNS,
+    kinds: Sequence[str] = ("correlation", "missing"),
+) -> Tuple[Dict[str, str], Dict[str, float]]:
+    """
+    Generate and save EDA plots (correlation heatmap, missing value heatmap).
+
+    Only the matrices are computed here: the correlation over at most `max_columns`
+    highest-variance numeric columns, and the nullity correlation from bit-packed
+    null masks. Each figure is then drawn in its own Agg worker process (when
+    `workers` > 1) and only the matrix is sent to it. Inputs within the column cap
+    produce the same images as plotting the full frame. `kinds` limits which
+    plots are produced.
+
+    Returns:
+        (paths, timings): file path per plot, and seconds spent per stage
+        ("correlation_matrix", "nullity_matrix", "correlation", "missing").
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    timings: Dict[str, float] = {}
+    jobs = {}
 
     numeric = df.select_dtypes(include="number")
 
-    if numeric.shape[1] >= 2:
+    if "correlation" in kinds and numeric.shape[1] >= 2:
         try:
+            start = time.perf_counter()
+            if numeric.shape[1] > max_columns:
+                numeric = numeric[top_columns(numeric.var(), max_columns)]
             corr = numeric.corr()
-            plt.figure(figsize=(10, 6))
-            sns.heatmap(corr, annot=True, cmap='coolwarm', fmt=".2f", linewidths=0.5)
-            plt.title("Correlation Matrix")
-            plt.tight_layout()
-            corr_path = os.path.join(output_dir, f"correlation_heatmap_{timestamp}.png")
-            plt.savefig(corr_path)
-            plt.close()
-            paths["correlation"] = corr_path
+            timings["correlation_matrix"] = time.perf_counter() - start
+            jobs["correlation"] = (corr, os.path.join(output_dir, f"correlation_heatmap_{timestamp}.png"))
         except Exception as e:
             print(f"❌ Failed to generate correlation heatmap: {e}")
 
-    if df.isnull().values.any():
+    if "missing" in kinds:
         try:
-            msno.heatmap(df, figsize=(10, 6), fontsize=12)
-            plt.title("Missing Values Heatmap")
-            plt.tight_layout()
-            miss_path = os.path.join(output_dir, f"missing_heatmap_{timestamp}.png")
-            plt.savefig(miss_path)
-            plt.close()
-            paths["missing"] = miss_path
+            start = time.perf_counter()
+            nullity = nullity_correlation(df, max_columns)
+            timings["nullity_matrix"] = time.perf_counter() - start
+            if not nullity.empty:
+                jobs["missing"] = (nullity, os.path.join(output_dir, f"missing_heatmap_{timestamp}.png"))
         except Exception as e:
             print(f"❌ Failed to generate missing heatmap: {e}")
 
-    return paths
+    paths = _render_all(jobs, workers, timings)
+    return paths, timings
@@ -1,15 +1,24 @@
 import os
+import io
 import re
 import html
+import base64
+import logging
 from datetime import datetime
-from typing import Dict
-from gpt_handler import client, AZURE_DEPLOYMENT
+from string import Template
+from typing import Any, Dict, Iterator, Optional
 
-def generate_html_report(insights: dict, images: Dict[str, str], output_dir: str) -> str:
-    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    report_path = os.path.join(output_dir, f"eda_report_{timestamp}.html")
+import numpy as np
+import pandas as pd
+
+from gpt_handler import chat_completion
+
+logger = logging.getLogger(__name__)
 
-    # 🧠 Compose the GPT prompt
+def summarize_insights(insights: dict) -> Dict[str, str]:
+    """
+    Render the insights as the text sections used both in the GPT prompt and in the report.
+    """
     type_summary = (
         f"Numerical: {', '.join(insights['types']['numerical'])}\n"
         f"Categorical: {', '.join(insights['types']['categorical'])}\n"
@@ -48,68 +57,95 @@ def generate_html_report(insights: dict, images: Dict[str, str], output_dir: str
     cat_preview = "\n\n".join([f"{k}:\n{v.to_string()}" for k, v in insights['top_categories'].items()])
     summary_parts.append("Top Categorical Values:\n" + cat_preview)
 
-    full_summary = "\n\n".join(summary_parts)
+    # Present only for sketch-based (approximate) insights
+    approximation = "\n".join(f"{k}: {v}" for k, v in insights.get('approximate', {}).items())
+    if approximation:
+        summary_parts.append("Approximate Statistics (error bounds):\n" + approximation)
 
+    return {
+        "type_summary": type_summary,
+        "cardinality": cardinality,
+        "missing": missing_txt,
+        "skew": skew_txt,
+        "top_categories": cat_preview,
+        "approximation": approximation,
+        "full": "\n\n".join(summary_parts),
+    }
+
+
+def request_gpt_summary(full_summary: str) -> str:
+    """
+    Ask GPT for a short HTML description of the dataset. Never raises; failures
+    are returned as a message so the report can still be written.
+    """
     try:
-        gpt_response = client.chat.completions.create(
-            model=AZURE_DEPLOYMENT,
-            messages=[
-                {"role": "system", "content": "You are a professional data analyst, writing a short summary. Infer concise insights, don't repeat the stats. Use HTML tags only."},
-                {"role": "user", "content": full_summary}
-            ]
-        )
-        raw_summary = gpt_response.choices[0].message.content.strip()
-        gpt_summary = re.sub(r"^```(?:html)?|```$", "", raw_summary).strip()
+        raw_summary = chat_completion(
+            "You are a professional data analyst, writing a short summary. Infer concise insights, don't repeat the stats. Use HTML tags only.",
+            full_summary,
+        ).strip()
+        return re.sub(r"^```(?:html)?|```$", "", raw_summary).strip()
     except Exception as e:
-        gpt_summary = f"⚠️ Failed to generate GPT summary: {e}"
+        return f"⚠️ Failed to generate GPT summary: {e}"
 
-    html_content = f"""<html>
+
+STYLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "styles", "eda_report_style.css")
+# Rows per page of the report tables; longer tables get a pager
+TABLE_PAGE_ROWS = 50
+# "webp" and "inline" embed the plots so the report can be moved or mailed; "lazy" links the files next to it
+IMAGE_MODES = ("webp", "inline", "lazy")
+SUMMARY_RELOAD_SECONDS = 3
+PENDING_SUMMARY = "<p class='summary-pending'>⏳ GPT is writing the dataset description…</p>"
+
+_PAGE_HEAD = Template("""<html$pending>
 <head>
     <meta charset='UTF-8'>
-    <meta name=\"viewport\" content=\"width=device-width, initial-scale=1.0\">
-    <title>Smart EDA Report - {timestamp}</title>
-    <link rel=\"stylesheet\" type=\"text/css\" href=\"eda_report_style.css\">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Smart EDA Report - $timestamp</title>
+    <style>
+$style
+    </style>
     <script>
-        function toggleSection(id) {{
+        function toggleSection(id) {
             const el = document.getElementById(id);
             el.style.display = (el.style.display === 'none') ? 'block' : 'none';
-        }}
+        }
+        function showPage(id, step) {
+            const table = document.getElementById(id);
+            const pages = table.tBodies;
+            let current = Number(table.dataset.page || 0);
+            pages[current].hidden = true;
+            current = Math.min(Math.max(current + step, 0), pages.length - 1);
+            pages[current].hidden = false;
+            table.dataset.page = current;
+            document.getElementById(id + '-page').textContent = (current + 1) + ' / ' + pages.length;
+        }
+        // Reload until the GPT summary has been written into this file
+        if (document.documentElement.dataset.summaryPending) {
+            setTimeout(() => location.reload(), $reload_ms);
+        }
     </script>
 </head>
 <body>
 <h1>📊 Smart EDA Report</h1>
-<p><strong>Generated:</strong> {timestamp}</p>
+<p><strong>Generated:</strong> $timestamp</p>
 <hr>
 <div>
     <h2>📄 Dataset Description (Generated by GPT)</h2>
-    <div class=\"gpt-summary-box\">
-    {gpt_summary}
+    <div class="gpt-summary-box">
+    <!--gpt-summary-->$summary<!--/gpt-summary-->
     </div>
 </div>
 <hr>
-"""
-
-    def add_section(title, content, section_id):
-        nonlocal html_content
-        html_content += f"<h2 class='section-toggle' onclick=\"toggleSection('{section_id}')\">{title}</h2>"
-        html_content += f"<div id='{section_id}' class='section-content'><pre>{html.escape(content)}</pre></div>"
-
-    add_section("🔎 Data Overview", f"Shape: {insights['shape']}\nColumns: {insights['columns']}", "overview")
-    add_section("🧪 Data Types", type_summary, "types")
-    if insights['constant_cols']:
-        add_section("⚠️ Constant Columns", ", ".join(insights['constant_cols']), "constants")
-    add_section("🔠 Cardinality", cardinality, "cardinality")
-    add_section("🧩 Missing Values", missing_txt, "missing")
-    add_section("📈 Skewness", skew_txt, "skewness")
-    add_section("📋 Numerical Summary", insights['describe'].to_string(), "describe")
-    add_section("📂 Top Categorical Values", cat_preview, "topcats")
-
-    if "correlation" in images:
-        html_content += f"<h2>🔗 Correlation Matrix</h2><img src='{os.path.basename(images['correlation'])}' />"
-    if "missing" in images:
-        html_content += f"<h2>📉 Missing Value Heatmap</h2><img src='{os.path.basename(images['missing'])}' />"
-
-    html_content += """
+""")
+_SECTION = Template("""<h2 class='section-toggle' onclick="toggleSection('$id')">$title</h2>
+<div id='$id' class='section-content'>$body</div>
+""")
+_PAGER = Template("""<div class='pager'><button onclick="showPage('$id', -1)">◀</button>
+<span id='$id-page'>1 / $pages</span><button onclick="showPage('$id', 1)">▶</button></div>
+""")
+_IMAGE = Template("""<h2>$title</h2><img src='$src' alt='$title' loading='lazy' decoding='async' />
+""")
+_PAGE_TAIL = """
     <hr>
     <div style='text-align: right;'>
         <button class='back-to-top' onclick="window.scrollTo({ top: 0, behavior: 'smooth' })">⬆️ Back to Top</button>
@@ -119,7 +155,190 @@ def generate_html_report(insights: dict, images: Dict[str, str], output_dir: str
 </html>
 """
 
+_style: Optional[str] = None
+
+
+def _report_style() -> str:
+    # Inlined so the report does not depend on a stylesheet next to it
+    global _style
+    if _style is None:
+        try:
+            with open(STYLE_PATH, encoding="utf-8") as f:
+                _style = f.read()
+        except OSError:
+            _style = ""
+    return _style
+
+
+def _cell(value: Any) -> str:
+    if isinstance(value, (float, np.floating)):
+        return "" if np.isnan(value) else f"{value:,.6g}"
+    if isinstance(value, (int, np.integer)) and not isinstance(value, (bool, np.bool_)):
+        return f"{value:,}"
+    return html.escape(str(value))
+
+
+def html_table(frame: pd.DataFrame, table_id: str, page_rows: int = TABLE_PAGE_ROWS) -> str:
+    """
+    Render `frame` (index as the first column) as an HTML table, split into
+    pages of `page_rows` rows that a pager flips through.
+    """
+    header = "".join(f"<th>{html.escape(str(col))}</th>" for col in [frame.index.name or ""] + list(frame.columns))
+    rows = [
+        "<tr><th>" + html.escape(str(label)) + "</th>" + "".join(f"<td>{_cell(v)}</td>" for v in values) + "</tr>"
+        for label, values in zip(frame.index, frame.itertuples(index=False, name=None))
+    ]
+    pages = [rows[i:i + page_rows] for i in range(0, len(rows), page_rows)] or [[]]
+    bodies = "".join(
+        f"<tbody{' hidden' if i else ''}>{''.join(page)}</tbody>" for i, page in enumerate(pages)
+    )
+    table = f"<table id='{table_id}' class='report-table'><thead><tr>{header}</tr></thead>{bodies}</table>"
+    if len(pages) > 1:
+        table = _PAGER.substitute(id=table_id, pages=len(pages)) + table
+    return f"<div class='table-wrap'>{table}</div>"
+
+
+def _paragraph(text: str) -> str:
+    return f"<p>{html.escape(text)}</p>"
+
+
+def _image_src(path: str, mode: str) -> str:
+    if mode == "lazy":
+        return html.escape(os.path.basename(path))
+    with open(path, "rb") as f:
+        data, mime = f.read(), "image/png"
+    if mode == "webp":
+        try:
+            from PIL import Image
+
+            buffer = io.BytesIO()
+            with Image.open(io.BytesIO(data)) as image:
+                image.save(buffer, format="WEBP", quality=85, method=4)
+            if buffer.tell() < len(data):
+                data, mime = buffer.getvalue(), "image/webp"
+        except Exception as e:  # Pillow missing or built without WebP: keep the PNG
+            logger.debug(f"WebP conversion skipped: {e}")
+    return f"data:{mime};base64,{base64.b64encode(data).decode('ascii')}"
+
+
+def _sections(insights: dict) -> Iterator[str]:
+    """
+    The report sections in page order, each rendered as soon as it is needed.
+    """
+    rows, columns = insights["shape"]
+    yield _SECTION.substitute(
+        id="overview", title="🔎 Data Overview",
+        body=html_table(pd.DataFrame({"Value": [rows, columns]}, index=pd.Index(["Rows", "Columns"])), "overview-table"),
+    )
+    types = pd.DataFrame(
+        {"Columns": [", ".join(map(str, cols)) or "—" for cols in insights["types"].values()]},
+        index=pd.Index([group.capitalize() for group in insights["types"]], name="Type"),
+    )
+    yield _SECTION.substitute(id="types", title="🧪 Data Types", body=html_table(types, "types-table"))
+    if insights["constant_cols"]:
+        yield _SECTION.substitute(
+            id="constants", title="⚠️ Constant Columns", body=_paragraph(", ".join(map(str, insights["constant_cols"])))
+        )
+
+    cardinality = pd.DataFrame(
+        {
+            "Unique": list(insights["cardinality"].values()),
+            "": ["⚠️" if v > 50 else "" for v in insights["cardinality"].values()],
+        },
+        index=pd.Index(list(insights["cardinality"]), name="Column"),
+    )
+    yield _SECTION.substitute(id="cardinality", title="🔠 Cardinality", body=html_table(cardinality, "cardinality-table"))
+
+    missing = insights["missing"][insights["missing"] > 0]
+    body = (
+        html_table(missing.map(lambda x: f"{x:.1%}").rename("Missing").rename_axis("Column").to_frame(), "missing-table")
+        if len(missing) else _paragraph("✅ No missing values")
+    )
+    yield _SECTION.substitute(id="missing", title="🧩 Missing Values", body=body)
+
+    skewed = insights["skew"][abs(insights["skew"]) > 1]
+    body = (
+        html_table(skewed.rename("Skew").rename_axis("Column").to_frame(), "skew-table")
+        if len(skewed) else _paragraph("✅ No highly skewed columns.")
+    )
+    yield _SECTION.substitute(id="skewness", title="📈 Skewness", body=body)
+
+    yield _SECTION.substitute(
+        id="describe", title="📋 Numerical Summary", body=html_table(insights["describe"], "describe-table")
+    )
+    top = "".join(
+        f"<h3>{html.escape(str(col))}</h3>" + html_table(values.rename("Count").to_frame(), f"top-{i}")
+        for i, (col, values) in enumerate(insights["top_categories"].items())
+    )
+    yield _SECTION.substitute(id="topcats", title="📂 Top Categorical Values", body=top)
+
+    approximate = insights.get("approximate", {})
+    if approximate:
+        bounds = pd.DataFrame({"Error bound": list(approximate.values())}, index=pd.Index(list(approximate), name="Statistic"))
+        yield _SECTION.substitute(
+            id="approximation", title="≈ Approximation Error Bounds", body=html_table(bounds, "approximation-table")
+        )
+
+
+def generate_html_report(
+    insights: dict,
+    images: Dict[str, str],
+    output_dir: str,
+    gpt_summary: Optional[str] = None,
+    image_mode: str = "webp",
+    summary_pending: bool = False,
+) -> str:
+    """
+    Write the HTML report, streaming each section to the file as it is rendered.
+
+    Pass `gpt_summary` when it was requested separately (e.g. concurrently with
+    plotting); otherwise GPT is called here. With `summary_pending` the page is
+    written at once with a placeholder that fill_gpt_summary replaces later,
+    and an open page reloads itself until then. Plots are embedded per
+    `image_mode` (see IMAGE_MODES) and the stylesheet is inlined.
+    """
+    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    report_path = os.path.join(output_dir, f"eda_report_{timestamp}.html")
+
+    if summary_pending:
+        gpt_summary = PENDING_SUMMARY
+    elif gpt_summary is None:
+        gpt_summary = request_gpt_summary(summarize_insights(insights)["full"])
+
     with open(report_path, "w", encoding="utf-8") as f:
-        f.write(html_content)
+        f.write(_PAGE_HEAD.substitute(
+            pending=" data-summary-pending='1'" if summary_pending else "",
+            timestamp=timestamp,
+            style=_report_style(),
+            reload_ms=SUMMARY_RELOAD_SECONDS * 1000,
+            summary=gpt_summary,
+        ))
+        for section in _sections(insights):
+            f.write(section)
+        for kind, title in (("correlation", "🔗 Correlation Matrix"), ("missing", "📉 Missing Value Heatmap")):
+            if kind in images:
+                f.write(_IMAGE.substitute(title=title, src=_image_src(images[kind], image_mode)))
+        f.write(_PAGE_TAIL)
+
+    return report_path
+
 
-    return report_path
\ No newline at end of file
+def fill_gpt_summary(report_path: str, gpt_summary: str) -> None:
+    """
+    Replace the placeholder of a report written with `summary_pending` by the
+    GPT summary. The file is swapped in atomically, so an open page reloading
+    itself never sees it half written.
+    """
+    with open(report_path, encoding="utf-8") as f:
+        content = f.read()
+    content = re.sub(
+        r"<!--gpt-summary-->.*?<!--/gpt-summary-->",
+        lambda _: f"<!--gpt-summary-->{gpt_summary}<!--/gpt-summary-->",
+        content,
+        count=1,
+        flags=re.S,
+    ).replace("<html data-summary-pending='1'>", "<html>", 1)
+    partial = report_path + ".part"
+    with open(partial, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.replace(partial, report_path)
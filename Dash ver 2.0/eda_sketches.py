@@ -0,0 +1,423 @@
+import os
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from eda_stats import TOP_K, assemble_insights, column_groups
+from type_inference import NA_VALUES, apply_plan, infer_csv_types
+
+CHUNK_ROWS = 200_000
+HLL_PRECISION = 14
+KLL_K = 400
+TOP_K_CAPACITY = 256
+
+ProgressCallback = Callable[[float, str], None]
+
+
+# ────────────── Sketches ──────────────
+
+class HyperLogLog:
+    """
+    Mergeable distinct-count sketch over 64-bit hashes. Relative error ≈ 1.04 / sqrt(2^p).
+    """
+
+    def __init__(self, precision: int = HLL_PRECISION):
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    @property
+    def relative_error(self) -> float:
+        return 1.04 / np.sqrt(len(self.registers))
+
+    def update_hashes(self, hashes: np.ndarray) -> None:
+        if not len(hashes):
+            return
+        bits = 64 - self.precision
+        index = (hashes >> np.uint64(bits)).astype(np.intp)
+        rest = hashes & np.uint64((1 << bits) - 1)
+        # Rank = position of the leftmost 1-bit in the remaining bits (exact: rest < 2^53)
+        rank = np.full(len(hashes), bits + 1, dtype=np.uint8)
+        nonzero = rest != 0
+        rank[nonzero] = bits - np.floor(np.log2(rest[nonzero].astype(np.float64))).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def merge(self, other: "HyperLogLog") -> None:
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def estimate(self) -> int:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(int)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and zeros:
+            return int(round(m * np.log(m / zeros)))
+        return int(round(raw))
+
+
+class QuantileSketch:
+    """
+    KLL-style compactor hierarchy. Items at level h stand for 2^h values; a level
+    over capacity is sorted and every other item is promoted. Rank error is
+    within about ±3 / k in practice, independent of the number of values.
+    """
+
+    def __init__(self, k: int = KLL_K, seed: int = 0):
+        self.k = k
+        self.levels: List[np.ndarray] = [np.empty(0)]
+        self.count = 0
+        self._rng = np.random.default_rng(seed)
+
+    @property
+    def rank_error(self) -> float:
+        return 3.0 / self.k
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return max(2, int(np.ceil(self.k * (2 / 3) ** depth)))
+
+    def update(self, values: np.ndarray) -> None:
+        values = values[~np.isnan(values)]
+        if not len(values):
+            return
+        self.count += len(values)
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+
+    def merge(self, other: "QuantileSketch") -> None:
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.count += other.count
+        self._compress()
+
+    def _compress(self) -> None:
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                items = np.sort(items)
+                keep = items[-1:] if len(items) % 2 else items[:0]
+                pairs = items[:len(items) - len(keep)]
+                promoted = pairs[self._rng.integers(2)::2]
+                self.levels[level] = keep
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            level += 1
+
+    def quantiles(self, qs) -> np.ndarray:
+        if not self.count:
+            return np.full(len(qs), np.nan)
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(lv), 2.0 ** h) for h, lv in enumerate(self.levels)])
+        order = np.argsort(items, kind="stable")
+        items, cumulative = items[order], np.cumsum(weights[order])
+        targets = np.asarray(qs) * cumulative[-1]
+        return items[np.minimum(np.searchsorted(cumulative, targets, side="left"), len(items) - 1)]
+
+
+class TopKSketch:
+    """
+    Misra-Gries heavy hitters. Every reported count is at most `error` below the
+    true count, and `error` never exceeds total / (capacity + 1).
+    """
+
+    def __init__(self, capacity: int = TOP_K_CAPACITY):
+        self.capacity = capacity
+        self.counts = pd.Series(dtype="int64")
+        self.total = 0
+        self.error = 0
+
+    def update_counts(self, counts: pd.Series) -> None:
+        """
+        Fold exact counts (e.g. one chunk's value_counts) into the summary.
+        """
+        self.total += int(counts.sum())
+        merged = self.counts.add(counts.astype("int64"), fill_value=0) if len(self.counts) else counts.astype("int64")
+        if len(merged) > self.capacity:
+            threshold = int(merged.nlargest(self.capacity + 1).iloc[-1])
+            self.error += threshold
+            merged = merged[merged > threshold] - threshold
+        self.counts = merged.astype("int64")
+
+    def merge(self, other: "TopKSketch") -> None:
+        total = self.total + other.total
+        self.error += other.error
+        self.update_counts(other.counts)
+        self.total = total
+
+    def top(self, k: int = TOP_K, name: Any = None) -> pd.Series:
+        top = self.counts.sort_values(ascending=False, kind="stable").head(k)
+        return pd.Series(top.to_numpy(), index=pd.Index(top.index, name=name), name="count", dtype="int64")
+
+
+class MomentSketch:
+    """
+    Count, mean and central moments M2/M3 for many columns at once, merged with
+    the parallel (Chan/Pébay) update so results match a single exact pass.
+    """
+
+    def __init__(self, width: int):
+        self.count = np.zeros(width)
+        self.mean = np.zeros(width)
+        self.m2 = np.zeros(width)
+        self.m3 = np.zeros(width)
+        self.min = np.full(width, np.inf)
+        self.max = np.full(width, -np.inf)
+
+    def update(self, values: np.ndarray) -> None:
+        valid = ~np.isnan(values)
+        count = valid.sum(axis=0).astype(float)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.where(count > 0, np.where(valid, values, 0.0).sum(axis=0) / count, 0.0)
+            centered = np.where(valid, values - mean, 0.0)
+            squared = centered * centered
+            m2 = squared.sum(axis=0)
+            m3 = (squared * centered).sum(axis=0)
+        self.min = np.fmin(self.min, np.nanmin(np.where(valid, values, np.inf), axis=0))
+        self.max = np.fmax(self.max, np.nanmax(np.where(valid, values, -np.inf), axis=0))
+        self._combine(count, mean, m2, m3)
+
+    def _combine(self, nb, mb, m2b, m3b) -> None:
+        na, ma, m2a, m3a = self.count, self.mean, self.m2, self.m3
+        n = na + nb
+        with np.errstate(invalid="ignore", divide="ignore"):
+            delta = mb - ma
+            mean = np.where(n > 0, ma + delta * nb / n, 0.0)
+            m2 = np.where(n > 0, m2a + m2b + delta ** 2 * na * nb / n, 0.0)
+            m3 = np.where(
+                n > 0,
+                m3a + m3b + delta ** 3 * na * nb * (na - nb) / n ** 2 + 3 * delta * (na * m2b - nb * m2a) / n,
+                0.0,
+            )
+        self.count, self.mean, self.m2, self.m3 = n, mean, m2, m3
+
+    def merge(self, other: "MomentSketch") -> None:
+        self.min = np.fmin(self.min, other.min)
+        self.max = np.fmax(self.max, other.max)
+        self._combine(other.count, other.mean, other.m2, other.m3)
+
+    def std(self) -> np.ndarray:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(self.count > 1, np.sqrt(self.m2 / (self.count - 1)), np.nan)
+
+    def skew(self) -> np.ndarray:
+        n = self.count
+        m2 = np.where(np.abs(self.m2) < 1e-14, 0.0, self.m2)
+        m3 = np.where(np.abs(self.m3) < 1e-14, 0.0, self.m3)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            skew = (n * (n - 1) ** 0.5 / (n - 2)) * (m3 / m2 ** 1.5)
+        skew = np.where(m2 == 0, 0.0, skew)
+        return np.where(n < 3, np.nan, skew)
+
+
+class CorrelationAccumulator:
+    """
+    Pairwise-complete Pearson correlation from additive k x k sums, so memory is
+    independent of the row count. Values are shifted by a fixed per-column offset
+    (the first chunk's mean) to keep the raw sums numerically stable.
+    """
+
+    def __init__(self, width: int):
+        self.width = width
+        self.shift: Optional[np.ndarray] = None
+        self.n = np.zeros((width, width))
+        self.sx = np.zeros((width, width))
+        self.sxx = np.zeros((width, width))
+        self.sxy = np.zeros((width, width))
+
+    def update(self, values: np.ndarray) -> None:
+        if self.shift is None:
+            with np.errstate(invalid="ignore"):
+                self.shift = np.nan_to_num(np.nanmean(values, axis=0)) if len(values) else np.zeros(self.width)
+        valid = ~np.isnan(values)
+        present = valid.astype(float)
+        shifted = np.where(valid, values - self.shift, 0.0)
+        self.n += present.T @ present
+        self.sx += shifted.T @ present
+        self.sxx += (shifted * shifted).T @ present
+        self.sxy += shifted.T @ shifted
+
+    def merge(self, other: "CorrelationAccumulator") -> None:
+        if other.shift is None:
+            return
+        if self.shift is None:
+            self.shift = other.shift.copy()
+        # Re-express the other sums around this accumulator's shift
+        d = (other.shift - self.shift)[:, None]
+        d_t = d.T
+        sx_other = other.sx + d * other.n
+        self.sxx += other.sxx + 2 * d * other.sx + d * d * other.n
+        self.sxy += other.sxy + d * other.sx.T + other.sx * d_t + d * d_t * other.n
+        self.sx += sx_other
+        self.n += other.n
+
+    def correlation(self) -> np.ndarray:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            numerator = self.n * self.sxy - self.sx * self.sx.T
+            var = self.n * self.sxx - self.sx * self.sx
+            corr = numerator / np.sqrt(var * var.T)
+        corr = np.where(self.n >= 2, corr, np.nan)
+        return np.clip(corr, -1.0, 1.0)
+
+
+# ────────────── Column-level streaming profile ──────────────
+
+def _value_hashes(series: pd.Series) -> np.ndarray:
+    series = series.dropna()
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Hash each category once and gather by code
+        category_hashes = pd.util.hash_array(series.cat.categories.to_numpy(dtype=object))
+        return category_hashes[series.cat.codes.to_numpy()]
+    if pd.api.types.is_datetime64_any_dtype(series.dtype):
+        return pd.util.hash_array(series.array.asi8)
+    return pd.util.hash_array(series.to_numpy())
+
+
+class StreamingProfile:
+    """
+    Mergeable per-column sketches for one table. Memory depends on the column
+    count and sketch sizes only, never on the number of rows.
+    """
+
+    def __init__(self, dtypes: pd.Series):
+        self.dtypes = dtypes
+        self.groups = column_groups(dtypes)
+        self.numeric = self.groups["numerical"]
+        self.categorical = self.groups["categorical"]
+        self.rows = 0
+        self.nulls = pd.Series(0, index=dtypes.index, dtype="int64")
+        self.distinct = {col: HyperLogLog() for col in dtypes.index}
+        self.quantiles = {col: QuantileSketch(seed=i) for i, col in enumerate(self.numeric)}
+        self.top = {col: TopKSketch() for col in self.categorical}
+        self.moments = MomentSketch(len(self.numeric))
+        self.correlation = CorrelationAccumulator(len(self.numeric))
+        self.nullity = CorrelationAccumulator(len(dtypes))
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        self.rows += len(chunk)
+        nulls = chunk.isna()
+        self.nulls += nulls.sum()
+        self.nullity.update(nulls.to_numpy(dtype=float))
+
+        if self.numeric:
+            values = np.column_stack([
+                pd.to_numeric(chunk[col], errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+                for col in self.numeric
+            ])
+            self.moments.update(values)
+            self.correlation.update(values)
+            for i, col in enumerate(self.numeric):
+                self.quantiles[col].update(values[:, i])
+
+        for col in self.dtypes.index:
+            self.distinct[col].update_hashes(_value_hashes(chunk[col]))
+        for col in self.categorical:
+            self.top[col].update_counts(chunk[col].value_counts(dropna=True))
+
+    def merge(self, other: "StreamingProfile") -> None:
+        self.rows += other.rows
+        self.nulls += other.nulls
+        self.nullity.merge(other.nullity)
+        self.moments.merge(other.moments)
+        self.correlation.merge(other.correlation)
+        for col in self.dtypes.index:
+            self.distinct[col].merge(other.distinct[col])
+        for col in self.numeric:
+            self.quantiles[col].merge(other.quantiles[col])
+        for col in self.categorical:
+            self.top[col].merge(other.top[col])
+
+    def column_stats(self) -> Dict[Any, Dict[str, Any]]:
+        stats: Dict[Any, Dict[str, Any]] = {}
+        std, skew = self.moments.std(), self.moments.skew()
+        for i, col in enumerate(self.numeric):
+            count = self.moments.count[i]
+            q25, q50, q75 = self.quantiles[col].quantiles([0.25, 0.5, 0.75])
+            stats[col] = {
+                "kind": "numeric",
+                "count": float(count),
+                "nulls": float(self.nulls[col]),
+                "mean": float(self.moments.mean[i]) if count else np.nan,
+                "std": float(std[i]),
+                "min": float(self.moments.min[i]) if count else np.nan,
+                "25%": float(q25),
+                "50%": float(q50),
+                "75%": float(q75),
+                "max": float(self.moments.max[i]) if count else np.nan,
+                "skew": float(skew[i]),
+                "distinct": self.distinct[col].estimate(),
+            }
+        for col in self.dtypes.index:
+            if col in stats:
+                continue
+            nulls = int(self.nulls[col])
+            stats[col] = {
+                "kind": "categorical" if col in self.top else "other",
+                "count": float(self.rows - nulls),
+                "nulls": float(nulls),
+                "distinct": self.distinct[col].estimate(),
+            }
+            if col in self.top:
+                stats[col]["top"] = self.top[col].top(TOP_K, name=col)
+        return stats
+
+    def correlation_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(self.correlation.correlation(), index=self.numeric, columns=self.numeric)
+
+    def nullity_frame(self) -> pd.DataFrame:
+        """
+        Nullity correlation over columns that are neither complete nor empty (as missingno does).
+        """
+        columns = list(self.dtypes.index)
+        keep = [i for i, col in enumerate(columns) if 0 < self.nulls[col] < self.rows]
+        corr = self.nullity.correlation()[np.ix_(keep, keep)]
+        labels = [columns[i] for i in keep]
+        return pd.DataFrame(corr, index=labels, columns=labels)
+
+    def error_bounds(self) -> Dict[str, str]:
+        hll = next(iter(self.distinct.values()), HyperLogLog())
+        top_error = max((sketch.error for sketch in self.top.values()), default=0)
+        return {
+            "Row count, nulls, mean, std, skew, min, max": "exact",
+            "Correlation matrices": "exact (pairwise complete)",
+            "Distinct counts": f"±{2 * hll.relative_error:.1%} with ~95% confidence (HyperLogLog, p={hll.precision})",
+            "Quartiles": f"±{QuantileSketch().rank_error:.1%} in rank (KLL, k={KLL_K})",
+            "Top categories": f"counts may be low by at most {top_error:,} (Misra-Gries, {TOP_K_CAPACITY} counters)",
+        }
+
+
+def approximate_insights(
+    path: str, chunksize: int = CHUNK_ROWS, progress: Optional[ProgressCallback] = None
+) -> Dict[str, Any]:
+    """
+    Stream a CSV in chunks and build the same insights dict as compute_eda_insights
+    from mergeable sketches, so memory stays constant regardless of row count.
+
+    The result also carries "correlation" and "nullity_correlation" frames for the
+    plots and an "approximate" dict describing the error bound of each statistic.
+    """
+    plan = infer_csv_types(path, sample_rows=chunksize)
+    total_bytes = os.path.getsize(path) or 1
+    profile: Optional[StreamingProfile] = None
+
+    with open(path, "rb") as handle:
+        reader = pd.read_csv(handle, chunksize=chunksize, na_values=NA_VALUES, **plan.read_csv_kwargs())
+        for chunk in reader:
+            chunk = apply_plan(chunk, plan)
+            if profile is None:
+                profile = StreamingProfile(chunk.dtypes)
+            profile.update(chunk[list(profile.dtypes.index)])
+            if progress:
+                progress(min(handle.tell() / total_bytes, 1.0), f"Profiling {profile.rows:,} rows")
+
+    if profile is None:
+        profile = StreamingProfile(pd.read_csv(path, nrows=0).dtypes)
+
+    insights = assemble_insights((profile.rows, len(profile.dtypes)), profile.dtypes, profile.column_stats())
+    insights["correlation"] = profile.correlation_frame()
+    insights["nullity_correlation"] = profile.nullity_frame()
+    insights["approximate"] = profile.error_bounds()
+    return insights
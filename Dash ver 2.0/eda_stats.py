@@ -0,0 +1,241 @@
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+QUANTILES = (0.25, 0.5, 0.75)
+DESCRIBE_FIELDS = ["count", "mean", "std", "min", "25%", "50%", "75%", "max"]
+TOP_K = 5
+TOP_CATEGORY_COLUMNS = 3
+# Numeric columns are processed in blocks of at most this many cells (8 bytes each as
+# float64), so the block and its one scratch copy stay small next to the frame
+NUMERIC_BLOCK_CELLS = 4_000_000
+NUMERIC_BLOCK_COLUMNS = 64
+
+def _is_text(dtype) -> bool:
+    return dtype == object or isinstance(dtype, pd.StringDtype)
+
+
+def column_groups(dtypes: pd.Series) -> Dict[str, List[Any]]:
+    """
+    Split columns into the groups the EDA report uses, from dtypes alone.
+    Text means object or pandas string dtype, so pandas 2 and 3 behave the same.
+    """
+    groups: Dict[str, List[Any]] = {"numerical": [], "categorical": [], "boolean": [], "datetime": [], "text": []}
+    for col, dtype in dtypes.items():
+        if pd.api.types.is_bool_dtype(dtype):
+            groups["boolean"].append(col)
+        elif pd.api.types.is_datetime64_any_dtype(dtype):
+            groups["datetime"].append(col)
+        elif isinstance(dtype, pd.CategoricalDtype):
+            groups["categorical"].append(col)
+        elif pd.api.types.is_numeric_dtype(dtype):
+            groups["numerical"].append(col)
+        elif _is_text(dtype):
+            groups["categorical"].append(col)
+            groups["text"].append(col)
+    return groups
+
+
+def _lerp(a: np.ndarray, b: np.ndarray, t: np.ndarray) -> np.ndarray:
+    # Same formulation as numpy's linear quantile interpolation
+    diff = b - a
+    return np.where(t >= 0.5, b - diff * (1 - t), a + diff * t)
+
+
+def numeric_block_columns(rows: int) -> int:
+    """
+    Columns per numeric block for a frame of `rows` rows, within NUMERIC_BLOCK_CELLS.
+    """
+    return max(1, min(NUMERIC_BLOCK_COLUMNS, NUMERIC_BLOCK_CELLS // max(rows, 1)))
+
+
+def numeric_block_stats(values: np.ndarray, scratch: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+    """
+    Statistics for every column of a 2-D float array (NaN = missing) in one vectorized pass.
+
+    A single sort per column yields min, max, quantiles and distinct counts;
+    one centered pass yields mean, variance and skew (pandas' bias-corrected formula).
+    `values` is sorted in place and `scratch` (same shape, allocated if omitted)
+    is overwritten, so apart from them only per-column temporaries are allocated.
+    Both should be column-major.
+    """
+    n, k = values.shape
+    if scratch is None:
+        scratch = np.empty_like(values, order="F")
+    missing = np.isnan(values)
+    count = n - missing.sum(axis=0)
+    cols = np.arange(k)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        np.copyto(scratch, values)
+        np.copyto(scratch, 0.0, where=missing)
+        mean = np.where(count > 0, scratch.sum(axis=0) / count, np.nan)
+        centered = np.subtract(values, mean, out=scratch)
+        np.copyto(centered, 0.0, where=missing)
+        del missing
+        m2 = np.empty(k)
+        m3 = np.empty(k)
+        column = np.empty(n)
+        for j in range(k):
+            np.multiply(centered[:, j], centered[:, j], out=column)
+            m2[j] = column.sum()
+            np.multiply(column, centered[:, j], out=column)
+            m3[j] = column.sum()
+        del centered, column
+        m2 = np.where(np.abs(m2) < 1e-14, 0.0, m2)
+        m3 = np.where(np.abs(m3) < 1e-14, 0.0, m3)
+        std = np.where(count > 1, np.sqrt(m2 / (count - 1)), np.nan)
+        skew = (count * (count - 1) ** 0.5 / (count - 2)) * (m3 / m2 ** 1.5)
+        skew = np.where(m2 == 0, 0.0, skew)
+        skew = np.where(count < 3, np.nan, skew)
+
+    values.sort(axis=0)  # in place; NaN sorts last
+    ordered = values
+    last = np.maximum(count - 1, 0)
+    has_values = count > 0
+    stats = {
+        "count": count.astype(float),
+        "nulls": (n - count).astype(float),
+        "mean": mean,
+        "std": std,
+        "min": np.where(has_values, ordered[0, cols] if n else np.nan, np.nan),
+        "max": np.where(has_values, ordered[last, cols] if n else np.nan, np.nan),
+        "skew": skew,
+    }
+    for q in QUANTILES:
+        position = q * last
+        lower = np.floor(position).astype(int)
+        upper = np.minimum(lower + 1, last)
+        value = _lerp(ordered[lower, cols], ordered[upper, cols], position - lower) if n else np.full(k, np.nan)
+        stats[f"{q:.0%}"] = np.where(has_values, value, np.nan)
+
+    distinct = np.zeros(k, dtype=int)
+    for j in range(k):
+        present = ordered[:count[j], j]
+        distinct[j] = np.count_nonzero(present[1:] != present[:-1]) + has_values[j]
+    stats["distinct"] = distinct
+    return stats
+
+
+def _numeric_matrix(df: pd.DataFrame, columns: Sequence[Any], out: Optional[np.ndarray] = None) -> np.ndarray:
+    # Column-major so every per-column reduction and sort walks contiguous memory
+    matrix = np.empty((len(df), len(columns)), dtype="float64", order="F") if out is None else out
+    for i, col in enumerate(columns):
+        matrix[:, i] = df[col].to_numpy(dtype="float64", na_value=np.nan)
+    return matrix
+
+
+def categorical_stats(series: pd.Series, top_k: int = TOP_K) -> Dict[str, Any]:
+    """
+    Null count, distinct count and top-k values of a categorical/text column from one hashing pass.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = series.cat.codes.to_numpy()
+        uniques = series.cat.categories
+    else:
+        codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    present = codes >= 0
+    counts = np.bincount(codes[present], minlength=len(uniques))
+    order = np.argsort(-counts, kind="stable")[:top_k]
+    top = pd.Series(counts[order], index=pd.Index(uniques[order], name=series.name), name="count")
+    return {
+        "kind": "categorical",
+        "count": float(present.sum()),
+        "nulls": float(len(codes) - present.sum()),
+        "distinct": int((counts > 0).sum()),
+        "top": top,
+    }
+
+
+def other_stats(series: pd.Series) -> Dict[str, Any]:
+    nulls = int(series.isna().sum())
+    return {
+        "kind": "other",
+        "count": float(len(series) - nulls),
+        "nulls": float(nulls),
+        "distinct": int(series.nunique(dropna=True)),
+    }
+
+
+def compute_column_stats(df: pd.DataFrame, columns: Optional[Sequence[Any]] = None) -> Dict[Any, Dict[str, Any]]:
+    """
+    Per-column statistics for `columns` (all columns by default).
+
+    Numeric columns are handled in blocks by `numeric_block_stats`, categorical and
+    text columns by one factorize each, and anything else by a null/distinct count.
+    The result is keyed by column so it can be merged with results computed elsewhere.
+    """
+    columns = list(df.columns if columns is None else columns)
+    groups = column_groups(df.dtypes[columns])
+    categorical = set(groups["categorical"])
+    numerical = groups["numerical"]
+    stats: Dict[Any, Dict[str, Any]] = {}
+
+    # One block buffer and one scratch buffer are reused for every block
+    width = min(numeric_block_columns(len(df)), len(numerical))
+    matrix = np.empty((len(df), width), dtype="float64", order="F")
+    scratch = np.empty_like(matrix, order="F")
+    for start in range(0, len(numerical), width or 1):
+        block = numerical[start:start + width]
+        # Leading columns of a column-major buffer are contiguous
+        block_stats = numeric_block_stats(
+            _numeric_matrix(df, block, out=matrix[:, :len(block)]), scratch[:, :len(block)]
+        )
+        for i, col in enumerate(block):
+            entry = {name: values[i].item() for name, values in block_stats.items()}
+            entry["kind"] = "numeric"
+            entry["distinct"] = int(entry["distinct"])
+            stats[col] = entry
+
+    for col in columns:
+        if col in stats:
+            continue
+        stats[col] = categorical_stats(df[col]) if col in categorical else other_stats(df[col])
+    return stats
+
+
+def _describe(groups: Dict[str, List[Any]], stats: Dict[Any, Dict[str, Any]]) -> pd.DataFrame:
+    if groups["numerical"]:
+        return pd.DataFrame(
+            [[stats[col][field] for field in DESCRIBE_FIELDS] for col in groups["numerical"]],
+            index=groups["numerical"],
+            columns=DESCRIBE_FIELDS,
+        )
+    rows = {
+        col: {
+            "count": stats[col]["count"],
+            "unique": stats[col]["distinct"],
+            "top": stats[col]["top"].index[0] if len(stats[col]["top"]) else np.nan,
+            "freq": stats[col]["top"].iloc[0] if len(stats[col]["top"]) else np.nan,
+        }
+        for col in groups["categorical"]
+    }
+    return pd.DataFrame.from_dict(rows, orient="index", columns=["count", "unique", "top", "freq"])
+
+
+def assemble_insights(shape: Tuple[int, int], dtypes: pd.Series, stats: Dict[Any, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Build the insights dict consumed by eda_report from per-column statistics.
+    """
+    groups = column_groups(dtypes)
+    columns = list(dtypes.index)
+    rows = shape[0]
+    return {
+        "shape": shape,
+        "columns": columns,
+        "types": {
+            "numerical": groups["numerical"],
+            "categorical": groups["categorical"],
+            "boolean": groups["boolean"],
+            "datetime": groups["datetime"],
+        },
+        "describe": _describe(groups, stats),
+        "missing": pd.Series(
+            [stats[col]["nulls"] / rows if rows else np.nan for col in columns], index=columns, dtype=float
+        ).sort_values(ascending=False),
+        "skew": pd.Series([stats[col]["skew"] for col in groups["numerical"]], index=groups["numerical"], dtype=float),
+        "cardinality": {col: stats[col]["distinct"] for col in groups["categorical"]},
+        "constant_cols": [col for col in columns if stats[col]["distinct"] == 1],
+        "top_categories": {col: stats[col]["top"] for col in groups["text"][:TOP_CATEGORY_COLUMNS]},
+    }
@@ -0,0 +1,509 @@
+import abc
+import ast
+import re
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    import numexpr
+except ImportError:  # numexpr is optional; arithmetic predicates then go through pandas eval
+    numexpr = None
+
+BACKTICK_PATTERN = re.compile(r"`([^`]*)`")
+PLACEHOLDER = "__dg_col_{}__"
+RANGE_OPS = {ast.Gt: ">", ast.GtE: ">=", ast.Lt: "<", ast.LtE: "<=", ast.Eq: "=="}
+FLIPPED = {">": "<", ">=": "<=", "<": ">", "<=": ">=", "==": "==", "!=": "!="}
+NUMEXPR_BINOPS = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.Mod)
+NUMEXPR_CMPOPS = (ast.Gt, ast.GtE, ast.Lt, ast.LtE, ast.Eq, ast.NotEq)
+
+
+class FilterError(ValueError):
+    """Raised when a filter expression is invalid for the loaded data."""
+
+
+def column_kind(dtype) -> str:
+    if isinstance(dtype, pd.CategoricalDtype):
+        return "category"
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return "datetime"
+    if pd.api.types.is_bool_dtype(dtype):
+        return "bool"
+    if pd.api.types.is_numeric_dtype(dtype):
+        return "numeric"
+    return "other"
+
+
+# ────────────── Per-column sorted indexes ──────────────
+
+def _sortable_values(series: pd.Series) -> np.ndarray:
+    if pd.api.types.is_datetime64_any_dtype(series.dtype):
+        if getattr(series.dt, "tz", None) is not None:
+            series = series.dt.tz_convert(None)
+        return series.to_numpy()
+    if isinstance(series.dtype, np.dtype):
+        return series.to_numpy()
+    return series.to_numpy(dtype="float64", na_value=np.nan)
+
+
+class SortedColumnIndex:
+    """
+    Non-null values of one column in sorted order, with their row positions.
+    Range predicates become two binary searches plus a scatter into a mask.
+    """
+
+    def __init__(self, series: pd.Series):
+        values = _sortable_values(series)
+        positions = np.flatnonzero(series.notna().to_numpy())
+        values = values[positions]
+        order = np.argsort(values, kind="stable")
+        self.values = values[order]
+        self.positions = positions[order]
+        self.size = len(series)
+
+    def range_mask(self, lo: Any, lo_inclusive: bool, hi: Any, hi_inclusive: bool) -> np.ndarray:
+        if self.values.dtype.kind == "f":
+            # Bounds take the column's precision, as in pandas: 8.1 must match a float32 8.1
+            lo = None if lo is None else np.asarray(lo, dtype=self.values.dtype)
+            hi = None if hi is None else np.asarray(hi, dtype=self.values.dtype)
+        start = 0 if lo is None else np.searchsorted(self.values, lo, side="left" if lo_inclusive else "right")
+        stop = len(self.values) if hi is None else np.searchsorted(self.values, hi, side="right" if hi_inclusive else "left")
+        mask = np.zeros(self.size, dtype=bool)
+        if stop > start:
+            mask[self.positions[start:stop]] = True
+        return mask
+
+
+class ColumnIndexCache:
+    """
+    Lazily built sorted indexes for one DataFrame, one per column.
+    """
+
+    def __init__(self):
+        self._indexes: Dict[Any, SortedColumnIndex] = {}
+
+    def get(self, df: pd.DataFrame, column: Any) -> SortedColumnIndex:
+        index = self._indexes.get(column)
+        if index is None:
+            index = SortedColumnIndex(df[column])
+            self._indexes[column] = index
+        return index
+
+    def clear(self) -> None:
+        self._indexes.clear()
+
+
+# ────────────── Compiled predicate nodes ──────────────
+
+class Predicate(abc.ABC):
+    strategy = ""
+
+    @abc.abstractmethod
+    def evaluate(self, df: pd.DataFrame, indexes: ColumnIndexCache) -> np.ndarray:
+        """Boolean row mask of the predicate over `df`."""
+
+    def explain(self) -> List[str]:
+        return [f"{self.strategy}: {self}"]
+
+
+class AndNode(Predicate):
+    strategy = "and"
+
+    def __init__(self, children: List[Predicate]):
+        self.children = children
+
+    def evaluate(self, df, indexes):
+        return np.logical_and.reduce([child.evaluate(df, indexes) for child in self.children])
+
+    def explain(self):
+        return [line for child in self.children for line in child.explain()]
+
+
+class OrNode(AndNode):
+    strategy = "or"
+
+    def evaluate(self, df, indexes):
+        return np.logical_or.reduce([child.evaluate(df, indexes) for child in self.children])
+
+
+class NotNode(Predicate):
+    strategy = "not"
+
+    def __init__(self, child: Predicate):
+        self.child = child
+
+    def evaluate(self, df, indexes):
+        return ~self.child.evaluate(df, indexes)
+
+    def explain(self):
+        return [f"not {line}" for line in self.child.explain()]
+
+
+class RangeNode(Predicate):
+    strategy = "sorted-index"
+
+    def __init__(self, column, lo=None, lo_inclusive=True, hi=None, hi_inclusive=True):
+        self.column = column
+        self.lo, self.lo_inclusive = lo, lo_inclusive
+        self.hi, self.hi_inclusive = hi, hi_inclusive
+
+    def intersect(self, other: "RangeNode") -> "RangeNode":
+        lo, lo_inc = self.lo, self.lo_inclusive
+        if other.lo is not None and (lo is None or other.lo > lo):
+            lo, lo_inc = other.lo, other.lo_inclusive
+        elif other.lo is not None and other.lo == lo:
+            lo_inc = lo_inc and other.lo_inclusive
+        hi, hi_inc = self.hi, self.hi_inclusive
+        if other.hi is not None and (hi is None or other.hi < hi):
+            hi, hi_inc = other.hi, other.hi_inclusive
+        elif other.hi is not None and other.hi == hi:
+            hi_inc = hi_inc and other.hi_inclusive
+        return RangeNode(self.column, lo, lo_inc, hi, hi_inc)
+
+    def evaluate(self, df, indexes):
+        return indexes.get(df, self.column).range_mask(self.lo, self.lo_inclusive, self.hi, self.hi_inclusive)
+
+    def __str__(self):
+        lo = "" if self.lo is None else f"{self.lo} {'<=' if self.lo_inclusive else '<'} "
+        hi = "" if self.hi is None else f" {'<=' if self.hi_inclusive else '<'} {self.hi}"
+        return f"{lo}{self.column}{hi}"
+
+
+class CategoryNode(Predicate):
+    strategy = "category-codes"
+
+    def __init__(self, column, values: Sequence[Any]):
+        self.column = column
+        self.values = list(values)
+
+    def evaluate(self, df, indexes):
+        series = df[self.column]
+        targets = series.cat.categories.get_indexer(self.values)
+        return np.isin(series.cat.codes.to_numpy(), targets[targets >= 0])
+
+    def __str__(self):
+        return f"{self.column} in {self.values}"
+
+
+class IsinNode(CategoryNode):
+    strategy = "hash-lookup"
+
+    def evaluate(self, df, indexes):
+        return df[self.column].isin(self.values).to_numpy()
+
+
+class BoolColumnNode(Predicate):
+    strategy = "bool-column"
+
+    def __init__(self, column):
+        self.column = column
+
+    def evaluate(self, df, indexes):
+        return df[self.column].fillna(False).to_numpy(dtype=bool)
+
+    def __str__(self):
+        return str(self.column)
+
+
+class NumexprNode(Predicate):
+    strategy = "numexpr"
+
+    def __init__(self, source: str, columns: Dict[str, Any], text: str):
+        self.source = source
+        self.columns = columns
+        self.text = text
+
+    def evaluate(self, df, indexes):
+        local_dict = {name: df[column].to_numpy() for name, column in self.columns.items()}
+        return numexpr.evaluate(self.source, local_dict=local_dict, global_dict={})
+
+    def __str__(self):
+        return self.text
+
+
+class PandasEvalNode(Predicate):
+    strategy = "pandas-eval"
+
+    def __init__(self, source: str):
+        self.source = source
+
+    def evaluate(self, df, indexes):
+        result = df.eval(self.source)
+        if not isinstance(result, pd.Series) or not pd.api.types.is_bool_dtype(result):
+            raise FilterError(f"Filter does not produce True/False per row: {self.source}")
+        return result.fillna(False).to_numpy(dtype=bool)
+
+    def __str__(self):
+        return self.source
+
+
+# ────────────── Compiler ──────────────
+
+class CompiledFilter:
+    """
+    A parsed and validated filter. `text` is its canonical form, used as the cache key.
+    """
+
+    def __init__(self, text: str, root: Predicate, columns: List[Any]):
+        self.text = text
+        self.root = root
+        self.columns = columns
+
+    def evaluate(self, df: pd.DataFrame, indexes: Optional[ColumnIndexCache] = None) -> np.ndarray:
+        return self.root.evaluate(df, indexes or ColumnIndexCache())
+
+    def explain(self) -> List[str]:
+        return self.root.explain()
+
+
+def _literal(node: ast.AST) -> Tuple[bool, Any]:
+    """
+    Return (True, value) when the node is a constant, a negated number or a list/tuple of constants.
+    """
+    if isinstance(node, ast.Constant):
+        return True, node.value
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)) and isinstance(node.operand, ast.Constant):
+        value = node.operand.value
+        if isinstance(value, (int, float)):
+            return True, -value if isinstance(node.op, ast.USub) else value
+    if isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+        items = [_literal(elt) for elt in node.elts]
+        if all(ok for ok, _ in items):
+            return True, [value for _, value in items]
+    return False, None
+
+
+class _Compiler:
+    def __init__(self, dtypes: pd.Series, placeholders: Dict[str, Any]):
+        self.dtypes = dtypes
+        self.placeholders = placeholders
+        self.used: List[Any] = []
+
+    def text(self, node: ast.AST) -> str:
+        source = ast.unparse(node)
+        for name, column in self.placeholders.items():
+            source = source.replace(name, f"`{column}`")
+        return source
+
+    def column(self, node: ast.AST) -> Optional[Any]:
+        if not isinstance(node, ast.Name):
+            return None
+        column = self.placeholders.get(node.id, node.id)
+        return column if column in self.dtypes.index else None
+
+    def validate_names(self, tree: ast.AST) -> None:
+        function_names = {
+            id(call.func) for call in ast.walk(tree)
+            if isinstance(call, ast.Call) and isinstance(call.func, ast.Name)
+        }
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Name) and id(node) not in function_names:
+                column = self.column(node)
+                if column is None:
+                    raise FilterError(f"Unknown column in filter: '{self.placeholders.get(node.id, node.id)}'")
+                if column not in self.used:
+                    self.used.append(column)
+
+    def kind(self, column) -> str:
+        return column_kind(self.dtypes[column])
+
+    def coerce(self, column, value: Any) -> Any:
+        """
+        Check a literal against the column type and convert it to comparable form.
+        """
+        kind = self.kind(column)
+        if kind == "numeric":
+            if not isinstance(value, (int, float)) or isinstance(value, bool):
+                raise FilterError(f"Column '{column}' is numeric but is compared with {value!r}")
+            return value
+        if kind == "datetime":
+            try:
+                stamp = pd.Timestamp(value)
+            except (TypeError, ValueError) as e:
+                raise FilterError(f"Column '{column}' holds dates but {value!r} is not a date") from e
+            if getattr(self.dtypes[column], "tz", None) is not None:
+                stamp = stamp.tz_localize("UTC") if stamp.tz is None else stamp.tz_convert("UTC")
+                stamp = stamp.tz_localize(None)
+            return stamp.to_datetime64()
+        return value
+
+    def is_predicate(self, node: ast.AST) -> bool:
+        if isinstance(node, (ast.Compare, ast.BoolOp)):
+            return True
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.Not, ast.Invert)):
+            return self.is_predicate(node.operand)
+        if isinstance(node, ast.BinOp) and isinstance(node.op, (ast.BitAnd, ast.BitOr)):
+            return self.is_predicate(node.left) and self.is_predicate(node.right)
+        column = self.column(node)
+        return column is not None and self.kind(column) == "bool"
+
+    def compile(self, node: ast.AST) -> Predicate:
+        if isinstance(node, ast.BoolOp):
+            children = [self.compile(value) for value in node.values]
+            return self.combine(children, isinstance(node.op, ast.And))
+        if isinstance(node, ast.BinOp) and isinstance(node.op, (ast.BitAnd, ast.BitOr)) and self.is_predicate(node):
+            children = [self.compile(node.left), self.compile(node.right)]
+            return self.combine(children, isinstance(node.op, ast.BitAnd))
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.Not, ast.Invert)) and self.is_predicate(node.operand):
+            return NotNode(self.compile(node.operand))
+        if isinstance(node, ast.Compare):
+            return self.compile_compare(node)
+        column = self.column(node)
+        if column is not None and self.kind(column) == "bool":
+            return BoolColumnNode(column)
+        return self.generic(node)
+
+    @staticmethod
+    def combine(children: List[Predicate], conjunction: bool) -> Predicate:
+        flat: List[Predicate] = []
+        node_type = AndNode if conjunction else OrNode
+        for child in children:
+            flat.extend(child.children if type(child) is node_type else [child])
+        if not conjunction:
+            return OrNode(flat)
+        # Several ranges on one column collapse into a single index lookup
+        ranges: Dict[Any, RangeNode] = {}
+        others: List[Predicate] = []
+        for child in flat:
+            if isinstance(child, RangeNode):
+                ranges[child.column] = ranges[child.column].intersect(child) if child.column in ranges else child
+            else:
+                others.append(child)
+        merged = list(ranges.values()) + others
+        return merged[0] if len(merged) == 1 else AndNode(merged)
+
+    def compile_compare(self, node: ast.Compare) -> Predicate:
+        operands = [node.left] + node.comparators
+
+        # lo < col < hi
+        if len(node.ops) == 2 and all(type(op) in RANGE_OPS and not isinstance(op, ast.Eq) for op in node.ops):
+            column = self.column(operands[1])
+            (lo_ok, lo), (hi_ok, hi) = _literal(operands[0]), _literal(operands[2])
+            if column is not None and lo_ok and hi_ok and self.kind(column) in ("numeric", "datetime"):
+                first, second = RANGE_OPS[type(node.ops[0])], RANGE_OPS[type(node.ops[1])]
+                if first[0] == second[0] == "<":
+                    return RangeNode(column, self.coerce(column, lo), first == "<=", self.coerce(column, hi), second == "<=")
+                if first[0] == second[0] == ">":
+                    return RangeNode(column, self.coerce(column, hi), second == ">=", self.coerce(column, lo), first == ">=")
+
+        if len(node.ops) != 1:
+            return self.generic(node)
+
+        op = node.ops[0]
+        left, right = operands
+        column, (is_literal, value) = self.column(left), _literal(right)
+        symbol = RANGE_OPS.get(type(op)) or {ast.NotEq: "!=", ast.In: "in", ast.NotIn: "not in"}.get(type(op))
+        if column is None or not is_literal:
+            column, (is_literal, value) = self.column(right), _literal(left)
+            symbol = FLIPPED.get(symbol) if symbol not in ("in", "not in") else None
+        if column is None or not is_literal or symbol is None:
+            return self.generic(node)
+
+        kind = self.kind(column)
+        negate = symbol in ("!=", "not in")
+        if isinstance(value, list) or symbol in ("in", "not in"):
+            values = value if isinstance(value, list) else [value]
+            if symbol not in ("==", "!=", "in", "not in"):
+                return self.generic(node)
+            if kind == "category":
+                result: Predicate = CategoryNode(column, values)
+            elif kind == "numeric":
+                result = IsinNode(column, [self.coerce(column, v) for v in values])
+            else:
+                return self.generic(node)
+            return NotNode(result) if negate else result
+
+        if kind in ("numeric", "datetime"):
+            value = self.coerce(column, value)
+            if symbol in ("==", "!="):
+                result = RangeNode(column, value, True, value, True)
+                return NotNode(result) if negate else result
+            if symbol[0] == ">":
+                return RangeNode(column, lo=value, lo_inclusive=symbol == ">=")
+            return RangeNode(column, hi=value, hi_inclusive=symbol == "<=")
+        if kind == "category" and symbol in ("==", "!="):
+            result = CategoryNode(column, [value])
+            return NotNode(result) if negate else result
+        if kind == "bool" and symbol in ("==", "!=") and isinstance(value, bool):
+            result = BoolColumnNode(column)
+            return result if (value != negate) else NotNode(result)
+        return self.generic(node)
+
+    def numexpr_ready(self, node: ast.AST) -> bool:
+        if numexpr is None:
+            return False
+        for child in ast.walk(node):
+            if isinstance(child, ast.Name):
+                column = self.column(child)
+                dtype = self.dtypes[column]
+                if not isinstance(dtype, np.dtype) or dtype.kind not in "iufb":
+                    return False
+            elif isinstance(child, ast.Constant):
+                if not isinstance(child.value, (int, float)):
+                    return False
+            elif isinstance(child, ast.Compare):
+                if len(child.ops) != 1 or not isinstance(child.ops[0], NUMEXPR_CMPOPS):
+                    return False
+            elif isinstance(child, ast.BinOp):
+                if not isinstance(child.op, NUMEXPR_BINOPS):
+                    return False
+            elif isinstance(child, ast.UnaryOp):
+                if not isinstance(child.op, ast.USub):
+                    return False
+            elif not isinstance(child, (ast.expr_context, ast.operator, ast.cmpop, ast.unaryop)):
+                return False
+        return isinstance(node, ast.Compare)
+
+    def generic(self, node: ast.AST) -> Predicate:
+        self.check_types(node)
+        if self.numexpr_ready(node):
+            tree = ast.parse(ast.unparse(node), mode="eval")
+            aliases: Dict[Any, str] = {}
+            for child in ast.walk(tree):
+                if isinstance(child, ast.Name):
+                    child.id = aliases.setdefault(self.column(child), f"c{len(aliases)}")
+            columns = {alias: column for column, alias in aliases.items()}
+            return NumexprNode(ast.unparse(tree.body), columns, self.text(node))
+        return PandasEvalNode(self.text(node))
+
+    def check_types(self, node: ast.AST) -> None:
+        for child in ast.walk(node):
+            if not isinstance(child, ast.Compare) or len(child.ops) != 1:
+                continue
+            for side, other in ((child.left, child.comparators[0]), (child.comparators[0], child.left)):
+                column, (is_literal, value) = self.column(side), _literal(other)
+                if column is not None and is_literal and not isinstance(value, list):
+                    self.coerce(column, value)
+
+
+def compile_filter(expr: str, dtypes: pd.Series) -> CompiledFilter:
+    """
+    Parse a pandas-style filter once, validate it against the column dtypes and
+    pick an execution strategy per predicate.
+
+    Parameters:
+        expr (str): The filter, e.g. "Year > 2010 and Genre == 'Drama'". Columns with
+            spaces or symbols are written in backticks, as with DataFrame.query.
+        dtypes (pd.Series): `df.dtypes` of the frame the filter will run on.
+
+    Returns:
+        CompiledFilter: Ready to evaluate into a boolean mask.
+    """
+    placeholders: Dict[str, Any] = {}
+
+    def substitute(match):
+        name = PLACEHOLDER.format(len(placeholders))
+        placeholders[name] = match.group(1)
+        return name
+
+    source = BACKTICK_PATTERN.sub(substitute, " ".join(expr.split()))
+    try:
+        tree = ast.parse(source, mode="eval")
+    except SyntaxError as e:
+        raise FilterError(f"Invalid filter expression: {expr}") from e
+
+    compiler = _Compiler(dtypes, placeholders)
+    compiler.validate_names(tree.body)
+    root = compiler.compile(tree.body)
+    return CompiledFilter(compiler.text(tree.body), root, compiler.used)
@@ -0,0 +1,150 @@
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from filter_compiler import ColumnIndexCache, CompiledFilter, compile_filter
+
+MASK_CACHE_SIZE = 64
+
+
+class FilterEngine:
+    """
+    Applies filters as boolean masks over a fixed base frame.
+
+    Every filter is compiled (see filter_compiler), evaluated against the base
+    frame once and its mask is kept in an LRU cache keyed by its canonical text,
+    so adding, removing, reordering or undoing filters only recombines cached masks. The filtered view is an array of row positions;
+    a DataFrame is only materialized when `frame()` is called.
+    """
+
+    def __init__(self, base: pd.DataFrame, cache_size: int = MASK_CACHE_SIZE):
+        self.base = base
+        self.cache_size = cache_size
+        self.indexes = ColumnIndexCache()
+        self._masks: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        # Filter tasks evaluate masks on worker threads while the GUI thread reads them
+        self._masks_lock = threading.Lock()
+        self._filters: Tuple[str, ...] = ()
+        self._undo: List[Tuple[str, ...]] = []
+        self._redo: List[Tuple[str, ...]] = []
+        self._positions: Optional[np.ndarray] = None
+        self._frame: Optional[pd.DataFrame] = None
+
+    @property
+    def filters(self) -> List[str]:
+        return list(self._filters)
+
+    @property
+    def can_undo(self) -> bool:
+        return bool(self._undo)
+
+    @property
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    def compile(self, expr: str) -> CompiledFilter:
+        """
+        Parse and validate a filter against the base frame's columns and dtypes.
+        Raises FilterError for unknown columns or mismatched types.
+        """
+        return compile_filter(expr, self.base.dtypes)
+
+    def mask_for(self, expr: Union[str, CompiledFilter]) -> np.ndarray:
+        """
+        Mask of one filter over the base frame, evaluated at most once while cached.
+        """
+        compiled = expr if isinstance(expr, CompiledFilter) else self.compile(expr)
+        mask = self._cached_mask(compiled.text)
+        if mask is None:
+            mask = compiled.evaluate(self.base, self.indexes)
+            self._store_mask(compiled.text, mask)
+        return mask
+
+    def _cached_mask(self, key: str):
+        with self._masks_lock:
+            mask = self._masks.get(key)
+            if mask is not None:
+                self._masks.move_to_end(key)
+            return mask
+
+    def _store_mask(self, key: str, mask) -> None:
+        with self._masks_lock:
+            self._masks[key] = mask
+            while len(self._masks) > self.cache_size:
+                self._masks.popitem(last=False)
+
+    def _set_filters(self, filters: Tuple[str, ...], record: bool = True) -> None:
+        if filters == self._filters:
+            return
+        if record:
+            self._undo.append(self._filters)
+            self._redo.clear()
+        self._filters = filters
+        self._positions = None
+        self._frame = None
+
+    def add(self, expr: Union[str, CompiledFilter]) -> None:
+        compiled = expr if isinstance(expr, CompiledFilter) else self.compile(expr)
+        self.mask_for(compiled)
+        self._set_filters(self._filters + (compiled.text,))
+
+    def remove(self, index: int) -> None:
+        filters = list(self._filters)
+        del filters[index]
+        self._set_filters(tuple(filters))
+
+    def reorder(self, order: List[int]) -> None:
+        self._set_filters(tuple(self._filters[i] for i in order))
+
+    def clear(self) -> None:
+        self._set_filters(())
+
+    def undo(self) -> bool:
+        if not self._undo:
+            return False
+        self._redo.append(self._filters)
+        self._set_filters(self._undo.pop(), record=False)
+        return True
+
+    def redo(self) -> bool:
+        if not self._redo:
+            return False
+        self._undo.append(self._filters)
+        self._set_filters(self._redo.pop(), record=False)
+        return True
+
+    def mask(self) -> np.ndarray:
+        """
+        Combined mask of all active filters.
+        """
+        if not self._filters:
+            return np.ones(len(self.base), dtype=bool)
+        return np.logical_and.reduce([self.mask_for(expr) for expr in self._filters])
+
+    def positions(self) -> Optional[np.ndarray]:
+        """
+        Row positions in the base frame that pass every filter, or None when unfiltered.
+        """
+        if not self._filters:
+            return None
+        if self._positions is None:
+            self._positions = np.flatnonzero(self.mask())
+        return self._positions
+
+    def row_count(self) -> int:
+        positions = self.positions()
+        return len(self.base) if positions is None else len(positions)
+
+    def frame(self) -> pd.DataFrame:
+        """
+        The filtered rows as a DataFrame, built on first use after a change.
+        """
+        positions = self.positions()
+        if positions is None:
+            return self.base
+        if self._frame is None:
+            self._frame = self.base.iloc[positions]
+        return self._frame
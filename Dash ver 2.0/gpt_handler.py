@@ -1,22 +1,68 @@
-from openai import AzureOpenAI
-from config import AZURE_API_KEY, AZURE_ENDPOINT, AZURE_DEPLOYMENT, API_VERSION
+from config import (
+    AZURE_API_KEY, AZURE_ENDPOINT, AZURE_DEPLOYMENT, API_VERSION,
+    LLM_CACHE_PATH, LLM_CACHE_TTL_HOURS, LLM_CACHE_MAX_ENTRIES, LLM_OFFLINE,
+    LLM_BACKEND, LLM_TIMEOUT_SECONDS, LLM_DEADLINE_SECONDS, LLM_MAX_RETRIES, require_azure_config
+)
+from llm_cache import LLMCache, request_key, schema_fingerprint
+from llm_client import AzureBackend, LLMClient, StubBackend, TokenCallback
+from preagg import Rollups, describe_rollups
 import pandas as pd
 import re
+import threading
+from typing import Optional
 
-client = AzureOpenAI(
-    api_key=AZURE_API_KEY,
-    azure_endpoint=AZURE_ENDPOINT,
-    api_version=API_VERSION,
-)
+llm_cache = LLMCache(LLM_CACHE_PATH, LLM_CACHE_TTL_HOURS, LLM_CACHE_MAX_ENTRIES, offline=LLM_OFFLINE)
+
+_client: Optional[LLMClient] = None
+_client_lock = threading.Lock()
+
+def get_client() -> LLMClient:
+    """
+    The shared LLM client, created on first use with the configured backend.
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            if LLM_BACKEND == "stub":
+                backend = StubBackend()
+            else:
+                require_azure_config()
+                backend = AzureBackend(AZURE_API_KEY, AZURE_ENDPOINT, AZURE_DEPLOYMENT, API_VERSION)
+            _client = LLMClient(backend, LLM_TIMEOUT_SECONDS, LLM_DEADLINE_SECONDS, LLM_MAX_RETRIES)
+        return _client
+
+def chat_completion(
+    system_prompt: str, user_prompt: str, df: Optional[pd.DataFrame] = None, on_token: Optional[TokenCallback] = None
+) -> str:
+    """
+    Every chat request goes through here. Responses are cached by deployment,
+    prompts and the schema of `df`, and identical concurrent requests share one call.
+    `on_token` receives the text as it streams in (not called for cached responses).
+    """
+    key = request_key(f"{LLM_BACKEND}:{AZURE_DEPLOYMENT}", system_prompt, user_prompt, schema_fingerprint(df))
+    return llm_cache.get_or_create(
+        key, lambda: get_client().complete(system_prompt, user_prompt, on_token=on_token), AZURE_DEPLOYMENT
+    )
 
 def extract_code_block(content: str) -> str:
     matches = re.findall(r"```(?:python)?(.*?)```", content, re.DOTALL)
     return matches[0].strip() if matches else content.strip()
 
-def generate_code_from_prompt(prompt: str, df: pd.DataFrame) -> str:
+def generate_code_from_prompt(prompt: str, df: pd.DataFrame, on_token: Optional[TokenCallback] = None,
+                              aggs: Optional[Rollups] = None) -> str:
     full_prompt = (
         f"You are an expert Python data scientist. Given a pandas DataFrame called df "
         f"with columns: {list(df.columns)}, generate matplotlib code to visualize: \"{prompt}\".\n"
+    )
+    if aggs:
+        # Ready-made rollups (see preagg) spare the plot code a group-by over every row
+        full_prompt += (
+            "A dict called aggs holds small precomputed aggregates of all rows of the data "
+            "(count plus <column>_mean and <column>_sum per group):\n"
+            f"{describe_rollups(aggs)}\n"
+            "Use an aggs frame instead of grouping df whenever it has what the plot needs.\n"
+        )
+    full_prompt += (
         "The code should:\n"
         "1. Use clear titles and labels.\n"
         "2. Be concise and correct.\n"
@@ -24,14 +70,12 @@ def generate_code_from_prompt(prompt: str, df: pd.DataFrame) -> str:
     )
 
     try:
-        completion = client.chat.completions.create(
-            model=AZURE_DEPLOYMENT,
-            messages=[
-                {"role": "system", "content": "You are a helpful assistant that writes Python visualization code. Return code only."},
-                {"role": "user", "content": full_prompt}
-            ]
+        content = chat_completion(
+            "You are a helpful assistant that writes Python visualization code. Return code only.",
+            full_prompt,
+            df,
+            on_token=on_token,
         )
-        content = completion.choices[0].message.content
         return extract_code_block(content)
     except Exception as e:
         raise RuntimeError(f"❌ GPT request failed: {e}")
@@ -2,94 +2,65 @@ import pandas as pd
 import numpy as np
 import re
 import logging
-from PyQt5.QtWidgets import QTableWidget, QTableWidgetItem
+from typing import TYPE_CHECKING, Optional
+from type_inference import read_csv_typed, is_likely_date
+from filter_compiler import compile_filter
+from instrumentation import span
 
-logging.basicConfig(level=logging.INFO)
-
-def is_likely_date(series: pd.Series) -> bool:
-    """
-    Heuristic to check if a column likely contains date strings.
-    Looks for common formats like YYYY-MM-DD or YYYY/MM/DD.
-    """
-    if series.dropna().empty:
-        return False
+if TYPE_CHECKING:
+    from PyQt5.QtWidgets import QTableView
 
-    sample = series.dropna().astype(str).head(20)
-    date_pattern = r"^\d{4}[-/]\d{1,2}[-/]\d{1,2}$"
-    return sample.str.match(date_pattern).mean() > 0.8
+# Qt is only imported by display_dataframe, so loading and filtering work headless (see eda_cli)
 
+logging.basicConfig(level=logging.INFO)
 
 def load_csv_file(path: str) -> pd.DataFrame:
     """
     Load CSV file and automatically convert:
-    - 0/1 columns to boolean
+    - TRUE/FALSE and 0/1 columns to boolean
     - Date-like columns to datetime
     - Low-cardinality object columns to category
-    """
-    df = pd.read_csv(path, na_values=["", " ", "NA", "NaN", "nan", None])
-
-    for col in df.columns:
-        # Convert TRUE/FALSE strings
-        if df[col].dtype == 'object':
-            unique_vals = set(df[col].dropna().unique())
-            if unique_vals.issubset({"TRUE", "FALSE"}):
-                df[col] = df[col].map({"TRUE": True, "FALSE": False})
-
-    # Convert 0/1 numeric to bool
-    for col in df.columns:
-        try:
-            unique_vals = df[col].dropna().unique()
-            if len(unique_vals) <= 2 and set(unique_vals).issubset({0, 1}):
-                df[col] = df[col].astype(bool)
-        except Exception as e:
-            logging.warning(f"Bool detection failed for '{col}': {e}")
-
-    # Convert likely date columns
-    for col in df.columns:
-        if df[col].dtype == 'object' and is_likely_date(df[col]):
-            try:
-                df[col] = pd.to_datetime(df[col], errors='coerce', utc=True)
-            except Exception as e:
-                logging.warning(f"Date conversion failed for '{col}': {e}")
-
-    # Convert low-cardinality object columns to category
-    for col in df.select_dtypes(include='object').columns:
-        try:
-            if df[col].nunique(dropna=True) < 30:
-                df[col] = df[col].astype('category')
-        except Exception as e:
-            logging.warning(f"Category conversion failed for '{col}': {e}")
 
+    Types are inferred once from a bounded sample and passed to read_csv,
+    so the conversions happen during parsing instead of as extra passes.
+    """
+    with span("load_csv", path=path) as stage:
+        df, report = read_csv_typed(path)
+        stage.set(rows=len(df), columns=df.shape[1])
+    for entry in report:
+        logging.debug(f"{entry['column']}: {entry['dtype']} ({entry['inferred']}, {entry['seconds']:.4f}s)")
     return df
 
 
-def display_dataframe(df: pd.DataFrame, table: QTableWidget, max_rows: int = 500) -> None:
+def display_dataframe(df: pd.DataFrame, view: "QTableView", rows: Optional[np.ndarray] = None) -> None:
     """
-    Display a DataFrame in a PyQt5 QTableWidget. 
-    Limits rows to max_rows to prevent UI slowdown.
+    Display a DataFrame in a PyQt5 QTableView through a virtualized DataFrameModel.
+    Only visible cells are formatted, so there is no row cap.
+    When the view already shows `df`, only the visible row positions are swapped.
     """
-    rows_to_show = min(len(df), max_rows)
-
-    if len(df) > max_rows:
-        logging.info(f"Displaying only the first {max_rows} rows of {len(df)} total rows.")
-
-    table.clear()
-    table.setRowCount(rows_to_show)
-    table.setColumnCount(df.shape[1])
-    table.setHorizontalHeaderLabels(df.columns.astype(str).tolist())
+    from table_model import DataFrameModel
 
-    for row in range(rows_to_show):
-        for col in range(df.shape[1]):
-            value = df.iat[row, col]
-            table.setItem(row, col, QTableWidgetItem(str(value)))
+    model = view.model()
+    if not isinstance(model, DataFrameModel):
+        model = DataFrameModel(parent=view)
+        view.setModel(model)
+    if model.frame is not df:
+        model.set_frame(df)
+        if rows is None:
+            return
+    model.set_rows(rows)
 
 
 def apply_df_filter(df: pd.DataFrame, filter_expr: str) -> pd.DataFrame:
     """
-    Apply a pandas query string to filter a DataFrame.
+    Apply a pandas-style query string to filter a DataFrame.
+    The expression is compiled and validated against df's columns and dtypes first.
     """
     try:
-        return df.query(filter_expr)
+        with span("filter", rows=len(df)) as stage:
+            filtered = df[compile_filter(filter_expr, df.dtypes).evaluate(df)]
+            stage.set(matched=len(filtered))
+        return filtered
     except Exception as e:
         logging.error(f"Filter error: {e}")
         raise ValueError(f"Invalid filter expression: {filter_expr}") from e
@@ -0,0 +1,259 @@
+import os
+import json
+import time
+import logging
+import threading
+import cProfile
+from collections import deque
+from datetime import datetime
+from logging.handlers import RotatingFileHandler
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # not available on Windows; peak RSS is then not recorded
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HISTORY = 200
+DEFAULT_LOG_MAX_MB = 5
+LOG_BACKUPS = 3
+
+SpanListener = Callable[[Dict[str, Any]], None]
+
+_enabled = False
+_history: deque = deque(maxlen=DEFAULT_HISTORY)
+_listeners: List[SpanListener] = []
+_log: Optional[logging.Logger] = None
+_profile_dir: Optional[str] = None
+_profile_lock = threading.Lock()
+_local = threading.local()
+# Wall-clock time of perf_counter's zero, so span timestamps share one monotonic clock
+_CLOCK_OFFSET = time.time() - time.perf_counter()
+
+
+def configure(enabled: bool, log_path: Optional[str] = None, log_max_mb: float = DEFAULT_LOG_MAX_MB,
+              profile_dir: Optional[str] = None, history: int = DEFAULT_HISTORY) -> None:
+    """
+    Turn span recording on or off. Records go to an in-memory history of the last
+    `history` spans, to a rolling JSONL file at `log_path`, and, with `profile_dir`,
+    every top-level span is also run under cProfile and dumped there as a .prof file.
+    """
+    global _enabled, _history, _log, _profile_dir
+    if _history.maxlen != history:
+        _history = deque(_history, maxlen=history)
+    _profile_dir = profile_dir or None
+    if _log is not None:
+        for handler in list(_log.handlers):
+            _log.removeHandler(handler)
+            handler.close()
+        _log = None
+    if enabled and log_path:
+        os.makedirs(os.path.dirname(os.path.abspath(log_path)), exist_ok=True)
+        handler = RotatingFileHandler(
+            log_path, maxBytes=int(log_max_mb * 1024 ** 2), backupCount=LOG_BACKUPS, encoding="utf-8"
+        )
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        _log = logging.getLogger("dashgraph.spans")
+        _log.propagate = False
+        _log.setLevel(logging.INFO)
+        _log.addHandler(handler)
+    _enabled = enabled
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def add_listener(listener: SpanListener) -> None:
+    """
+    Call `listener(record)` for every finished span, on the thread that ran it.
+    """
+    _listeners.append(listener)
+
+
+def remove_listener(listener: SpanListener) -> None:
+    if listener in _listeners:
+        _listeners.remove(listener)
+
+
+def history() -> List[Dict[str, Any]]:
+    return list(_history)
+
+
+def _rss_mb() -> Optional[float]:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024 ** 2
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _peak_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak / 1024 ** 2 if os.uname().sysname == "Darwin" else peak / 1024
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        return False
+
+    def set(self, **attrs) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Span:
+    """
+    One timed operation. Records wall time, CPU time (process and calling
+    thread), current and peak RSS, an optional row count and any extra
+    attributes set with `set()`. Spans nest per thread.
+    """
+
+    def __init__(self, name: str, attrs: Dict[str, Any]):
+        self.name = name
+        self.attrs = attrs
+        self._profile: Optional[cProfile.Profile] = None
+
+    def set(self, **attrs) -> None:
+        self.attrs.update(attrs)
+
+    def __enter__(self) -> "Span":
+        stack = getattr(_local, "stack", None)
+        if stack is None:
+            stack = _local.stack = []
+        self.parent = stack[-1].name if stack else None
+        self.depth = len(stack)
+        stack.append(self)
+        if _profile_dir and not stack[:-1] and _profile_lock.acquire(blocking=False):
+            # One profiler at a time; concurrent top-level spans run unprofiled
+            self._profile = cProfile.Profile()
+            try:
+                self._profile.enable()
+            except ValueError:
+                self._profile = None
+                _profile_lock.release()
+        self.started = time.time()
+        self._wall = time.perf_counter()
+        self._cpu = time.process_time()
+        self._thread_cpu = time.thread_time()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        wall = time.perf_counter() - self._wall
+        cpu = time.process_time() - self._cpu
+        thread_cpu = time.thread_time() - self._thread_cpu
+        _local.stack.pop()
+        record = {
+            "name": self.name,
+            "started": datetime.fromtimestamp(self.started).isoformat(timespec="milliseconds"),
+            # Full-precision start and end on the monotonic clock, for ordering nested spans
+            "started_ts": _CLOCK_OFFSET + self._wall,
+            "ended_ts": _CLOCK_OFFSET + self._wall + wall,
+            "wall_s": round(wall, 6),
+            "cpu_s": round(cpu, 6),
+            "thread_cpu_s": round(thread_cpu, 6),
+            "rss_mb": _rss_mb(),
+            "peak_rss_mb": _peak_rss_mb(),
+            "status": "ok" if exc_type is None else "error",
+            "parent": self.parent,
+            "depth": self.depth,
+            "thread": threading.current_thread().name,
+            **self.attrs,
+        }
+        if exc_type is not None:
+            record["error"] = f"{exc_type.__name__}: {exc}"
+        if self._profile is not None:
+            self._profile.disable()
+            _profile_lock.release()
+            record["profile"] = self._dump_profile()
+        _emit(record)
+        return False
+
+    def _dump_profile(self) -> Optional[str]:
+        try:
+            os.makedirs(_profile_dir, exist_ok=True)
+            stamp = datetime.fromtimestamp(self.started).strftime("%Y-%m-%d_%H-%M-%S")
+            path = os.path.join(_profile_dir, f"{stamp}_{self.name}.prof")
+            self._profile.dump_stats(path)
+            return path
+        except OSError as e:
+            logger.warning(f"Could not write profile for {self.name}: {e}")
+            return None
+
+
+def span(name: str, **attrs) -> Any:
+    """
+    Context manager timing a stage, e.g. `with span("eda.plots", rows=len(df)):`.
+    When recording is off this returns a shared no-op object, so instrumented
+    code pays one flag check.
+    """
+    if not _enabled:
+        return _NULL_SPAN
+    return Span(name, attrs)
+
+
+def _emit(record: Dict[str, Any]) -> None:
+    _history.append(record)
+    if _log is not None:
+        _log.info(json.dumps(record, default=str))
+    for listener in list(_listeners):
+        try:
+            listener(record)
+        except Exception:
+            logger.exception("Span listener failed")
+
+
+def export_speedscope(path: str, records: Optional[List[Dict[str, Any]]] = None) -> str:
+    """
+    Write spans as a speedscope evented profile (the format `py-spy record
+    --format speedscope` produces), one timeline per thread, for viewing at
+    https://www.speedscope.app or next to a py-spy recording.
+    """
+    records = history() if records is None else records
+    frames: Dict[str, int] = {}
+    threads: Dict[str, List] = {}
+    for record in records:
+        if "started_ts" in record:
+            start, end = record["started_ts"], record["ended_ts"]
+        else:  # records from logs written before the raw timestamps were kept
+            start = datetime.fromisoformat(record["started"]).timestamp()
+            end = start + record["wall_s"]
+        frame = frames.setdefault(record["name"], len(frames))
+        events = threads.setdefault(record["thread"], [])
+        # At the same instant closes come before opens, outer spans open first and close last
+        events.append((start, 1, record["depth"], "O", frame))
+        events.append((end, 0, -record["depth"], "C", frame))
+    profiles = []
+    for thread, events in threads.items():
+        events.sort()
+        origin = events[0][0]
+        profiles.append({
+            "type": "evented",
+            "name": thread,
+            "unit": "seconds",
+            "startValue": 0,
+            "endValue": max(e[0] for e in events) - origin,
+            "events": [{"type": kind, "frame": frame, "at": at - origin} for at, _, _, kind, frame in events],
+        })
+    document = {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "shared": {"frames": [{"name": name} for name in frames]},
+        "profiles": profiles,
+        "name": "DashGraph spans",
+        "exporter": "dashgraph-instrumentation",
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(document, f)
+    return path
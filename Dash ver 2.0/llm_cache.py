@@ -0,0 +1,177 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional
+
+import pandas as pd
+
+# Bump when the cached payload format changes
+CACHE_VERSION = "1"
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".dashgraph", "llm_cache.sqlite")
+DEFAULT_TTL_HOURS = 24 * 7
+DEFAULT_MAX_ENTRIES = 5000
+
+logger = logging.getLogger(__name__)
+
+
+class LLMCacheMiss(RuntimeError):
+    """Raised in offline mode when a request has no cached response."""
+
+
+def schema_fingerprint(df: Optional[pd.DataFrame]) -> str:
+    """
+    Hash of a frame's column names and dtypes, i.e. what prompts are written against.
+    """
+    if df is None:
+        return ""
+    schema = [(str(col), str(dtype)) for col, dtype in df.dtypes.items()]
+    return hashlib.sha256(json.dumps(schema).encode("utf-8")).hexdigest()[:32]
+
+
+def request_key(deployment: str, system_prompt: str, user_prompt: str, schema: str = "") -> str:
+    payload = json.dumps([CACHE_VERSION, deployment, system_prompt, user_prompt, schema])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMCache:
+    """
+    Persistent SQLite cache of LLM responses with TTL and LRU eviction.
+
+    `get_or_create` also deduplicates in-flight requests: concurrent callers with
+    the same key wait for the first one's result instead of calling the API again.
+    Counters for hits, misses and deduplicated calls are kept per process.
+    With `offline` set, misses raise LLMCacheMiss instead of calling the API.
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttl_hours: float = DEFAULT_TTL_HOURS,
+                 max_entries: int = DEFAULT_MAX_ENTRIES, offline: bool = False):
+        self.path = path
+        self.ttl = ttl_hours * 3600
+        self.max_entries = max_entries
+        self.offline = offline
+        self.hits = 0
+        self.misses = 0
+        self.deduplicated = 0
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, Future] = {}
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def _db(self) -> sqlite3.Connection:
+        # Opened on first use; callers hold self._lock
+        if self._conn is None:
+            if self.path != ":memory:":
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=10)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, deployment TEXT, response TEXT, created REAL, used REAL, hits INTEGER)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def get(self, key: str) -> Optional[str]:
+        if not self.enabled:
+            return None
+        now = time.time()
+        with self._lock:
+            try:
+                db = self._db()
+                row = db.execute("SELECT response, created FROM responses WHERE key = ?", (key,)).fetchone()
+                if row is not None and self.ttl > 0 and now - row[1] > self.ttl:
+                    db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    db.commit()
+                    row = None
+                if row is not None:
+                    db.execute("UPDATE responses SET used = ?, hits = hits + 1 WHERE key = ?", (now, key))
+                    db.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"LLM cache read failed: {e}")
+                row = None
+        return row[0] if row is not None else None
+
+    def put(self, key: str, response: str, deployment: str = "") -> None:
+        if not self.enabled:
+            return
+        now = time.time()
+        with self._lock:
+            try:
+                db = self._db()
+                db.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, 0)", (key, deployment, response, now, now)
+                )
+                if self.ttl > 0:
+                    db.execute("DELETE FROM responses WHERE created < ?", (now - self.ttl,))
+                db.execute(
+                    "DELETE FROM responses WHERE key IN (SELECT key FROM responses ORDER BY used DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+                db.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"LLM cache write failed: {e}")
+
+    def get_or_create(self, key: str, create: Callable[[], str], deployment: str = "") -> str:
+        """
+        Cached response for `key`, or the result of `create()`, which is then cached.
+        Only successful responses are stored; exceptions reach every waiting caller.
+        """
+        cached = self.get(key)
+        if cached is not None:
+            self.hits += 1
+            logger.info(f"LLM cache hit ({self.hits} hits, {self.misses} misses)")
+            return cached
+
+        with self._lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+            else:
+                self.deduplicated += 1
+        if not owner:
+            logger.info("LLM request already in flight, waiting for it")
+            return future.result()
+
+        try:
+            # The previous owner may have finished between our lookup and taking ownership
+            cached = self.get(key)
+            if cached is not None:
+                self.hits += 1
+                future.set_result(cached)
+                return cached
+            self.misses += 1
+            if self.offline:
+                raise LLMCacheMiss("No cached response for this request (offline mode)")
+            response = create()
+            self.put(key, response, deployment)
+            future.set_result(response)
+            return response
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            try:
+                entries = self._db().execute("SELECT COUNT(*) FROM responses").fetchone()[0] if self.enabled else 0
+            except sqlite3.Error:
+                entries = None
+        return {"hits": self.hits, "misses": self.misses, "deduplicated": self.deduplicated, "entries": entries}
+
+    def clear(self) -> None:
+        with self._lock:
+            if self.enabled:
+                self._db().execute("DELETE FROM responses")
+                self._db().commit()
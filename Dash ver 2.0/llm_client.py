@@ -0,0 +1,314 @@
+import json
+import time
+import random
+import asyncio
+import logging
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import AsyncIterator, Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+TokenCallback = Callable[[str], None]
+
+DEFAULT_TIMEOUT = 60.0
+DEFAULT_DEADLINE = 120.0
+DEFAULT_MAX_RETRIES = 3
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 8.0
+
+
+class LLMBackend(ABC):
+    """
+    A source of chat completions. `stream` yields the response text in pieces
+    as they arrive; backends own their connections and reuse them across calls.
+    """
+
+    @abstractmethod
+    def stream(self, system_prompt: str, user_prompt: str, timeout: float) -> AsyncIterator[str]:
+        ...
+
+    async def aclose(self) -> None:
+        pass
+
+
+class AzureBackend(LLMBackend):
+    """
+    Streams from an Azure OpenAI deployment through one AsyncAzureOpenAI client,
+    so its HTTP connection pool is shared by every call. Retries are left to LLMClient.
+    """
+
+    def __init__(self, api_key: str, endpoint: str, deployment: str, api_version: str):
+        from openai import AsyncAzureOpenAI
+
+        self.deployment = deployment
+        self.client = AsyncAzureOpenAI(
+            api_key=api_key, azure_endpoint=endpoint, api_version=api_version, max_retries=0
+        )
+
+    async def stream(self, system_prompt: str, user_prompt: str, timeout: float) -> AsyncIterator[str]:
+        response = await self.client.chat.completions.create(
+            model=self.deployment,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            stream=True,
+            timeout=timeout,
+        )
+        async for chunk in response:
+            # Azure sends a first chunk with no choices (content filter results)
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    async def aclose(self) -> None:
+        await self.client.close()
+
+
+# ────────────── Deterministic stub ──────────────
+
+def stub_response(system_prompt: str, user_prompt: str) -> str:
+    """
+    The stub's fixed answer: plotting code when code is asked for, otherwise a short HTML summary.
+    """
+    if "code" in system_prompt.lower():
+        return (
+            "```python\n"
+            "import matplotlib.pyplot as plt\n"
+            "df.select_dtypes('number').iloc[:, :1].plot()\n"
+            "plt.title('Stub plot')\n"
+            "```"
+        )
+    return f"<p>Stub summary of a {len(user_prompt)}-character prompt.</p>"
+
+
+def _tokens(text: str, size: int = 4) -> List[str]:
+    return [text[i:i + size] for i in range(0, len(text), size)] or [""]
+
+
+class StubBackend(LLMBackend):
+    """
+    In-process backend with fixed answers and configurable latency, for tests and
+    benchmarks that should not depend on the network.
+    """
+
+    def __init__(self, first_token_delay: float = 0.05, token_delay: float = 0.0,
+                 responder: Callable[[str, str], str] = stub_response):
+        self.first_token_delay = first_token_delay
+        self.token_delay = token_delay
+        self.responder = responder
+
+    async def stream(self, system_prompt: str, user_prompt: str, timeout: float) -> AsyncIterator[str]:
+        await asyncio.sleep(self.first_token_delay)
+        for token in _tokens(self.responder(system_prompt, user_prompt)):
+            if self.token_delay:
+                await asyncio.sleep(self.token_delay)
+            yield token
+
+
+class StubServer:
+    """
+    Local HTTP server speaking the Azure OpenAI chat-completions protocol,
+    including server-sent-event streaming, with the same fixed answers as
+    StubBackend. Point AZURE_ENDPOINT at `url` to exercise the real client path.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, first_token_delay: float = 0.05,
+                 token_delay: float = 0.0, responder: Callable[[str, str], str] = stub_response):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                logger.debug(format % args)
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+                messages = {m.get("role"): m.get("content", "") for m in body.get("messages", [])}
+                text = stub.responder(messages.get("system", ""), messages.get("user", ""))
+                model = body.get("model", "stub")
+                time.sleep(stub.first_token_delay)
+                if body.get("stream"):
+                    self._stream(text, model)
+                else:
+                    self._send_json({
+                        "id": "stub", "object": "chat.completion", "created": 0, "model": model,
+                        "choices": [{"index": 0, "finish_reason": "stop",
+                                     "message": {"role": "assistant", "content": text}}],
+                    })
+
+            def _send_json(self, payload):
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _stream(self, text, model):
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                for i, token in enumerate(_tokens(text) + [None]):
+                    if stub.token_delay and token is not None:
+                        time.sleep(stub.token_delay)
+                    delta = {"content": token} if token is not None else {}
+                    if i == 0:
+                        delta["role"] = "assistant"
+                    chunk = {
+                        "id": "stub", "object": "chat.completion.chunk", "created": 0, "model": model,
+                        "choices": [{"index": 0, "delta": delta, "finish_reason": None if token is not None else "stop"}],
+                    }
+                    self._chunk(f"data: {json.dumps(chunk)}\n\n")
+                self._chunk("data: [DONE]\n\n")
+                self.wfile.write(b"0\r\n\r\n")
+
+            def _chunk(self, text):
+                data = text.encode("utf-8")
+                self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+                self.wfile.flush()
+
+        self.first_token_delay = first_token_delay
+        self.token_delay = token_delay
+        self.responder = responder
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self) -> "StubServer":
+        self._thread = threading.Thread(target=self.server.serve_forever, name="llm-stub-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self) -> "StubServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+# ────────────── Client ──────────────
+
+def is_retryable(error: BaseException) -> bool:
+    """
+    Connection problems, timeouts, rate limits and server errors are worth retrying.
+    """
+    if isinstance(error, (ConnectionError, asyncio.TimeoutError)):
+        return True
+    try:
+        import openai
+    except ImportError:
+        return False
+    if isinstance(error, openai.APIConnectionError):  # includes APITimeoutError
+        return True
+    if isinstance(error, openai.APIStatusError):
+        return error.status_code in (408, 409, 429) or error.status_code >= 500
+    return False
+
+
+class LLMClient:
+    """
+    Runs a backend on a private asyncio loop in a background thread, so callers
+    on any thread (Qt workers included) can stream completions without an event
+    loop of their own.
+
+    Each call has a per-attempt timeout and an overall deadline. Retryable
+    failures are retried with exponential backoff and jitter, but only before
+    the first token was delivered, so a listener never sees text twice.
+    """
+
+    def __init__(self, backend: LLMBackend, timeout: float = DEFAULT_TIMEOUT,
+                 deadline: float = DEFAULT_DEADLINE, max_retries: int = DEFAULT_MAX_RETRIES):
+        self.backend = backend
+        self.timeout = timeout
+        self.deadline = deadline
+        self.max_retries = max_retries
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="llm-client", daemon=True)
+        self._thread.start()
+
+    async def _attempt(self, system_prompt: str, user_prompt: str, timeout: float,
+                       on_token: Optional[TokenCallback], delivered: List[str]) -> str:
+        async def consume() -> str:
+            async for token in self.backend.stream(system_prompt, user_prompt, timeout):
+                delivered.append(token)
+                if on_token:
+                    on_token(token)
+            return "".join(delivered)
+
+        return await asyncio.wait_for(consume(), timeout)
+
+    async def acomplete(self, system_prompt: str, user_prompt: str, on_token: Optional[TokenCallback] = None,
+                        deadline: Optional[float] = None) -> str:
+        """
+        Full response text; `on_token` receives each piece as it streams in.
+        """
+        deadline = self.deadline if deadline is None else deadline
+        end = time.monotonic() + deadline
+        attempt = 0
+        while True:
+            delivered: List[str] = []
+            remaining = end - time.monotonic()
+            try:
+                if remaining <= 0:
+                    raise TimeoutError(f"LLM request exceeded its {deadline:.0f}s deadline")
+                return await self._attempt(system_prompt, user_prompt, min(self.timeout, remaining), on_token, delivered)
+            except Exception as e:
+                if delivered or attempt >= self.max_retries or not is_retryable(e):
+                    raise
+                delay = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt) * random.uniform(0.5, 1.0)
+                if time.monotonic() + delay >= end:
+                    raise
+                attempt += 1
+                logger.warning(f"LLM request failed ({e!r}); retry {attempt}/{self.max_retries} in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+    def submit(self, system_prompt: str, user_prompt: str, on_token: Optional[TokenCallback] = None,
+               deadline: Optional[float] = None) -> Future:
+        """
+        Start a completion from any thread. `on_token` runs on the client's loop thread.
+        """
+        return asyncio.run_coroutine_threadsafe(
+            self.acomplete(system_prompt, user_prompt, on_token, deadline), self._loop
+        )
+
+    def complete(self, system_prompt: str, user_prompt: str, on_token: Optional[TokenCallback] = None,
+                 deadline: Optional[float] = None) -> str:
+        return self.submit(system_prompt, user_prompt, on_token, deadline).result()
+
+    def close(self) -> None:
+        if self._loop.is_closed():
+            return
+        asyncio.run_coroutine_threadsafe(self.backend.aclose(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Serve the deterministic LLM stub over HTTP.")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--first-token-delay", type=float, default=0.05)
+    parser.add_argument("--token-delay", type=float, default=0.0)
+    args = parser.parse_args()
+    with StubServer(port=args.port, first_token_delay=args.first_token_delay, token_delay=args.token_delay) as stub:
+        print(f"LLM stub listening on {stub.url} (set AZURE_ENDPOINT to this URL)")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
@@ -1,15 +1,29 @@
 """Entry point for the DashGraph application."""
 
+import os
 import sys
-from PyQt5.QtWidgets import QApplication
-from ui import DashGraphApp
 
 if __name__ == '__main__':
+    # Imported here so EDA worker processes, which re-import this module, skip the GUI
+    from PyQt5.QtCore import Qt
+    from PyQt5.QtGui import QPixmap
+    from PyQt5.QtWidgets import QApplication, QSplashScreen
+
     try:
         app = QApplication(sys.argv)
+        # Qt alone starts in a fraction of the time pandas takes, so show something first
+        icon_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "icon.png")
+        splash = QSplashScreen(QPixmap(icon_path).scaled(256, 256, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        splash.showMessage("Loading DashGraph...", Qt.AlignBottom | Qt.AlignHCenter)
+        splash.show()
+        app.processEvents()
+
+        from ui import DashGraphApp
+
         window = DashGraphApp()
         window.show()
+        splash.finish(window)
         sys.exit(app.exec_())
     except Exception as e:
         print(f"❌ Application crashed: {e}")
-        sys.exit(1)
\ No newline at end of file
+        sys.exit(1)
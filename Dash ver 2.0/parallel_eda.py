@@ -0,0 +1,196 @@
+import atexit
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from eda_stats import (
+    categorical_stats, column_groups, compute_column_stats, numeric_block_columns, numeric_block_stats, other_stats
+)
+
+try:
+    import pyarrow as pa
+except ImportError:  # pyarrow is optional; without it text columns are profiled in the main process
+    pa = None
+
+logger = logging.getLogger(__name__)
+
+# Below this many cells the pool start-up and copies cost more than they save
+PARALLEL_MIN_CELLS = 2_000_000
+# Text columns per shared Arrow buffer
+TEXT_BLOCK_COLUMNS = 8
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_workers = 0
+
+
+def resolve_workers(workers: Optional[int]) -> int:
+    """
+    Worker count from a setting: 0 or None means one per CPU.
+    """
+    return max(1, workers or os.cpu_count() or 1)
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    # The pool is kept between runs; workers are started without fork because
+    # the caller is usually a GUI process with live threads.
+    global _pool, _pool_workers
+    if _pool is None or _pool_workers != workers:
+        shutdown_pool()
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+        _pool = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+        _pool_workers = workers
+    return _pool
+
+
+def shutdown_pool() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+atexit.register(shutdown_pool)
+
+
+def _attach(name: str) -> SharedMemory:
+    try:
+        return SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13: workers share the creator's resource tracker, where a second
+        # registration is a no-op, and the creator's unlink() unregisters it
+        return SharedMemory(name=name)
+
+
+# ────────────── Worker side ──────────────
+
+def _numeric_block_worker(name: str, shape: Tuple[int, int], start: int, stop: int) -> Dict[str, np.ndarray]:
+    shm = _attach(name)
+    try:
+        matrix = np.ndarray(shape, dtype="float64", buffer=shm.buf, order="F")
+        # Column slices of a Fortran-order matrix are contiguous: no copy. The block
+        # is sorted in place, which is fine because no other worker reads its columns
+        stats = numeric_block_stats(matrix[:, start:stop])
+        del matrix
+        return stats
+    finally:
+        shm.close()
+
+
+def _text_block_worker(name: str, size: int) -> List[Dict[str, Any]]:
+    shm = _attach(name)
+    try:
+        table = pa.ipc.open_stream(pa.py_buffer(shm.buf)[:size]).read_all()
+        stats = [categorical_stats(column.to_pandas()) for column in table.columns]
+        del table
+        return stats
+    finally:
+        shm.close()
+
+
+# ────────────── Main-process side ──────────────
+
+def _share_numeric(df: pd.DataFrame, columns: Sequence[Any]) -> Tuple[SharedMemory, Tuple[int, int]]:
+    shape = (len(df), len(columns))
+    shm = SharedMemory(create=True, size=max(1, shape[0] * shape[1] * 8))
+    matrix = np.ndarray(shape, dtype="float64", buffer=shm.buf, order="F")
+    for i, col in enumerate(columns):
+        matrix[:, i] = df[col].to_numpy(dtype="float64", na_value=np.nan)
+    del matrix
+    return shm, shape
+
+
+def _share_text(df: pd.DataFrame, columns: Sequence[Any]) -> Tuple[SharedMemory, int]:
+    # Arrow IPC stream written straight into shared memory; workers read it zero-copy
+    table = pa.table({str(i): pa.array(df[col], from_pandas=True) for i, col in enumerate(columns)})
+    sink = pa.MockOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    size = sink.size()
+    shm = SharedMemory(create=True, size=max(1, size))
+    with pa.ipc.new_stream(pa.FixedSizeBufferWriter(pa.py_buffer(shm.buf)), table.schema) as writer:
+        writer.write_table(table)
+    return shm, size
+
+
+def _release(blocks: List[SharedMemory]) -> None:
+    for shm in blocks:
+        shm.close()
+        shm.unlink()
+
+
+def compute_column_stats_parallel(
+    df: pd.DataFrame, workers: Optional[int] = None, min_cells: int = PARALLEL_MIN_CELLS
+) -> Dict[Any, Dict[str, Any]]:
+    """
+    Same result as eda_stats.compute_column_stats, with column blocks spread over
+    a process pool.
+
+    Numeric columns are copied once into a shared-memory matrix and text columns
+    into shared Arrow buffers, so workers never unpickle the frame; only the
+    per-column results travel back. Categorical, boolean and datetime columns are
+    cheap and are profiled in this process while the workers run. Falls back to
+    the serial path for one worker, small frames, or when the pool fails.
+    """
+    workers = resolve_workers(workers)
+    if workers == 1 or df.size < min_cells:
+        return compute_column_stats(df)
+
+    groups = column_groups(df.dtypes)
+    numerical = groups["numerical"]
+    text = [col for col in groups["text"] if pa is not None]
+    local = [col for col in df.columns if col not in set(numerical) | set(text)]
+
+    # Several blocks per worker so uneven blocks still balance out
+    block_size = max(1, min(numeric_block_columns(len(df)), -(-len(numerical) // (workers * 4))))
+    shared: List[SharedMemory] = []
+    stats: Dict[Any, Dict[str, Any]] = {}
+    try:
+        pool = _get_pool(workers)
+        futures = []
+        if numerical:
+            shm, shape = _share_numeric(df, numerical)
+            shared.append(shm)
+            for start in range(0, len(numerical), block_size):
+                block = numerical[start:start + block_size]
+                futures.append((block, pool.submit(_numeric_block_worker, shm.name, shape, start, start + len(block))))
+        for start in range(0, len(text), TEXT_BLOCK_COLUMNS):
+            block = text[start:start + TEXT_BLOCK_COLUMNS]
+            try:
+                shm, size = _share_text(df, block)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                local.extend(block)  # object columns with mixed value types
+                continue
+            shared.append(shm)
+            futures.append((block, pool.submit(_text_block_worker, shm.name, size)))
+
+        for col in local:
+            stats[col] = categorical_stats(df[col]) if col in groups["categorical"] else other_stats(df[col])
+
+        for block, future in futures:
+            result = future.result()
+            if isinstance(result, dict):
+                for i, col in enumerate(block):
+                    entry = {name: values[i].item() for name, values in result.items()}
+                    entry["kind"] = "numeric"
+                    entry["distinct"] = int(entry["distinct"])
+                    stats[col] = entry
+            else:
+                for col, entry in zip(block, result):
+                    entry["top"].index.name = col
+                    stats[col] = entry
+    except (BrokenProcessPool, OSError) as e:
+        logger.warning(f"Parallel EDA failed ({e}); falling back to serial")
+        shutdown_pool()
+        return compute_column_stats(df)
+    finally:
+        _release(shared)
+
+    return {col: stats[col] for col in df.columns}
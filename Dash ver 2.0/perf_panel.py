@@ -0,0 +1,103 @@
+from typing import Any, Dict
+
+from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtWidgets import (
+    QCheckBox, QFileDialog, QHBoxLayout, QHeaderView, QPushButton, QTableWidget, QTableWidgetItem,
+    QVBoxLayout, QWidget
+)
+
+import instrumentation
+
+COLUMNS = [
+    ("Operation", "name"), ("Started", "started"), ("Wall s", "wall_s"), ("CPU s", "cpu_s"),
+    ("RSS MB", "rss_mb"), ("Peak RSS MB", "peak_rss_mb"), ("Rows", "rows"), ("Status", "status"),
+]
+
+
+def _format(key: str, value: Any) -> str:
+    if value is None:
+        return ""
+    if key in ("wall_s", "cpu_s"):
+        return f"{value:.3f}"
+    if key in ("rss_mb", "peak_rss_mb"):
+        return f"{value:,.0f}"
+    if key == "rows":
+        return f"{value:,}"
+    if key == "started":
+        return value.split("T")[-1]
+    return str(value)
+
+
+class PerformancePanel(QWidget):
+    """
+    Table of the most recent timed operations (see instrumentation), newest
+    first, with nested stages indented under their operation.
+    """
+
+    # Spans finish on worker threads; the signal hands them to the GUI thread
+    _recorded = pyqtSignal(dict)
+    recording_changed = pyqtSignal(bool)
+
+    def __init__(self, limit: int = instrumentation.DEFAULT_HISTORY, parent=None):
+        super().__init__(parent)
+        self.limit = limit
+
+        self.record_check = QCheckBox("Record timings")
+        self.record_check.setChecked(instrumentation.is_enabled())
+        self.record_check.toggled.connect(self.recording_changed)
+        clear_button = QPushButton("🧹 Clear")
+        clear_button.clicked.connect(self.clear)
+        export_button = QPushButton("💾 Export Speedscope")
+        export_button.setToolTip("Save the recorded spans as a speedscope profile (same format as py-spy)")
+        export_button.clicked.connect(self.export_speedscope)
+        controls = QHBoxLayout()
+        controls.addWidget(self.record_check)
+        controls.addStretch(1)
+        controls.addWidget(clear_button)
+        controls.addWidget(export_button)
+
+        self.table = QTableWidget(0, len(COLUMNS))
+        self.table.setHorizontalHeaderLabels([label for label, _ in COLUMNS])
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+
+        layout = QVBoxLayout()
+        layout.addLayout(controls)
+        layout.addWidget(self.table)
+        self.setLayout(layout)
+
+        self._recorded.connect(self.add_record, Qt.QueuedConnection)
+        self._listener = self._recorded.emit
+        instrumentation.add_listener(self._listener)
+        for record in instrumentation.history():
+            self.add_record(record)
+
+    def add_record(self, record: Dict[str, Any]) -> None:
+        # Children finish before their parent, so inserting at the top keeps
+        # each operation above its stages
+        self.table.insertRow(0)
+        for column, (_, key) in enumerate(COLUMNS):
+            text = _format(key, record.get(key))
+            if key == "name":
+                text = "    " * record.get("depth", 0) + text
+            item = QTableWidgetItem(text)
+            if key == "status" and record.get("error"):
+                item.setToolTip(record["error"])
+            if key != "name":
+                item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+            self.table.setItem(0, column, item)
+        while self.table.rowCount() > self.limit:
+            self.table.removeRow(self.table.rowCount() - 1)
+
+    def detach(self) -> None:
+        instrumentation.remove_listener(self._listener)
+
+    def clear(self) -> None:
+        self.table.setRowCount(0)
+
+    def export_speedscope(self) -> None:
+        path, _ = QFileDialog.getSaveFileName(self, "Export Timings", "dashgraph.speedscope.json", "JSON (*.json)")
+        if path:
+            instrumentation.export_speedscope(path)
@@ -0,0 +1,266 @@
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from matplotlib.collections import PathCollection
+from matplotlib.colors import LinearSegmentedColormap, to_rgba
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+
+# Artists with more points than this are drawn from a view-dependent reduction
+LINE_POINT_LIMIT = 20_000
+SCATTER_POINT_LIMIT = 50_000
+# Density cells are this many pixels wide
+DENSITY_CELL_PIXELS = 3
+# Resolution of the precomputed whole-data density grid
+DENSITY_GRID = 1024
+SERIES_GID = "dash-series-{}"
+
+Series = Dict[str, Tuple[np.ndarray, np.ndarray]]
+
+
+def _as_float(values) -> Optional[np.ndarray]:
+    try:
+        return np.asarray(values, dtype="float64").ravel()
+    except (TypeError, ValueError):
+        return None
+
+
+def extract_series(fig: Figure, line_limit: int = LINE_POINT_LIMIT,
+                   scatter_limit: int = SCATTER_POINT_LIMIT) -> Series:
+    """
+    Pull the data of every oversized line and scatter out of `fig`.
+
+    Returns {gid: (x, y)} as float arrays in data coordinates; the artists keep
+    the gid and are left empty, and the affected axes keep their current limits,
+    so the figure pickles small and a Decimator can redraw it from the arrays.
+    """
+    series: Series = {}
+    for ax in fig.axes:
+        found = []
+        for line in ax.lines:
+            if len(line.get_xdata(orig=True)) > line_limit:
+                x = _as_float(line.convert_xunits(line.get_xdata(orig=True)))
+                y = _as_float(line.convert_yunits(line.get_ydata(orig=True)))
+                if x is not None and y is not None and len(x) == len(y):
+                    found.append((line, x, y))
+        for collection in ax.collections:
+            if isinstance(collection, PathCollection) and len(collection.get_offsets()) > scatter_limit:
+                offsets = np.asarray(collection.get_offsets(), dtype="float64")
+                found.append((collection, offsets[:, 0].copy(), offsets[:, 1].copy()))
+        if not found:
+            continue
+        # Freeze the view before the data goes, or autoscaling would shrink it to nothing
+        ax.set_xlim(ax.get_xlim())
+        ax.set_ylim(ax.get_ylim())
+        for artist, x, y in found:
+            gid = SERIES_GID.format(len(series))
+            artist.set_gid(gid)
+            if isinstance(artist, Line2D):
+                artist.set_data([], [])
+                artist.recache_always()  # drop the cached full-size paths too
+            else:
+                artist.set_offsets(np.empty((0, 2)))
+            series[gid] = (x, y)
+    return series
+
+
+# ────────────── Reductions ──────────────
+
+def envelope(x: np.ndarray, y: np.ndarray, lo: float, hi: float, bins: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Min/max envelope of a line with sorted x over [lo, hi]: per x-bin the lowest
+    and highest point, so every spike stays visible at pixel resolution. One
+    point on each side of the range is kept so the line runs off the edges.
+    """
+    start = max(0, int(np.searchsorted(x, lo, side="left")) - 1)
+    stop = min(len(x), int(np.searchsorted(x, hi, side="right")) + 1)
+    xs, ys = x[start:stop], y[start:stop]
+    if len(xs) <= 2 * bins:
+        return xs, ys
+    edges = np.searchsorted(xs, np.linspace(xs[0], xs[-1], bins + 1)[1:-1])
+    starts = np.unique(np.concatenate(([0], edges)))
+    starts = starts[starts < len(xs)]
+    ends = np.append(starts[1:], len(xs)) - 1
+    # fmin/fmax skip NaN gaps unless a whole bin is NaN
+    low = np.fmin.reduceat(ys, starts)
+    high = np.fmax.reduceat(ys, starts)
+    out_x = np.empty(2 * len(starts))
+    out_y = np.empty(2 * len(starts))
+    out_x[0::2], out_x[1::2] = xs[starts], xs[ends]
+    out_y[0::2], out_y[1::2] = low, high
+    return out_x, out_y
+
+
+def density(x: np.ndarray, y: np.ndarray, extent: Tuple[float, float, float, float],
+            shape: Tuple[int, int]) -> np.ndarray:
+    """
+    Point counts on a (rows, columns) grid over extent (x0, x1, y0, y1), row 0 at y0.
+    """
+    x0, x1, y0, y1 = extent
+    rows, columns = shape
+    col = (x - x0) * (columns / ((x1 - x0) or 1))
+    row = (y - y0) * (rows / ((y1 - y0) or 1))
+    # The far edge belongs to the last cell
+    col[col == columns] = columns - 1
+    row[row == rows] = rows - 1
+    inside = (col >= 0) & (col < columns) & (row >= 0) & (row < rows)
+    index = row[inside].astype(np.int64) * columns + col[inside].astype(np.int64)
+    return np.bincount(index, minlength=rows * columns).reshape(rows, columns)
+
+
+# ────────────── Live decimation ──────────────
+
+class _LineView:
+    def __init__(self, line: Line2D, x: np.ndarray, y: np.ndarray):
+        self.line = line
+        self.sorted = bool(np.all(x[1:] >= x[:-1]))
+        if not self.sorted:
+            # Not a function of x (or NaN in x): an even stride is the best we can do
+            step = max(1, len(x) // LINE_POINT_LIMIT)
+            x, y = x[::step], y[::step]
+        self.x, self.y = x, y
+
+    def update(self, ax, pixels: int) -> None:
+        if self.sorted:
+            lo, hi = sorted(ax.get_xlim())
+            self.line.set_data(*envelope(self.x, self.y, lo, hi, max(1, pixels)))
+        elif not len(self.line.get_xdata()):
+            self.line.set_data(self.x, self.y)
+
+
+class _ScatterView:
+    def __init__(self, ax, collection: PathCollection, x: np.ndarray, y: np.ndarray):
+        self.collection = collection
+        finite = np.isfinite(x) & np.isfinite(y)
+        x, y = x[finite], y[finite]
+        # Sorted by x once, so a view only scans the rows inside its x range
+        order = np.argsort(x, kind="stable")
+        self.x, self.y = x[order], y[order]
+        # Counts over the whole data at fixed resolution: zoomed-out views are
+        # re-binned from this grid instead of from the rows
+        self.extent = (self.x[0], self.x[-1], self.y.min(), self.y.max()) if len(x) else (0, 1, 0, 1)
+        self.grid = density(self.x, self.y, self.extent, (DENSITY_GRID, DENSITY_GRID))
+        color = collection.get_facecolor()
+        rgba = to_rgba(color[0]) if len(color) else to_rgba("C0")
+        # Transparent to the scatter's own colour, so dense regions read like overplotted points
+        cmap = LinearSegmentedColormap.from_list("density", [(*rgba[:3], 0.0), (*rgba[:3], rgba[3])])
+        self.image = ax.imshow(
+            np.zeros((1, 1)), cmap=cmap, origin="lower", aspect="auto", interpolation="nearest",
+            extent=(0, 1, 0, 1), zorder=collection.get_zorder(), vmin=0, vmax=1,
+        )
+
+    def _points(self, x0: float, x1: float, y0: float, y1: float) -> Tuple[np.ndarray, np.ndarray]:
+        start = np.searchsorted(self.x, min(x0, x1), side="left")
+        stop = np.searchsorted(self.x, max(x0, x1), side="right")
+        xs, ys = self.x[start:stop], self.y[start:stop]
+        visible = (ys >= min(y0, y1)) & (ys <= max(y0, y1))
+        return xs[visible], ys[visible]
+
+    def _from_grid(self, view: Tuple[float, float, float, float], shape: Tuple[int, int]) -> np.ndarray:
+        # Each grid cell goes to the screen cell holding its centre
+        ex0, ex1, ey0, ey1 = self.extent
+        centres_x = ex0 + (np.arange(DENSITY_GRID) + 0.5) * ((ex1 - ex0) / DENSITY_GRID)
+        centres_y = ey0 + (np.arange(DENSITY_GRID) + 0.5) * ((ey1 - ey0) / DENSITY_GRID)
+        x0, x1, y0, y1 = view
+        rows, columns = shape
+        col = np.floor((centres_x - x0) / ((x1 - x0) or 1) * columns).astype(np.int64)
+        row = np.floor((centres_y - y0) / ((y1 - y0) or 1) * rows).astype(np.int64)
+        keep_col = (col >= 0) & (col < columns)
+        keep_row = (row >= 0) & (row < rows)
+        sub = self.grid[np.ix_(keep_row, keep_col)]
+        index = row[keep_row][:, None] * columns + col[keep_col][None, :]
+        return np.bincount(index.ravel(), weights=sub.ravel(), minlength=rows * columns).reshape(rows, columns)
+
+    def update(self, ax, pixels: Tuple[int, int]) -> None:
+        x0, x1 = ax.get_xlim()
+        y0, y1 = ax.get_ylim()
+        if ax.get_xscale() != "linear" or ax.get_yscale() != "linear":
+            # Density cells assume linear axes; fall back to an even sample of the visible points
+            xs, ys = self._points(x0, x1, y0, y1)
+            step = max(1, len(xs) // SCATTER_POINT_LIMIT)
+            self.collection.set_offsets(np.column_stack((xs[::step], ys[::step])))
+            self.image.set_visible(False)
+            return
+
+        columns = max(1, pixels[0] // DENSITY_CELL_PIXELS)
+        rows = max(1, pixels[1] // DENSITY_CELL_PIXELS)
+        ex0, ex1, ey0, ey1 = self.extent
+        coarse = (abs(x1 - x0) / columns >= (ex1 - ex0) / DENSITY_GRID
+                  and abs(y1 - y0) / rows >= (ey1 - ey0) / DENSITY_GRID)
+        counts = self._from_grid((x0, x1, y0, y1), (rows, columns)) if coarse else None
+        if counts is None or counts.sum() <= SCATTER_POINT_LIMIT:
+            xs, ys = self._points(x0, x1, y0, y1)
+            if len(xs) <= SCATTER_POINT_LIMIT:
+                # Few enough points in view: draw the real markers
+                self.collection.set_offsets(np.column_stack((xs, ys)))
+                self.image.set_visible(False)
+                return
+            counts = density(xs, ys, (x0, x1, y0, y1), (rows, columns))
+
+        self.collection.set_offsets(np.empty((0, 2)))
+        shaded = np.log1p(counts)
+        self.image.set_data(shaded / (shaded.max() or 1))
+        self.image.set_extent((x0, x1, y0, y1))
+        self.image.set_visible(True)
+
+
+class Decimator:
+    """
+    Keeps large lines and scatters in a figure drawable at interactive speed.
+
+    Lines with sorted x are drawn as a min/max envelope with one bin per pixel
+    column of the visible range; scatters switch to a log-scaled density image
+    of the visible points once more than SCATTER_POINT_LIMIT are in view. Both
+    are recomputed from the full-resolution arrays whenever the view is zoomed,
+    panned or resized, so the cost depends on the pixels, not on the rows.
+    """
+
+    def __init__(self, fig: Figure, series: Series):
+        self.fig = fig
+        self._views: Dict[object, List] = {}
+        self._connections: List[Tuple[object, int]] = []
+        self._busy = False
+        for ax in fig.axes:
+            lines = [line for line in ax.lines if line.get_gid() in series]
+            scatters = [c for c in ax.collections if isinstance(c, PathCollection) and c.get_gid() in series]
+            if not lines and not scatters:
+                continue
+            # The density images must not move the view
+            ax.set_autoscale_on(False)
+            views = [_LineView(line, *series[line.get_gid()]) for line in lines]
+            views += [_ScatterView(ax, c, *series[c.get_gid()]) for c in scatters]
+            self._views[ax] = views
+            for event in ("xlim_changed", "ylim_changed"):
+                self._connections.append((ax.callbacks, ax.callbacks.connect(event, self._on_view_changed)))
+        if self._views:
+            self._connections.append((fig.canvas, fig.canvas.mpl_connect("resize_event", lambda event: self.refresh())))
+        self.refresh()
+
+    def _pixels(self, ax) -> Tuple[int, int]:
+        return max(1, int(ax.bbox.width)), max(1, int(ax.bbox.height))
+
+    def _update(self, ax) -> None:
+        if self._busy:
+            return
+        self._busy = True
+        try:
+            pixels = self._pixels(ax)
+            for view in self._views.get(ax, []):
+                view.update(ax, pixels[0] if isinstance(view, _LineView) else pixels)
+        finally:
+            self._busy = False
+
+    def _on_view_changed(self, ax) -> None:
+        self._update(ax)
+
+    def refresh(self) -> None:
+        for ax in self._views:
+            self._update(ax)
+
+    def detach(self) -> None:
+        for registry, cid in self._connections:
+            if hasattr(registry, "mpl_disconnect"):
+                registry.mpl_disconnect(cid)
+            else:
+                registry.disconnect(cid)
+        self._connections = []
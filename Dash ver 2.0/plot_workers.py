@@ -0,0 +1,349 @@
+import io
+import os
+import time
+import queue
+import pickle
+import signal
+import logging
+import threading
+import traceback
+import multiprocessing
+import weakref
+from dataclasses import dataclass, field
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+except ImportError:  # pyarrow is optional; without it frames are handed over pickled
+    pa = None
+
+try:
+    import resource
+except ImportError:  # not available on Windows; the wall-clock timeout still applies
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = 2
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_CPU_SECONDS = 20
+STARTUP_TIMEOUT = 60.0
+PLOT_DPI = 100
+
+
+class PlotError(RuntimeError):
+    """Raised when generated plot code fails, produces no figure, or exceeds its limits."""
+
+
+class PlotCancelled(PlotError):
+    """Raised when the caller cancels a plot while it is running."""
+
+
+@dataclass
+class PlotResult:
+    """
+    A rendered graph: the pickled figure with the full data of its large lines
+    and scatters in `series` (see plot_decimation), or a PNG when the figure
+    could not be pickled.
+    """
+    figure: Optional[bytes] = None
+    series: Dict[str, Tuple[np.ndarray, np.ndarray]] = field(default_factory=dict)
+    png: Optional[bytes] = None
+    seconds: float = 0.0
+
+    def load_figure(self):
+        """
+        The live Figure with a Decimator attached (kept as `figure.decimator`).
+        Imports matplotlib, so call it off the GUI thread when possible.
+        """
+        from plot_decimation import Decimator
+
+        fig = pickle.loads(self.figure)
+        fig.decimator = Decimator(fig, self.series)
+        return fig
+
+
+# ────────────── Worker side ──────────────
+
+def _attach(name: str) -> SharedMemory:
+    try:
+        return SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13: registration is shared with the creator, which unlinks it
+        return SharedMemory(name=name)
+
+
+def _load_frame(name: str, size: int, fmt: str) -> Tuple[pd.DataFrame, SharedMemory]:
+    shm = _attach(name)
+    buffer = shm.buf[:size]
+    if fmt == "arrow":
+        # Numeric columns without nulls stay backed by the shared block
+        df = pa.ipc.open_stream(pa.py_buffer(buffer)).read_all().to_pandas()
+    else:
+        df = pickle.loads(buffer)
+    del buffer
+    return df, shm
+
+
+def _worker_main(conn, memory_mb: int) -> None:
+    """
+    Plot worker loop: preload the plotting stack once, then run snippets against
+    the shared frame and send back the figure.
+    """
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    from plot_decimation import Decimator, extract_series
+
+    try:
+        import seaborn as sns
+    except ImportError:
+        sns = None
+
+    if resource is not None and memory_mb:
+        limit = memory_mb * 1024 ** 2
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    conn.send(("ready", os.getpid()))
+
+    frame_key = None
+    df = shm = None
+    while True:
+        try:
+            message = conn.recv()
+        except EOFError:
+            return
+        if message is None:
+            return
+        _, code, (key, name, size, fmt), cpu_seconds, aggs = message
+        try:
+            if key != frame_key:
+                del df
+                df = None
+                if shm is not None:
+                    try:
+                        shm.close()
+                    except BufferError:
+                        pass  # still referenced by the old frame's arrays; released with them
+                df, shm = _load_frame(name, size, fmt)
+                frame_key = key
+
+            if resource is not None and cpu_seconds:
+                # RLIMIT_CPU counts the whole process, so the limit is relative to what was used so far
+                usage = resource.getrusage(resource.RUSAGE_SELF)
+                soft = int(usage.ru_utime + usage.ru_stime) + int(cpu_seconds) + 1
+                resource.setrlimit(resource.RLIMIT_CPU, (soft, resource.getrlimit(resource.RLIMIT_CPU)[1]))
+
+            start = time.perf_counter()
+            plt.close("all")
+            exec(code, {"df": df.copy(deep=False), "aggs": aggs, "plt": plt, "pd": pd, "np": np, "sns": sns})
+            if not plt.get_fignums():
+                raise PlotError("The generated code did not draw a figure")
+            fig = plt.gcf()
+            # Detached from pyplot, so unpickling it does not open a pyplot window
+            plt.close("all")
+            series = extract_series(fig)
+            try:
+                result = PlotResult(figure=pickle.dumps(fig, protocol=pickle.HIGHEST_PROTOCOL), series=series)
+            except Exception as e:
+                logger.info(f"Figure cannot be pickled ({e}); sending a static image")
+                Decimator(fig, series)
+                png = io.BytesIO()
+                fig.savefig(png, format="png", dpi=PLOT_DPI, bbox_inches="tight")
+                result = PlotResult(png=png.getvalue())
+            result.seconds = time.perf_counter() - start
+            conn.send(("ok", result))
+        except Exception as e:
+            message = str(e) if isinstance(e, PlotError) else traceback.format_exception_only(type(e), e)[-1].strip()
+            conn.send(("error", message))
+        finally:
+            plt.close("all")
+
+
+# ────────────── Main-process side ──────────────
+
+def _share_arrow(df: pd.DataFrame) -> Tuple[SharedMemory, int]:
+    # Arrow IPC stream written straight into shared memory, sized with a dry run
+    table = pa.Table.from_pandas(df)
+    sink = pa.MockOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    size = sink.size()
+    shm = SharedMemory(create=True, size=max(1, size))
+    with pa.ipc.new_stream(pa.FixedSizeBufferWriter(pa.py_buffer(shm.buf)), table.schema) as writer:
+        writer.write_table(table)
+    return shm, size
+
+
+class _Worker:
+    def __init__(self, context, memory_mb: int):
+        self.conn, child = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main, args=(child, memory_mb), name="dashgraph-plot-worker", daemon=True
+        )
+        self.process.start()
+        child.close()
+        self.ready = False
+
+    def wait_ready(self, timeout: float) -> None:
+        if self.ready:
+            return
+        if not self.conn.poll(timeout):
+            raise PlotError("Plot worker did not start in time")
+        self.conn.recv()
+        self.ready = True
+
+    def kill(self) -> None:
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join(timeout=5)
+        self.conn.close()
+
+
+class PlotWorkerPool:
+    """
+    Warm pool of plotting processes for LLM-generated code.
+
+    Workers run matplotlib on the Agg backend with pandas, numpy and seaborn
+    preloaded. The frame is handed over once through shared memory as an Arrow
+    IPC stream (pickled when pyarrow is missing or cannot convert it) and reused
+    by later requests for the same frame. Every run has a wall-clock timeout and
+    a CPU-time limit; a worker that exceeds them, crashes or is cancelled is
+    killed and replaced, and the caller gets a PlotError instead of a hung window.
+    Figures come back pickled with their large series split out, so the GUI can
+    show them on an interactive, decimating canvas.
+    """
+
+    def __init__(self, workers: int = DEFAULT_WORKERS, timeout: float = DEFAULT_TIMEOUT,
+                 cpu_seconds: float = DEFAULT_CPU_SECONDS, memory_mb: int = 0):
+        self.workers = max(1, workers)
+        self.timeout = timeout
+        self.cpu_seconds = cpu_seconds
+        self.memory_mb = memory_mb
+        methods = multiprocessing.get_all_start_methods()
+        # Never fork: the caller is a GUI process with live threads
+        self._context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+        self._idle: "queue.Queue[_Worker]" = queue.Queue()
+        self._all: List[_Worker] = []
+        self._lock = threading.Lock()
+        self._frame_ref: Optional[weakref.ref] = None
+        self._frame: Optional[Tuple[str, str, int, str]] = None
+        self._shm: Optional[SharedMemory] = None
+        self._frames = 0
+
+    def start(self) -> "PlotWorkerPool":
+        """
+        Spawn the workers ahead of the first request; they preload in the background.
+        """
+        with self._lock:
+            while len(self._all) < self.workers:
+                self._spawn()
+        return self
+
+    def _spawn(self) -> None:
+        # Callers hold self._lock
+        worker = _Worker(self._context, self.memory_mb)
+        self._all.append(worker)
+        self._idle.put(worker)
+
+    def _retire(self, worker: _Worker) -> None:
+        worker.kill()
+        with self._lock:
+            if worker in self._all:
+                self._all.remove(worker)
+
+    def _acquire(self) -> _Worker:
+        with self._lock:
+            if self._idle.empty() and len(self._all) < self.workers:
+                self._spawn()
+        return self._idle.get()
+
+    def _share(self, df: pd.DataFrame) -> Tuple[str, str, int, str]:
+        with self._lock:
+            if self._frame is not None and self._frame_ref is not None and self._frame_ref() is df:
+                return self._frame
+            shm = None
+            if pa is not None:
+                try:
+                    shm, size = _share_arrow(df)
+                    fmt = "arrow"
+                except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+                    pass  # object columns with mixed value types
+            if shm is None:
+                data = pickle.dumps(df, protocol=pickle.HIGHEST_PROTOCOL)
+                size, fmt = len(data), "pickle"
+                shm = SharedMemory(create=True, size=max(1, size))
+                shm.buf[:size] = data
+            self._release_frame()
+            self._frames += 1
+            self._shm = shm
+            self._frame = (f"{os.getpid()}-{self._frames}", shm.name, size, fmt)
+            self._frame_ref = weakref.ref(df)
+            return self._frame
+
+    def _release_frame(self) -> None:
+        # Workers keep their own mapping of the old block until they load the next one
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+        self._frame = self._frame_ref = None
+
+    def run(self, code: str, df: pd.DataFrame, timeout: Optional[float] = None,
+            cancelled: Callable[[], bool] = lambda: False,
+            aggs: Optional[Dict[str, pd.DataFrame]] = None) -> PlotResult:
+        """
+        Run plot code against `df` in a worker and return the figure it drew.
+        `aggs` (small pre-aggregated frames, see preagg) is sent along and visible to the code as `aggs`.
+        Blocks the calling thread; `cancelled` is polled while waiting.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        frame = self._share(df)
+        worker = self._acquire()
+        healthy = False
+        try:
+            worker.wait_ready(STARTUP_TIMEOUT)
+            worker.conn.send(("plot", code, frame, self.cpu_seconds, aggs or {}))
+            end = time.monotonic() + timeout
+            while not worker.conn.poll(0.05):
+                if cancelled():
+                    raise PlotCancelled("Plot cancelled")
+                if time.monotonic() > end:
+                    raise PlotError(f"Plot code took longer than {timeout:.0f}s and was stopped")
+                if not worker.process.is_alive():
+                    break
+            try:
+                status, *payload = worker.conn.recv()
+            except (EOFError, OSError):
+                worker.process.join(timeout=1)
+                exitcode = worker.process.exitcode
+                if exitcode is not None and -exitcode == getattr(signal, "SIGXCPU", None):
+                    raise PlotError(f"Plot code used more than {self.cpu_seconds:.0f}s of CPU and was stopped")
+                raise PlotError(f"Plot worker stopped unexpectedly (exit code {exitcode})")
+            healthy = True
+            if status == "error":
+                raise PlotError(payload[0])
+            result = payload[0]
+            logger.info(f"Plot built in {result.seconds:.2f}s by worker {worker.process.pid}")
+            return result
+        finally:
+            if healthy:
+                self._idle.put(worker)
+            else:
+                self._retire(worker)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            workers, self._all = self._all, []
+            self._idle = queue.Queue()
+            self._release_frame()
+        for worker in workers:
+            try:
+                worker.conn.send(None)
+            except (OSError, ValueError):
+                pass
+            worker.kill()
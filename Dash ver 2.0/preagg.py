@@ -0,0 +1,147 @@
+import threading
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from eda_stats import column_groups
+
+# Group columns with more distinct values than this are left to the generated code
+MAX_GROUPS = 50
+MAX_GROUP_COLUMNS = 8
+MAX_MEASURES = 12
+MAX_TIME_COLUMNS = 4
+# The finest calendar bucket that keeps a time series at or under this many points is used
+MAX_TIME_BUCKETS = 500
+
+# (name, pandas frequency, DuckDB date_trunc unit, approximate width in seconds).
+# Weeks start on Monday in both engines.
+TIME_BUCKETS = [
+    ("hour", "h", "hour", 3600.0),
+    ("day", "D", "day", 86400.0),
+    ("week", "W-MON", "week", 7 * 86400.0),
+    ("month", "MS", "month", 30.44 * 86400),
+    ("quarter", "QS", "quarter", 91.31 * 86400),
+    ("year", "YS", "year", 365.25 * 86400),
+]
+
+Rollups = Dict[str, pd.DataFrame]
+
+
+@dataclass
+class RollupPlan:
+    """
+    Which rollups to build: per-category tables for `groups`, time series for
+    `times` as (column, bucket name, pandas frequency, DuckDB unit), each with
+    the count of rows and the mean and sum of every column in `measures`.
+    """
+    groups: List[Any] = field(default_factory=list)
+    measures: List[Any] = field(default_factory=list)
+    times: List[Tuple[Any, str, str, str]] = field(default_factory=list)
+
+
+def time_bucket(start, end) -> Tuple[str, str, str]:
+    """
+    The finest bucket (name, pandas frequency, DuckDB unit) giving at most MAX_TIME_BUCKETS points between `start` and `end`.
+    """
+    seconds = (end - start).total_seconds()
+    for name, freq, unit, width in TIME_BUCKETS:
+        if seconds / width < MAX_TIME_BUCKETS:
+            return name, freq, unit
+    return TIME_BUCKETS[-1][:3]
+
+
+def rollup_candidates(dtypes: pd.Series) -> Tuple[List[Any], List[Any]]:
+    """
+    Columns that may become group keys (categorical, text and boolean) and the datetime columns, from dtypes alone.
+    """
+    groups = column_groups(dtypes)
+    return groups["categorical"] + groups["boolean"], groups["datetime"][:MAX_TIME_COLUMNS]
+
+
+def plan_rollups(dtypes: pd.Series, distinct: Dict[Any, int], ranges: Dict[Any, Tuple[Any, Any]],
+                 max_groups: int = MAX_GROUPS) -> RollupPlan:
+    """
+    Pick the rollups for a frame with `dtypes`, given the distinct count of
+    each group candidate and the (min, max) of each datetime column.
+    """
+    groups = column_groups(dtypes)
+    plan = RollupPlan(measures=groups["numerical"][:MAX_MEASURES])
+    order = {col: i for i, col in enumerate(dtypes.index)}
+    keys = [col for col, count in distinct.items() if 1 < count <= max_groups]
+    plan.groups = sorted(keys, key=order.get)[:MAX_GROUP_COLUMNS]
+    for col, (start, end) in ranges.items():
+        if pd.notna(start) and pd.notna(end) and end > start:
+            plan.times.append((col, *time_bucket(start, end)))
+    return plan
+
+
+def rollup_name(col: Any, bucket: Optional[str] = None) -> str:
+    return f"{col}_by_{bucket}" if bucket else f"by_{col}"
+
+
+def measure_columns(measures: List[Any]) -> List[str]:
+    return [f"{col}_{stat}" for col in measures for stat in ("mean", "sum")]
+
+
+def _rollup(grouped, measures: List[Any]) -> pd.DataFrame:
+    counts = grouped.size()
+    if not measures:
+        return counts.to_frame("count")
+    frame = grouped[measures].agg(["mean", "sum"])
+    frame.columns = measure_columns(measures)
+    frame.insert(0, "count", counts)
+    return frame
+
+
+def compute_rollups(df: pd.DataFrame, max_groups: int = MAX_GROUPS) -> Rollups:
+    """
+    Per-category counts, means and sums and calendar-bucketed series of `df`,
+    keyed by name (see rollup_name). Missing keys and empty buckets are left out.
+    """
+    candidates, datetimes = rollup_candidates(df.dtypes)
+    distinct = {col: df[col].nunique() for col in candidates}
+    ranges = {col: (df[col].min(), df[col].max()) for col in datetimes}
+    plan = plan_rollups(df.dtypes, distinct, ranges, max_groups)
+
+    rollups: Rollups = {}
+    for col in plan.groups:
+        rollups[rollup_name(col)] = _rollup(df.groupby(col, observed=True, sort=True), plan.measures)
+    for col, bucket, freq, _ in plan.times:
+        grouper = pd.Grouper(key=col, freq=freq, closed="left", label="left")
+        frame = _rollup(df.groupby(grouper), plan.measures)
+        rollups[rollup_name(col, bucket)] = frame[frame["count"] > 0]
+    return rollups
+
+
+def describe_rollups(rollups: Rollups) -> str:
+    """
+    One line per rollup with its index, columns, rows and size, for the graph prompt.
+    """
+    lines = []
+    for name, frame in rollups.items():
+        size_kb = max(1, round(frame.memory_usage(deep=True).sum() / 1024))
+        lines.append(
+            f"- aggs['{name}']: {len(frame)} rows, index '{frame.index.name}', "
+            f"columns {list(frame.columns)} ({size_kb} KB)"
+        )
+    return "\n".join(lines)
+
+
+_lock = threading.Lock()
+_latest: Optional[Tuple[weakref.ref, int, Rollups]] = None
+
+
+def rollups_for(df: pd.DataFrame, max_groups: int = MAX_GROUPS) -> Rollups:
+    """
+    The rollups of `df`, computed on first use and kept while `df` is the most
+    recently aggregated frame (a filter change or a new dataset replaces it).
+    """
+    global _latest
+    with _lock:
+        if _latest is not None and _latest[0]() is df and _latest[1] == max_groups:
+            return _latest[2]
+        rollups = compute_rollups(df, max_groups)
+        _latest = (weakref.ref(df), max_groups, rollups)
+        return rollups
@@ -0,0 +1,169 @@
+from collections import OrderedDict
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+
+class DataFrameModel(QAbstractTableModel):
+    """
+    Virtualized table model over a pandas DataFrame.
+
+    Cells are formatted only when the view asks for them, straight from each
+    column's backing array. The visible rows are an array of positions into the
+    frame, so filtering and sorting swap that array instead of copying data.
+    """
+
+    def __init__(self, df: Optional[pd.DataFrame] = None, parent=None):
+        super().__init__(parent)
+        self._frame = pd.DataFrame()
+        self._columns: List[Any] = []
+        self._rows = np.arange(0)
+        self._base_rows = self._rows
+        self._sort_column: Optional[int] = None
+        self._sort_order = Qt.AscendingOrder
+        if df is not None:
+            self.set_frame(df)
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        return self._frame
+
+    @property
+    def rows(self) -> np.ndarray:
+        """
+        Positions into `frame` of the rows currently shown, in display order.
+        """
+        return self._rows
+
+    def set_frame(self, df: pd.DataFrame) -> None:
+        """
+        Point the model at a new DataFrame and show all of its rows.
+        """
+        self.beginResetModel()
+        self._frame = df
+        # Keep extension arrays (categoricals, tz-aware datetimes) as-is so
+        # nothing is materialized into Python objects up front
+        self._columns = [
+            df.iloc[:, i].array if isinstance(df.dtypes.iloc[i], pd.api.extensions.ExtensionDtype)
+            else df.iloc[:, i].to_numpy()
+            for i in range(df.shape[1])
+        ]
+        self._base_rows = np.arange(len(df))
+        self._rows = self._base_rows
+        self._sort_column = None
+        self.endResetModel()
+
+    def set_rows(self, rows: Optional[np.ndarray] = None) -> None:
+        """
+        Show only the given row positions (all rows when None), keeping the active sort.
+        """
+        self.beginResetModel()
+        self._base_rows = np.arange(len(self._frame)) if rows is None else np.asarray(rows, dtype=np.intp)
+        self._rows = self._sorted(self._base_rows)
+        self.endResetModel()
+
+    def _sorted(self, rows: np.ndarray) -> np.ndarray:
+        if self._sort_column is None or len(rows) == 0:
+            return rows
+        keys = self._frame.iloc[rows, self._sort_column].reset_index(drop=True)
+        order = keys.sort_values(
+            ascending=self._sort_order == Qt.AscendingOrder, kind="stable", na_position="last"
+        ).index.to_numpy()
+        return rows[order]
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._columns)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.ToolTipRole):
+            return None
+        value = self._columns[index.column()][self._rows[index.row()]]
+        return str(value)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return str(self._frame.columns[section])
+        return str(self._frame.index[self._rows[section]])
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.AscendingOrder) -> None:
+        self.layoutAboutToBeChanged.emit()
+        self._sort_column = column if column >= 0 else None
+        self._sort_order = order
+        self._rows = self._sorted(self._base_rows)
+        self.layoutChanged.emit()
+
+
+class SQLTableModel(QAbstractTableModel):
+    """
+    Table model over a query backend (see backends.DuckDBBackend).
+
+    Only the row count is known up front; rows are fetched a page at a time as
+    the view scrolls to them, and the last few pages are kept. Filtering and
+    sorting change the query's WHERE and ORDER BY instead of any local data.
+    """
+
+    def __init__(self, backend, where: Optional[str] = None, parent=None, page_rows: int = 1_000, cache_pages: int = 8):
+        super().__init__(parent)
+        self.backend = backend
+        self.page_rows = page_rows
+        self.cache_pages = cache_pages
+        self._where = where
+        self._order: Optional[Tuple[Any, bool]] = None
+        self._pages: "OrderedDict[int, pd.DataFrame]" = OrderedDict()
+        self._count = backend.count(where)
+
+    def set_where(self, where: Optional[str]) -> None:
+        """
+        Show the rows matching `where` (all rows when None), keeping the active sort.
+        """
+        self.beginResetModel()
+        self._where = where
+        self._pages.clear()
+        self._count = self.backend.count(where)
+        self.endResetModel()
+
+    def _page(self, number: int) -> pd.DataFrame:
+        page = self._pages.get(number)
+        if page is None:
+            page = self.backend.page(number * self.page_rows, self.page_rows, self._where, self._order)
+            self._pages[number] = page
+            while len(self._pages) > self.cache_pages:
+                self._pages.popitem(last=False)
+        else:
+            self._pages.move_to_end(number)
+        return page
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._count
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.backend.columns)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.ToolTipRole):
+            return None
+        page = self._page(index.row() // self.page_rows)
+        offset = index.row() % self.page_rows
+        if offset >= len(page):
+            return None
+        return str(page.iat[offset, index.column()])
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return str(self.backend.columns[section])
+        return str(section)
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.AscendingOrder) -> None:
+        self.layoutAboutToBeChanged.emit()
+        self._order = None if column < 0 else (self.backend.columns[column], order == Qt.AscendingOrder)
+        self._pages.clear()
+        self.layoutChanged.emit()
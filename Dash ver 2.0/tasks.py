@@ -0,0 +1,171 @@
+import logging
+from typing import Any, Callable, Dict, List, Optional
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+logger = logging.getLogger(__name__)
+
+
+class TaskCancelled(Exception):
+    """Raised inside a task when it notices it has been cancelled."""
+
+
+class TaskSignals(QObject):
+    progress = pyqtSignal(float, str)
+    partial = pyqtSignal(str)
+    result = pyqtSignal(object)
+    error = pyqtSignal(str)
+    finished = pyqtSignal()
+
+
+class Task(QRunnable):
+    """
+    A unit of background work. The wrapped function is called as fn(task, *args, **kwargs)
+    and can use `task.report_progress`, `task.report_partial` and `task.check_cancelled` while it runs.
+    Signals are emitted from the worker thread and delivered on the GUI thread.
+    """
+
+    def __init__(self, key: str, fn: Callable[..., Any], *args, **kwargs):
+        super().__init__()
+        self.key = key
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = TaskSignals()
+        self._cancelled = False
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def cancel(self) -> None:
+        self._cancelled = True
+
+    def check_cancelled(self) -> None:
+        if self._cancelled:
+            raise TaskCancelled(self.key)
+
+    def report_progress(self, fraction: float, message: str = "") -> None:
+        """
+        Emit progress and act as a cancellation point.
+        """
+        self.check_cancelled()
+        self.signals.progress.emit(fraction, message)
+
+    def report_partial(self, text: str) -> None:
+        """
+        Emit a piece of an incremental result (e.g. streamed tokens); also a cancellation point.
+        """
+        self.check_cancelled()
+        self.signals.partial.emit(text)
+
+    def run(self) -> None:
+        try:
+            result = self.fn(self, *self.args, **self.kwargs)
+            if not self._cancelled:
+                self.signals.result.emit(result)
+        except TaskCancelled:
+            logger.info(f"Task '{self.key}' cancelled")
+        except Exception as e:
+            logger.exception(f"Task '{self.key}' failed")
+            if not self._cancelled:
+                self.signals.error.emit(str(e))
+        finally:
+            self.signals.finished.emit()
+
+
+class TaskRunner(QObject):
+    """
+    Runs Tasks on a QThreadPool, at most one per key.
+
+    Submitting a key that is already running either drops the new request
+    (policy "ignore", for repeated button clicks), cancels the running task
+    and starts the new one (policy "replace", where only the latest input matters)
+    or starts the new one after it (policy "queue", where every request counts).
+    """
+
+    busy_changed = pyqtSignal(bool)
+
+    def __init__(self, max_workers: Optional[int] = None, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        if max_workers:
+            self.pool.setMaxThreadCount(max_workers)
+        self._active: Dict[str, Task] = {}
+        self._queued: Dict[str, List[Task]] = {}
+
+    def is_running(self, key: str) -> bool:
+        return key in self._active
+
+    def submit(
+        self,
+        key: str,
+        fn: Callable[..., Any],
+        *args,
+        on_result: Optional[Callable[[Any], None]] = None,
+        on_error: Optional[Callable[[str], None]] = None,
+        on_progress: Optional[Callable[[float, str], None]] = None,
+        on_partial: Optional[Callable[[str], None]] = None,
+        policy: str = "ignore",
+        **kwargs,
+    ) -> Optional[Task]:
+        """
+        Start `fn` in the pool. Returns the Task, or None if it was coalesced away.
+        """
+        running = self._active.get(key)
+        if running is not None:
+            if policy == "ignore":
+                return None
+            if policy == "replace":
+                running.cancel()
+
+        task = Task(key, fn, *args, **kwargs)
+        if on_result:
+            task.signals.result.connect(on_result)
+        if on_error:
+            task.signals.error.connect(on_error)
+        if on_progress:
+            task.signals.progress.connect(on_progress)
+        if on_partial:
+            task.signals.partial.connect(on_partial)
+        task.signals.finished.connect(lambda: self._finished(task))
+
+        if running is not None and policy == "queue":
+            self._queued.setdefault(key, []).append(task)
+            return task
+        was_idle = not self._active
+        self._start(task)
+        if was_idle:
+            self.busy_changed.emit(True)
+        return task
+
+    def _start(self, task: Task) -> None:
+        self._active[task.key] = task
+        self.pool.start(task)
+
+    def _finished(self, task: Task) -> None:
+        if self._active.get(task.key) is not task:
+            return
+        del self._active[task.key]
+        # The result signal was delivered before this one, so queued tasks see its effects
+        queued = self._queued.get(task.key)
+        if queued:
+            self._start(queued.pop(0))
+            if not queued:
+                del self._queued[task.key]
+        elif not self._active:
+            self.busy_changed.emit(False)
+
+    def cancel(self, key: str) -> None:
+        self._queued.pop(key, None)
+        task = self._active.get(key)
+        if task is not None:
+            task.cancel()
+
+    def cancel_all(self) -> None:
+        self._queued.clear()
+        for task in list(self._active.values()):
+            task.cancel()
+
+    def wait(self, msecs: int = -1) -> bool:
+        return self.pool.waitForDone(msecs)
@@ -0,0 +1,41 @@
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import eda_stats
+from eda_stats import compute_column_stats
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(100_000, 24)).astype("float32"), columns=[f"c{i}" for i in range(24)])
+    df.loc[::7, "c3"] = np.nan
+    df["c5"] = rng.integers(0, 10, len(df))
+    return df
+
+
+def test_numeric_stats_match_pandas(frame):
+    stats = compute_column_stats(frame)
+    describe = frame.astype("float64").describe()
+    for col in frame.columns:
+        for field in ("count", "mean", "std", "min", "25%", "50%", "75%", "max"):
+            assert stats[col][field] == pytest.approx(describe.loc[field, col], rel=1e-9, abs=1e-12)
+        assert stats[col]["distinct"] == frame[col].nunique()
+        assert stats[col]["skew"] == pytest.approx(frame[col].astype("float64").skew(), rel=1e-6, abs=1e-9)
+
+
+def test_peak_memory_is_bounded_by_the_block(frame, monkeypatch):
+    rows = len(frame)
+    monkeypatch.setattr(eda_stats, "NUMERIC_BLOCK_CELLS", rows * 4)
+    block_bytes = rows * 4 * 8
+    tracemalloc.start()
+    try:
+        compute_column_stats(frame)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    # The block, its scratch copy, a missing-value mask and a few column-sized temporaries
+    assert peak <= 2.5 * block_bytes + 4 * rows * 8
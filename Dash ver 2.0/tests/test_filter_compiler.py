@@ -0,0 +1,27 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from filter_compiler import Predicate, compile_filter
+
+
+@pytest.fixture
+def frame():
+    values = np.array([7.0, 7.1, 7.1, 8.1, 8.1, 8.1, 0.538, 0.1, np.nan, 9.5], dtype="float32")
+    return pd.DataFrame({"Rating": values})
+
+
+@pytest.mark.parametrize("expr", [
+    "Rating == 8.1", "Rating == 0.538", "Rating >= 7.1", "Rating > 0.1", "Rating <= 8.1", "Rating < 7.1",
+    "Rating > 7.0 and Rating <= 8.1",
+])
+def test_float32_ranges_match_pandas(frame, expr):
+    compiled = compile_filter(expr, frame.dtypes)
+    assert compiled.root.strategy == "sorted-index"
+    expected = frame.eval(expr).to_numpy()
+    np.testing.assert_array_equal(compiled.evaluate(frame), expected)
+
+
+def test_predicate_is_abstract():
+    with pytest.raises(TypeError):
+        Predicate()
@@ -0,0 +1,51 @@
+import json
+import threading
+
+import pytest
+
+import instrumentation
+from instrumentation import export_speedscope, span
+
+
+@pytest.fixture
+def recording():
+    instrumentation.configure(True, history=1000)
+    yield
+    instrumentation.configure(False)
+
+
+def _check_balanced(events, frames):
+    stack = []
+    for event in events:
+        if event["type"] == "O":
+            stack.append(event["frame"])
+        else:
+            assert stack and stack[-1] == event["frame"], f"closes {frames[event['frame']]} out of order"
+            stack.pop()
+    assert not stack
+
+
+def test_speedscope_events_form_a_balanced_stack(recording, tmp_path):
+    def work():
+        for _ in range(20):
+            with span("outer"):
+                with span("middle"):
+                    with span("inner"):
+                        pass
+                with span("sibling"):
+                    pass
+
+    threads = [threading.Thread(target=work) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    work()
+
+    path = export_speedscope(str(tmp_path / "spans.json"))
+    with open(path, encoding="utf-8") as f:
+        document = json.load(f)
+    frames = [frame["name"] for frame in document["shared"]["frames"]]
+    assert len(document["profiles"]) == 3
+    for profile in document["profiles"]:
+        _check_balanced(profile["events"], frames)
@@ -0,0 +1,22 @@
+import pandas as pd
+import pytest
+
+from csv_stream import load_csv_streaming
+
+
+@pytest.mark.parametrize("true, false", [("TRUE", "FALSE"), ("True", "False"), ("true", "false")])
+def test_bool_text_with_missing_values(tmp_path, true, false):
+    path = tmp_path / "flags.csv"
+    path.write_text(f"id,flag\n1,{true}\n2,{false}\n3,\n4,{true}\n")
+    df = load_csv_streaming(str(path)).df
+    assert str(df["flag"].dtype) == "boolean"
+    assert df["flag"].tolist() == [True, False, pd.NA, True]
+
+
+def test_bool_text_with_other_values_stays_text(tmp_path):
+    path = tmp_path / "flags.csv"
+    rows = "".join(f"{i},{'True' if i % 2 else ''}\n" for i in range(20)) + "99,maybe\n"
+    path.write_text("id,flag\n" + rows)
+    df = load_csv_streaming(str(path), chunksize=10).df
+    assert not pd.api.types.is_bool_dtype(df["flag"].dtype)
+    assert "maybe" in set(df["flag"].dropna())
@@ -0,0 +1,200 @@
+import time
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+NA_VALUES = ["", " ", "NA", "NaN", "nan"]
+SAMPLE_ROWS = 10_000
+CATEGORY_MAX_UNIQUE = 30
+DATE_PATTERN = r"^\d{4}[-/]\d{1,2}[-/]\d{1,2}$"
+BOOL_TEXT = {"TRUE", "FALSE"}
+# read_csv already turns TRUE/FALSE into Python bools when a column also has NaNs
+BOOL_SAMPLE_VALUES = BOOL_TEXT | {True, False}
+
+
+@dataclass
+class TypePlan:
+    """
+    Per-column casting decisions inferred from a sample of the file.
+
+    `kinds` maps a column to one of "bool_text", "bool_numeric", "datetime"
+    or "category". Columns that are absent keep the dtype read_csv chose.
+    """
+    kinds: Dict[str, str] = field(default_factory=dict)
+    timings: Dict[str, float] = field(default_factory=dict)
+
+    def read_csv_kwargs(self) -> Dict[str, Any]:
+        """
+        Translate the plan into read_csv arguments so the casts happen while parsing.
+        TRUE/FALSE columns are parsed as categoricals and confirmed afterwards,
+        because a stray value outside the sample would make a "boolean" dtype fail.
+        """
+        dtype = {col: "category" for col, kind in self.kinds.items() if kind in ("category", "bool_text")}
+        parse_dates = [col for col, kind in self.kinds.items() if kind == "datetime"]
+        kwargs: Dict[str, Any] = {}
+        if dtype:
+            kwargs["dtype"] = dtype
+        if parse_dates:
+            kwargs["parse_dates"] = parse_dates
+        return kwargs
+
+
+def _is_text(series: pd.Series) -> bool:
+    return series.dtype == object or isinstance(series.dtype, pd.StringDtype)
+
+
+def is_likely_date(series: pd.Series) -> bool:
+    """
+    Heuristic to check if a column likely contains date strings.
+    Looks for common formats like YYYY-MM-DD or YYYY/MM/DD.
+    """
+    sample = series.dropna()
+    if sample.empty:
+        return False
+
+    sample = sample.astype(str).head(20)
+    return sample.str.match(DATE_PATTERN).mean() > 0.8
+
+
+def classify_column(series: pd.Series) -> Optional[str]:
+    """
+    Decide the target kind for one sampled column in a single look at its values.
+    """
+    non_null = series.dropna()
+    if non_null.empty:
+        return None
+
+    if _is_text(series):
+        uniques = pd.unique(non_null)
+        if set(uniques).issubset(BOOL_SAMPLE_VALUES):
+            return "bool_text"
+        if is_likely_date(non_null):
+            return "datetime"
+        if len(uniques) < CATEGORY_MAX_UNIQUE:
+            return "category"
+        return None
+
+    if pd.api.types.is_bool_dtype(series):
+        return None
+
+    if pd.api.types.is_numeric_dtype(series):
+        uniques = pd.unique(non_null)
+        if len(uniques) <= 2 and set(uniques).issubset({0, 1}):
+            return "bool_numeric"
+    return None
+
+
+def plan_from_sample(sample: pd.DataFrame) -> TypePlan:
+    """
+    Build a TypePlan from an already parsed sample of the data.
+    """
+    plan = TypePlan()
+    for col in sample.columns:
+        start = time.perf_counter()
+        try:
+            kind = classify_column(sample[col])
+        except Exception as e:
+            logging.warning(f"Type inference failed for '{col}': {e}")
+            kind = None
+        if kind:
+            plan.kinds[col] = kind
+        plan.timings[col] = time.perf_counter() - start
+    return plan
+
+
+def infer_csv_types(path: str, sample_rows: int = SAMPLE_ROWS) -> TypePlan:
+    """
+    Read a bounded sample of the CSV and decide per-column casts from it.
+    """
+    sample = pd.read_csv(path, nrows=sample_rows, na_values=NA_VALUES)
+    return plan_from_sample(sample)
+
+
+def _to_bool(series: pd.Series, is_true: pd.Series) -> pd.Series:
+    nulls = series.isna()
+    if not nulls.any():
+        return is_true.astype(bool)
+    result = is_true.astype("boolean")
+    result[nulls] = pd.NA
+    return result
+
+
+def confirm_column(series: pd.Series, kind: str) -> pd.Series:
+    """
+    Check a planned cast against the full column and finish or undo it.
+    Only columns the sample flagged are confirmed, so this stays off the common path.
+    """
+    if kind == "bool_text":
+        # The sample sees Python bools for True/False/TRUE/true alike, so compare without case
+        upper = series.cat.categories.astype(str).str.upper()
+        if set(upper).issubset(BOOL_TEXT):
+            is_true = np.isin(series.cat.codes.to_numpy(), np.flatnonzero(upper == "TRUE"))
+            return _to_bool(series, pd.Series(is_true, index=series.index))
+        return series.astype(series.cat.categories.dtype)
+
+    if kind == "bool_numeric":
+        non_null = series.dropna()
+        if non_null.isin([0, 1]).all():
+            return _to_bool(series, series == 1)
+        return series
+
+    if kind == "datetime":
+        if not pd.api.types.is_datetime64_any_dtype(series):
+            return pd.to_datetime(series, errors="coerce", utc=True)
+        if series.dt.tz is None:
+            return series.dt.tz_localize("UTC")
+        return series.dt.tz_convert("UTC")
+
+    if kind == "category":
+        if len(series.cat.categories) >= CATEGORY_MAX_UNIQUE:
+            return series.astype(series.cat.categories.dtype)
+        return series
+
+    return series
+
+
+def apply_plan(df: pd.DataFrame, plan: TypePlan) -> pd.DataFrame:
+    """
+    Confirm every planned cast on a parsed frame, timing each column.
+    """
+    for col, kind in plan.kinds.items():
+        if col not in df.columns:
+            continue
+        start = time.perf_counter()
+        try:
+            df[col] = confirm_column(df[col], kind)
+        except Exception as e:
+            logging.warning(f"Type confirmation failed for '{col}' ({kind}): {e}")
+        plan.timings[col] = plan.timings.get(col, 0.0) + time.perf_counter() - start
+    return df
+
+
+def type_report(df: pd.DataFrame, plan: TypePlan) -> List[Dict[str, Any]]:
+    """
+    Per-column summary of the chosen dtype and the time spent inferring it.
+    """
+    return [
+        {
+            "column": col,
+            "dtype": str(df[col].dtype),
+            "inferred": plan.kinds.get(col, "default"),
+            "seconds": round(plan.timings.get(col, 0.0), 6),
+        }
+        for col in df.columns
+    ]
+
+
+def read_csv_typed(path: str, sample_rows: int = SAMPLE_ROWS) -> Tuple[pd.DataFrame, List[Dict[str, Any]]]:
+    """
+    Load a CSV with dtypes inferred from a sample and applied during parsing.
+
+    Returns:
+        Tuple[pd.DataFrame, List[dict]]: The typed frame and the per-column type report.
+    """
+    plan = infer_csv_types(path, sample_rows)
+    df = pd.read_csv(path, na_values=NA_VALUES, **plan.read_csv_kwargs())
+    df = apply_plan(df, plan)
+    return df, type_report(df, plan)
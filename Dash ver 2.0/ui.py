@@ -1,19 +1,39 @@
 from PyQt5.QtWidgets import (
     QMainWindow, QPushButton, QFileDialog, QVBoxLayout, QLineEdit,
-    QTextEdit, QTableWidget, QTableWidgetItem, QStatusBar, QLabel,
-    QWidget, QSplitter, QSizePolicy, QHBoxLayout, QGridLayout
+    QTextEdit, QTableView, QStatusBar, QLabel,
+    QWidget, QSplitter, QSizePolicy, QHBoxLayout, QGridLayout, QCheckBox,
+    QTabWidget, QScrollArea
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
 import pandas as pd
-import matplotlib.pyplot as plt
-from gpt_handler import generate_code_from_prompt
-from helpers import load_csv_file, display_dataframe, apply_df_filter
-from PyQt5.QtGui import QIcon
+from helpers import display_dataframe
+from filter_engine import FilterEngine
+from filter_compiler import FilterError
+from csv_stream import load_csv_streaming
+from dataset_cache import DatasetCache
+from eda_cache import EDACache
+from tasks import TaskRunner
+from plot_workers import PlotWorkerPool
+import backends
+from backends import SQLFilterEngine
+from preagg import rollups_for
+from table_model import SQLTableModel
+from perf_panel import PerformancePanel
+import instrumentation
+from instrumentation import span
+from config import (
+    MEMORY_BUDGET_MB, LOAD_CHUNK_ROWS, DATASET_CACHE_DIR, DATASET_CACHE_MAX_MB, EDA_WORKERS,
+    EDA_BLOCK_ROWS, EDA_CACHE_MAX_MB, EDA_CACHE_MAX_AGE_DAYS, PLOT_WORKERS, PLOT_TIMEOUT_SECONDS, PLOT_CPU_SECONDS,
+    PLOT_MEMORY_MB, PERF_ENABLED, PERF_LOG, PERF_LOG_MAX_MB, PERF_PROFILE_DIR, PERF_HISTORY,
+    DATA_BACKEND, DUCKDB_THREADS, DUCKDB_MEMORY_MB, BACKEND_SAMPLE_ROWS, PREAGG_MAX_GROUPS
+)
+from PyQt5.QtGui import QIcon, QPixmap
 import os
-from eda import run_eda
 import webbrowser
 import logging
-import re
+
+# matplotlib, seaborn, the EDA modules and the LLM client are imported on first
+# use (see benchmarks/import_time.py), so the window shows without waiting for them
 
 # Logger setup
 logging.basicConfig(level=logging.INFO)
@@ -23,15 +43,32 @@ logger = logging.getLogger(__name__)
 class DashGraphApp(QMainWindow):
     def __init__(self):
         super().__init__()
-        self.df = pd.DataFrame()
         self.original_df = pd.DataFrame()
+        self.source_path = None
+        # Set when the data stays in DuckDB instead of original_df (DASH_DATA_BACKEND=duckdb or a Parquet file)
+        self.backend = None
+        # Report already opened while its GPT summary was still being written
+        self._opened_report = None
+        self.filters = FilterEngine(self.original_df)
         self.current_theme = "light"
+        self.dataset_cache = DatasetCache(DATASET_CACHE_DIR, DATASET_CACHE_MAX_MB)
+        self.eda_cache = EDACache("eda_reports", EDA_CACHE_MAX_MB, EDA_CACHE_MAX_AGE_DAYS)
+        self.tasks = TaskRunner(parent=self)
+        self.plot_pool = PlotWorkerPool(PLOT_WORKERS, PLOT_TIMEOUT_SECONDS, PLOT_CPU_SECONDS, PLOT_MEMORY_MB)
+        self.set_perf_recording(PERF_ENABLED)
         self.setWindowTitle("DashGraph")
         self.setGeometry(100, 100, 1700, 775)
         base_dir = os.path.dirname(os.path.abspath(__file__))
         icon_path = os.path.join(base_dir, "assets", "icon.ico")
         self.setWindowIcon(QIcon(icon_path))
         self.init_ui()
+        # Warm the plot workers once the window is up
+        QTimer.singleShot(0, self.plot_pool.start)
+
+    @property
+    def df(self) -> pd.DataFrame:
+        """The currently filtered rows, materialized on first use after a filter change."""
+        return self.filters.frame()
 
     def init_ui(self):
         main_layout = QVBoxLayout()
@@ -78,9 +115,20 @@ class DashGraphApp(QMainWindow):
         grid_layout.addWidget(self.filter_button, 1, 1)
         grid_layout.addWidget(self.reset_filter_button, 2, 1)
 
+        history_layout = QHBoxLayout()
+        self.undo_filter_button = QPushButton("↩️ Undo")
+        self.undo_filter_button.setToolTip("Undo the last filter change")
+        self.undo_filter_button.clicked.connect(self.undo_filter)
+        self.redo_filter_button = QPushButton("↪️ Redo")
+        self.redo_filter_button.setToolTip("Redo the last undone filter change")
+        self.redo_filter_button.clicked.connect(self.redo_filter)
+        history_layout.addWidget(self.undo_filter_button)
+        history_layout.addWidget(self.redo_filter_button)
+        grid_layout.addLayout(history_layout, 3, 0, 1, 2)
+
         graph_label = QLabel("Describe Graph:")
         graph_label.setStyleSheet("font-size: 16px; font-weight: bold;")
-        grid_layout.addWidget(graph_label, 3, 0, 1, 2)
+        grid_layout.addWidget(graph_label, 4, 0, 1, 2)
 
         self.nl_input = QTextEdit()
         self.nl_input.setPlaceholderText("e.g., show average age per country as a bar chart")
@@ -88,8 +136,15 @@ class DashGraphApp(QMainWindow):
         self.graph_button.clicked.connect(self.generate_graph)
         self.graph_button.setMinimumHeight(100)
 
-        grid_layout.addWidget(self.nl_input, 4, 0)
-        grid_layout.addWidget(self.graph_button, 4, 1)
+        grid_layout.addWidget(self.nl_input, 5, 0)
+        grid_layout.addWidget(self.graph_button, 5, 1)
+
+        self.code_preview = QTextEdit()
+        self.code_preview.setReadOnly(True)
+        self.code_preview.setPlaceholderText("Generated code appears here as it streams in")
+        self.code_preview.setStyleSheet("font-family: Consolas, monospace; font-size: 12px;")
+        self.code_preview.setMaximumHeight(160)
+        grid_layout.addWidget(self.code_preview, 6, 0, 1, 2)
 
         controls_layout.addLayout(grid_layout)
         controls_layout.addSpacing(15)
@@ -104,16 +159,48 @@ class DashGraphApp(QMainWindow):
         self.eda_button.clicked.connect(self.run_eda_summary)
         controls_layout.addWidget(self.eda_button)
 
+        self.eda_approximate_check = QCheckBox("≈ Approximate (stream whole file)")
+        self.eda_approximate_check.setToolTip(
+            "Profile the entire CSV in constant memory with sketches. Ignores filters."
+        )
+        controls_layout.addWidget(self.eda_approximate_check)
+
         controls_layout.addStretch()
         control_widget = QWidget()
         control_widget.setLayout(controls_layout)
 
-        self.table = QTableWidget()
+        self.table = QTableView()
         self.table.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.table.setSortingEnabled(True)
+
+        self.graph_view = QLabel("Generated graphs appear here")
+        self.graph_view.setAlignment(Qt.AlignCenter)
+        graph_scroll = QScrollArea()
+        graph_scroll.setWidget(self.graph_view)
+        graph_scroll.setWidgetResizable(True)
+        self.save_graph_button = QPushButton("💾 Save Graph")
+        self.save_graph_button.clicked.connect(self.save_last_plot)
+        self.save_graph_button.setEnabled(False)
+        self.graph_scroll = graph_scroll
+        self.graph_canvas = None
+        self.graph_toolbar = None
+        self.graph_figure = None
+        self.graph_layout = graph_layout = QVBoxLayout()
+        graph_layout.addWidget(graph_scroll)
+        graph_layout.addWidget(self.save_graph_button, alignment=Qt.AlignRight)
+        graph_widget = QWidget()
+        graph_widget.setLayout(graph_layout)
+
+        self.view_tabs = QTabWidget()
+        self.view_tabs.addTab(self.table, "📋 Data")
+        self.view_tabs.addTab(graph_widget, "📊 Graph")
+        self.perf_panel = PerformancePanel(PERF_HISTORY)
+        self.perf_panel.recording_changed.connect(self.set_perf_recording)
+        self.view_tabs.addTab(self.perf_panel, "⏱ Performance")
 
         splitter = QSplitter(Qt.Horizontal)
         splitter.addWidget(control_widget)
-        splitter.addWidget(self.table)
+        splitter.addWidget(self.view_tabs)
         splitter.setSizes([350, 900])
 
         main_layout.addWidget(splitter)
@@ -124,73 +211,321 @@ class DashGraphApp(QMainWindow):
 
         self.status = QStatusBar()
         self.setStatusBar(self.status)
+        self.cancel_button = QPushButton("✖ Cancel")
+        self.cancel_button.setToolTip("Cancel running background tasks")
+        self.cancel_button.clicked.connect(self.tasks.cancel_all)
+        self.cancel_button.setVisible(False)
+        self.status.addPermanentWidget(self.cancel_button)
+        self.tasks.busy_changed.connect(self.on_tasks_busy)
         self.load_theme("light")
+        self.update_filter_history_buttons()
 
     def load_csv(self):
-        path, _ = QFileDialog.getOpenFileName(self, "Open CSV", "", "CSV Files (*.csv)")
+        file_filter = "Data Files (*.csv *.parquet *.pq)" if backends.available() else "CSV Files (*.csv)"
+        path, _ = QFileDialog.getOpenFileName(self, "Open CSV", "", file_filter)
         if path:
-            try:
-                self.df = load_csv_file(path)
-                self.original_df = self.df.copy()
-
-                if self.df.empty or self.df.shape[1] == 0:
-                    self.status.showMessage("⚠️ Loaded dataset has no columns.", 5000)
-                    return
+            self.tasks.submit(
+                "load", self._load_dataset, path,
+                on_result=self.on_csv_loaded,
+                on_error=lambda e: self.status.showMessage(f"❌ Failed to load: {e}", 5000),
+                on_progress=self.show_progress,
+            )
+
+    def _load_dataset(self, task, path: str):
+        # Runs on a worker thread: no widget access here
+        with span("load", path=path) as stage:
+            path, data, source = self._read_dataset(task, path)
+            if source == "duckdb":
+                stage.set(rows=data.count(), columns=len(data.columns), source=source)
+            else:
+                stage.set(rows=len(data), columns=data.shape[1], source=source)
+        return path, data, source
+
+    def _read_dataset(self, task, path: str):
+        if DATA_BACKEND == "duckdb" or path.lower().endswith(backends.PARQUET_EXTENSIONS):
+            task.report_progress(0.0, "Opening with DuckDB...")
+            backend = backends.DuckDBBackend(path, DUCKDB_THREADS, DUCKDB_MEMORY_MB)
+            return path, backend, "duckdb"
+
+        cached = self.dataset_cache.get(path)
+        if cached is not None:
+            return path, cached, "cache"
+
+        result = load_csv_streaming(
+            path,
+            chunksize=LOAD_CHUNK_ROWS,
+            memory_budget_mb=MEMORY_BUDGET_MB,
+            progress=lambda fraction, rows: task.report_progress(fraction, f"Loading {rows:,} rows..."),
+        )
+        if result.truncated:
+            return path, result.df, "truncated"
+        if not result.df.empty:
+            self.dataset_cache.put(path, result.df)
+        return path, result.df, "parsed"
+
+    def on_csv_loaded(self, loaded):
+        path, df, source = loaded
+        self._close_backend()
+        if source == "duckdb":
+            self.on_backend_opened(path, df)
+            return
+        # Filters are masks over original_df, so no second copy of the data is kept
+        self.original_df = df
+        self.source_path = path
+        self.filters = FilterEngine(self.original_df)
+        self.update_filter_history_buttons()
+        # Only part of the file is in memory, so exact EDA would miss rows
+        self.eda_approximate_check.setChecked(source == "truncated")
+
+        if self.df.empty or self.df.shape[1] == 0:
+            self.status.showMessage("⚠️ Loaded dataset has no columns.", 5000)
+            return
 
-                display_dataframe(self.df, self.table)
-                self.status.showMessage(f"✅ Loaded: {path}", 5000)
-            except Exception as e:
-                logger.exception("CSV load failed")
-                self.status.showMessage(f"❌ Failed to load: {e}", 5000)
+        display_dataframe(self.df, self.table)
+        if source == "cache":
+            self.status.showMessage(f"✅ Loaded from cache: {path}", 5000)
+        elif source == "truncated":
+            self.status.showMessage(
+                f"⚠️ Memory budget reached, loaded first {len(self.df):,} rows: {path}", 8000
+            )
+        else:
+            self.status.showMessage(f"✅ Loaded: {path}", 5000)
+
+    def on_backend_opened(self, path: str, backend):
+        self.backend = backend
+        self.original_df = backend.schema
+        self.source_path = path
+        self.filters = SQLFilterEngine(backend, BACKEND_SAMPLE_ROWS)
+        self.update_filter_history_buttons()
+        self.eda_approximate_check.setChecked(False)
+        # Only the pages the table scrolls to are read
+        self.table.setModel(SQLTableModel(backend, parent=self.table))
+        self.status.showMessage(f"✅ Opened with DuckDB ({backend.count():,} rows): {path}", 5000)
+
+    def _close_backend(self):
+        if self.backend is not None:
+            # Queries still running on task threads use the connection
+            self.tasks.cancel_all()
+            self.tasks.wait(5000)
+            if isinstance(self.table.model(), SQLTableModel):
+                self.table.setModel(None)
+            self.backend.close()
+            self.backend = None
+
+    def show_progress(self, fraction: float, message: str):
+        self.status.showMessage(f"⏳ {message} {fraction:.0%}")
+
+    def on_tasks_busy(self, busy: bool):
+        self.cancel_button.setVisible(busy)
 
     def apply_filter(self):
+        expr = self.filter_input.toPlainText().strip()
         try:
-            expr = self.filter_input.toPlainText().strip()
-            query_cols = re.findall(r"\\b[a-zA-Z_][a-zA-Z0-9_]*\\b", expr)
-            for col in query_cols:
-                if col not in self.df.columns:
-                    self.status.showMessage(f"❌ Unknown column in filter: '{col}'", 5000)
-                    return
-
-            self.df = apply_df_filter(self.df, expr)
-            display_dataframe(self.df, self.table)
-            self.status.showMessage("✅ Filter applied", 3000)
-        except Exception as e:
-            logger.exception("Filter application failed")
-            self.status.showMessage(f"❌ Filter error: {e}", 5000)
+            compiled = self.filters.compile(expr)
+        except FilterError as e:
+            self.status.showMessage(f"❌ {e}", 5000)
+            return
+        logger.info(f"Filter plan for '{compiled.text}': {'; '.join(compiled.explain())}")
+
+        # Filters stack, so a quick second Apply runs after the first instead of
+        # replacing it. Only the mask is evaluated off-thread; the engine state
+        # changes on the GUI thread, in submission order.
+        filters = self.filters
+        self.tasks.submit(
+            "filter", self._evaluate_filter, filters, compiled,
+            on_result=self.on_filter_applied,
+            on_error=lambda e: self.status.showMessage(f"❌ Filter error: {e}", 5000),
+            policy="queue",
+        )
+
+    @staticmethod
+    def _evaluate_filter(task, filters: FilterEngine, compiled):
+        if isinstance(filters, SQLFilterEngine):
+            with span("filter", expression=compiled.text, backend="duckdb") as stage:
+                where = filters.mask_for(compiled)
+                # Counted here so the GUI thread finds the new row count cached
+                stage.set(matched=filters.backend.count(" AND ".join(filter(None, [filters.where(), where]))))
+            return filters, compiled, where
+        with span("filter", expression=compiled.text, rows=len(filters.base)) as stage:
+            mask = filters.mask_for(compiled)
+            stage.set(matched=int(mask.sum()))
+        return filters, compiled, mask
+
+    def on_filter_applied(self, evaluated):
+        filters, compiled, _ = evaluated
+        if filters is not self.filters:
+            return  # a new dataset was loaded meanwhile
+        self.filters.add(compiled)
+        self.refresh_filtered_view("✅ Filter applied")
+
+    def refresh_filtered_view(self, message: str):
+        if self.backend is not None:
+            self.table.model().set_where(self.filters.where())
+        else:
+            display_dataframe(self.original_df, self.table, self.filters.positions())
+        self.update_filter_history_buttons()
+        self.status.showMessage(
+            f"{message} ({len(self.filters.filters)} active, {self.filters.row_count():,} rows)", 3000
+        )
+
+    def update_filter_history_buttons(self):
+        self.undo_filter_button.setEnabled(self.filters.can_undo)
+        self.redo_filter_button.setEnabled(self.filters.can_redo)
 
     def reset_filter(self):
-        self.df = self.original_df.copy()
-        display_dataframe(self.df, self.table)
-        self.status.showMessage("🔄 Filters reset", 3000)
+        self.tasks.cancel("filter")
+        self.filters.clear()
+        self.refresh_filtered_view("🔄 Filters reset")
+
+    def undo_filter(self):
+        if self.filters.undo():
+            self.refresh_filtered_view("↩️ Filter change undone")
+
+    def redo_filter(self):
+        if self.filters.redo():
+            self.refresh_filtered_view("↪️ Filter change redone")
 
     def generate_graph(self):
         prompt = self.nl_input.toPlainText().strip()
         if not prompt:
             self.status.showMessage("⚠️ No prompt provided", 3000)
             return
+        self.status.showMessage("⏳ Asking GPT for plot code...")
+        self.code_preview.clear()
+        self.tasks.submit(
+            "graph",
+            self._generate_graph, prompt, self._plot_frame(), self._plot_rollups(),
+            on_partial=self.append_code_preview,
+            on_progress=self.show_progress,
+            on_result=self.show_generated_graph,
+            on_error=lambda e: self.status.showMessage(f"❌ Graph error: {e}", 5000),
+        )
+
+    def _plot_frame(self):
+        """
+        The filtered frame, or with a backend a loader for a sample of it, so the query runs on the task thread.
+        """
+        if self.backend is None:
+            return self.df
+        backend, where = self.backend, self.filters.where()
+        return lambda: backend.sample(BACKEND_SAMPLE_ROWS, where)
+
+    def _plot_rollups(self):
+        """
+        Loader for the pre-aggregated rollups (see preagg) of the filtered data,
+        from the frame or with a backend from every filtered row in DuckDB.
+        """
+        if not PREAGG_MAX_GROUPS:
+            return lambda: {}
+        if self.backend is None:
+            df = self.df
+            return lambda: rollups_for(df, PREAGG_MAX_GROUPS)
+        backend, where = self.backend, self.filters.where()
+        return lambda: backend.rollups(where, PREAGG_MAX_GROUPS)
+
+    def _generate_graph(self, task, prompt: str, df, rollups):
+        from gpt_handler import generate_code_from_prompt
+
+        if callable(df):
+            df = df()
+        with span("graph", rows=len(df)):
+            with span("graph.preagg") as stage:
+                aggs = rollups()
+                stage.set(tables=len(aggs))
+            with span("graph.llm"):
+                code = generate_code_from_prompt(prompt, df, on_token=task.report_partial, aggs=aggs)
+            task.report_progress(0.5, "Rendering graph...")
+            # Generated code runs in a sandboxed worker process, never in this one
+            with span("graph.render") as stage:
+                plot = self.plot_pool.run(code, df, cancelled=lambda: task.cancelled, aggs=aggs)
+                stage.set(worker_s=round(plot.seconds, 6))
+            # Unpickling and indexing a large figure's data is slow, so it happens here too
+            with span("graph.load_figure"):
+                figure = plot.load_figure() if plot.figure is not None else None
+        return code, plot.png, figure
+
+    def append_code_preview(self, text: str):
+        cursor = self.code_preview.textCursor()
+        cursor.movePosition(cursor.End)
+        cursor.insertText(text)
+        self.code_preview.setTextCursor(cursor)
+
+    def show_generated_graph(self, result):
+        code, png, figure = result
+        self.code_preview.setPlainText(code)
         try:
-            code = generate_code_from_prompt(prompt, self.df)
-            exec_globals = {"df": self.df, "plt": plt}
-            exec(code, exec_globals)
-            plt.savefig("last_generated_plot.png", bbox_inches="tight")
-            plt.show()
+            if figure is not None:
+                self.show_graph_figure(figure)
+                figure.savefig("last_generated_plot.png", bbox_inches="tight")
+            else:
+                self.show_graph_image(png)
+                with open("last_generated_plot.png", "wb") as f:
+                    f.write(png)
+            self.save_graph_button.setEnabled(True)
             self.status.showMessage("✅ Graph generated and saved", 3000)
         except Exception as e:
-            logger.exception("Graph generation failed")
+            logger.exception("Showing generated graph failed")
             self.status.showMessage(f"❌ Graph error: {e}", 5000)
+        self.view_tabs.setCurrentIndex(1)
+
+    def _clear_graph_canvas(self):
+        if self.graph_canvas is not None:
+            self.graph_figure.decimator.detach()
+            for widget in (self.graph_toolbar, self.graph_canvas):
+                self.graph_layout.removeWidget(widget)
+                widget.deleteLater()
+        self.graph_canvas = self.graph_toolbar = self.graph_figure = None
+
+    def show_graph_figure(self, figure):
+        """
+        Show a figure on an interactive canvas; large series are re-decimated as it is zoomed and panned.
+        """
+        from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg, NavigationToolbar2QT
+
+        self._clear_graph_canvas()
+        self.graph_figure = figure
+        self.graph_canvas = FigureCanvasQTAgg(figure)
+        self.graph_toolbar = NavigationToolbar2QT(self.graph_canvas, self)
+        self.graph_layout.insertWidget(0, self.graph_toolbar)
+        self.graph_layout.insertWidget(1, self.graph_canvas, 1)
+        self.graph_scroll.setVisible(False)
+        figure.decimator.refresh()
+        self.graph_canvas.draw_idle()
+
+    def show_graph_image(self, png: bytes):
+        self._clear_graph_canvas()
+        pixmap = QPixmap()
+        pixmap.loadFromData(png, "PNG")
+        self.graph_view.setPixmap(pixmap)
+        self.graph_scroll.setVisible(True)
 
     def save_last_plot(self):
         file_path, _ = QFileDialog.getSaveFileName(self, "Save Graph As", "", "PNG Image (*.png)")
         if file_path:
             try:
-                from shutil import copyfile
-                copyfile("last_generated_plot.png", file_path)
+                if self.graph_figure is not None:
+                    # The current zoom and pan, as shown
+                    self.graph_figure.savefig(file_path, bbox_inches="tight")
+                else:
+                    from shutil import copyfile
+                    copyfile("last_generated_plot.png", file_path)
                 self.status.showMessage(f"✅ Graph saved to {file_path}", 4000)
             except Exception as e:
                 logger.exception("Saving plot failed")
                 self.status.showMessage(f"❌ Save failed: {e}", 5000)
 
+    def set_perf_recording(self, enabled: bool):
+        instrumentation.configure(
+            enabled, log_path=PERF_LOG, log_max_mb=PERF_LOG_MAX_MB, profile_dir=PERF_PROFILE_DIR, history=PERF_HISTORY
+        )
+
+    def closeEvent(self, event):
+        self.perf_panel.detach()
+        self.tasks.cancel_all()
+        self.plot_pool.shutdown()
+        self._close_backend()
+        super().closeEvent(event)
+
     def toggle_theme(self):
         self.load_theme("dark" if self.current_theme == "light" else "light")
 
@@ -205,13 +540,93 @@ class DashGraphApp(QMainWindow):
             self.status.showMessage(f"❌ Theme file not found: {qss_path}", 5000)
 
     def run_eda_summary(self):
-        if self.df.empty:
+        if self.backend is not None:
+            self.tasks.submit(
+                "eda",
+                self._run_eda_sql, self.backend, self.filters.where(),
+                on_result=self.on_eda_finished,
+                on_error=lambda e: self.status.showMessage(f"❌ EDA error: {e}", 5000),
+                on_progress=self.show_progress,
+                on_partial=self.on_eda_report_written,
+            )
+            return
+        if self.eda_approximate_check.isChecked():
+            if not self.source_path:
+                self.status.showMessage("⚠️ No file loaded for approximate EDA", 4000)
+                return
+            self.tasks.submit(
+                "eda",
+                self._run_eda_approximate, self.source_path,
+                on_result=self.on_eda_finished,
+                on_error=lambda e: self.status.showMessage(f"❌ EDA error: {e}", 5000),
+                on_progress=self.show_progress,
+                on_partial=self.on_eda_report_written,
+            )
+            return
+        if self.original_df.empty or not self.filters.row_count():
             self.status.showMessage("⚠️ No data loaded for EDA", 4000)
             return
-        try:
-            report_path = run_eda(self.df)
-            self.status.showMessage(f"✅ EDA saved to {report_path}", 3000)
+        if self.filters.filters:
+            # Reuses per-block aggregates of original_df instead of rescanning the filtered rows
+            self.tasks.submit(
+                "eda",
+                self._run_eda_filtered, self.original_df, self.filters.mask(),
+                on_result=self.on_eda_finished,
+                on_error=lambda e: self.status.showMessage(f"❌ EDA error: {e}", 5000),
+                on_progress=self.show_progress,
+                on_partial=self.on_eda_report_written,
+            )
+            return
+        self.tasks.submit(
+            "eda",
+            self._run_eda, self.df,
+            on_result=self.on_eda_finished,
+            on_error=lambda e: self.status.showMessage(f"❌ EDA error: {e}", 5000),
+            on_progress=self.show_progress,
+            on_partial=self.on_eda_report_written,
+        )
+
+    def _run_eda(self, task, df: pd.DataFrame) -> str:
+        from eda import run_eda
+
+        with span("eda", rows=len(df), columns=df.shape[1]):
+            return run_eda(
+                df, progress=task.report_progress, workers=EDA_WORKERS, cache=self.eda_cache,
+                on_report=task.report_partial,
+            )
+
+    def _run_eda_filtered(self, task, base: pd.DataFrame, mask) -> str:
+        from eda import run_eda_filtered
+
+        with span("eda", rows=int(mask.sum()), columns=base.shape[1], filtered=True):
+            return run_eda_filtered(
+                base, mask, progress=task.report_progress, workers=EDA_WORKERS, cache=self.eda_cache,
+                block_rows=EDA_BLOCK_ROWS, on_report=task.report_partial,
+            )
+
+    def _run_eda_approximate(self, task, path: str) -> str:
+        from eda import run_eda_approximate
+
+        with span("eda", path=path, approximate=True):
+            return run_eda_approximate(
+                path, progress=task.report_progress, cache=self.eda_cache, on_report=task.report_partial
+            )
+
+    def _run_eda_sql(self, task, backend, where) -> str:
+        from eda import run_eda_sql
+
+        with span("eda", backend="duckdb"):
+            return run_eda_sql(
+                backend, where, progress=task.report_progress, cache=self.eda_cache, on_report=task.report_partial
+            )
+
+    def on_eda_report_written(self, report_path: str):
+        # The statistics are ready; the page fills in the GPT summary by itself
+        self._opened_report = report_path
+        self.status.showMessage(f"⏳ EDA report opened, waiting for the GPT summary: {report_path}")
+        webbrowser.open(f"file://{os.path.abspath(report_path)}")
+
+    def on_eda_finished(self, report_path: str):
+        self.status.showMessage(f"✅ EDA saved to {report_path}", 3000)
+        if self._opened_report != report_path:
             webbrowser.open(f"file://{os.path.abspath(report_path)}")
-        except Exception as e:
-            logger.exception("EDA generation failed")
-            self.status.showMessage(f"❌ EDA error: {e}", 5000)
\ No newline at end of file